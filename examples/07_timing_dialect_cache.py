@@ -0,0 +1,60 @@
+"""Performance testing on linting many small files.
+
+Each file linted gets its own config object, and each config object
+needs an expanded dialect. This compares the time to lint a directory
+of small files when expanded dialects are shared (the default), to when
+each config expands (and each copy of a config copies) its own dialect.
+"""
+
+import os
+import tempfile
+import timeit
+from unittest.mock import patch
+
+from sqlfluff.core import Linter
+from sqlfluff.core.dialects import load_raw_dialect
+from sqlfluff.core.dialects.base import Dialect
+
+dialect = "snowflake"
+num_files = 200
+sql = "SELECT a, b FROM tbl WHERE c = 1\n"
+
+
+def time_function(func, name, iterations=3):
+    """A basic timing function."""
+    # Do the timing
+    time = timeit.timeit(func, number=iterations) / iterations
+    # Output the result
+    print(
+        "{:<35} {:.6}s [{} iterations]".format(
+            f"Time to {name}:",
+            time,
+            iterations,
+        )
+    )
+    return time
+
+
+def uncached_dialect_selector(s):
+    """Load and expand a dialect, without using the cache."""
+    return load_raw_dialect(s).expand()
+
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    for idx in range(num_files):
+        with open(os.path.join(tmpdir, f"file_{idx}.sql"), "w") as f:
+            f.write(sql)
+    print(f"Linting {num_files} files with the {dialect} dialect.")
+
+    linter = Linter(dialect=dialect, rules=["LT01"])
+    with_cache = time_function(
+        lambda: linter.lint_paths((tmpdir,)), name="lint (shared dialect)"
+    )
+    # Restore the previous behaviour, where each config expands its own
+    # dialect, and copies of configs deep copy their dialect in full.
+    with patch("sqlfluff.core.dialects.dialect_selector", uncached_dialect_selector):
+        with patch.object(Dialect, "__deepcopy__", None):
+            without_cache = time_function(
+                lambda: linter.lint_paths((tmpdir,)), name="lint (dialect per file)"
+            )
+    print(f"Time saved by sharing dialects: {1 - with_cache / without_cache:.1%}")
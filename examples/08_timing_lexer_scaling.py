@@ -0,0 +1,62 @@
+"""Performance testing on lexing large files.
+
+The lexer works through the string by position rather than slicing off the
+remainder of the string after each match, so the time to lex a file should
+scale linearly with its size. This lexes files of increasing size, built by
+repeating the ansi dialect fixtures, and reports the time per character.
+It also compares the compiled lexer (enabled with the `compiled_lexer`
+config value), which combines the lexer matchers into fewer regexes.
+"""
+
+import glob
+import timeit
+
+from sqlfluff.core import FluffConfig, Lexer
+
+# Build a base chunk of SQL from the test fixtures.
+base_sql = "".join(
+    open(fname).read() + "\n;\n"
+    for fname in sorted(glob.glob("test/fixtures/dialects/ansi/*.sql"))
+)
+lexer = Lexer(dialect="ansi")
+compiled_lexer = Lexer(
+    config=FluffConfig(overrides={"dialect": "ansi", "compiled_lexer": True})
+)
+
+
+def time_function(func, name, size, iterations=3):
+    """A basic timing function."""
+    # Do the timing
+    time = timeit.timeit(func, number=iterations) / iterations
+    # Output the result
+    print(
+        "{:<35} {:.6}s ({:.3f}us per char) [{} iterations]".format(
+            f"Time to {name}:",
+            time,
+            time / size * 1e6,
+            iterations,
+        )
+    )
+
+
+for target_size in (100_000, 200_000, 400_000, 800_000):
+    sql = base_sql * (target_size // len(base_sql) + 1)
+    size = len(sql)
+    # Time just the matching of the string against the lexer matchers, and
+    # also the full lexing process (which also creates the segments).
+    time_function(
+        lambda: Lexer.lex_match_at(sql, 0, lexer.lexer_matchers),
+        name=f"match {size // 1000}KB",
+        size=size,
+    )
+    time_function(
+        lambda: compiled_lexer.compiled_lexer.match_at(sql, 0),
+        name=f"match {size // 1000}KB (compiled)",
+        size=size,
+    )
+    time_function(lambda: lexer.lex(sql), name=f"lex {size // 1000}KB", size=size)
+    time_function(
+        lambda: compiled_lexer.lex(sql),
+        name=f"lex {size // 1000}KB (compiled)",
+        size=size,
+    )
@@ -0,0 +1,50 @@
+"""Memory testing on lexed and parsed segments.
+
+Every token in a file becomes a RawSegment, each with its own PositionMarker,
+so the size of these objects dominates the memory used to hold a parsed file.
+This measures the memory allocated per token, first for the output of the
+lexer and then for a full parse tree (which also includes the parent
+segments), using `tracemalloc`.
+"""
+
+import gc
+import tracemalloc
+
+from sqlfluff.core import Lexer, Linter
+
+sql = (
+    "SELECT a.col_1, b.col_2 + 12 AS total\n"
+    "FROM tbl_a AS a JOIN tbl_b AS b ON a.id = b.id\n"
+    "WHERE a.x = 'y';\n"
+) * 300
+lexer = Lexer(dialect="ansi")
+linter = Linter(dialect="ansi")
+
+
+def measure_memory(func):
+    """Return the result of a function and the memory it retains."""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def report(name, size, tokens):
+    """Output the memory used per token."""
+    print(
+        "{:<35} {:.1f}KB ({:.1f} bytes per token) [{} tokens]".format(
+            f"Memory to {name}:",
+            size / 1024,
+            size / tokens,
+            tokens,
+        )
+    )
+
+
+(segments, _), size = measure_memory(lambda: lexer.lex(sql))
+report("lex", size, len(segments))
+parsed, size = measure_memory(lambda: linter.parse_string(sql))
+report("parse", size, len(parsed.tree.raw_segments))
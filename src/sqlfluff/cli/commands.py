@@ -20,7 +20,12 @@ from sqlfluff.cli import EXIT_ERROR, EXIT_FAIL, EXIT_SUCCESS
 from sqlfluff.cli.autocomplete import dialect_shell_complete, shell_completion_enabled
 from sqlfluff.cli.formatters import OutputStreamFormatter, format_linting_result_header
 from sqlfluff.cli.helpers import LazySequence, get_package_version
-from sqlfluff.cli.outputstream import OutputStream, make_output_stream
+from sqlfluff.cli.outputstream import (
+    OutputStream,
+    RecordWriter,
+    make_output_stream,
+    make_record_writer,
+)
 
 # Import from sqlfluff core.
 from sqlfluff.core import (
@@ -34,6 +39,7 @@ from sqlfluff.core import (
 )
 from sqlfluff.core.config import progress_bar_configuration
 from sqlfluff.core.linter import LintingResult
+from sqlfluff.core.linter.cache import LintCache
 from sqlfluff.core.plugin.host import get_plugin_manager
 from sqlfluff.core.types import Color, FormatType
 
@@ -437,6 +443,7 @@ def get_linter_and_formatter(
     cfg: FluffConfig,
     output_stream: Optional[OutputStream] = None,
     show_lint_violations: bool = False,
+    record_writer: Optional[RecordWriter] = None,
 ) -> tuple[Linter, OutputStreamFormatter]:
     """Get a linter object given a config."""
     try:
@@ -454,6 +461,7 @@ def get_linter_and_formatter(
         verbosity=cfg.get("verbose"),
         output_line_length=cfg.get("output_line_length"),
         show_lint_violations=show_lint_violations,
+        record_writer=record_writer,
     )
     return Linter(config=cfg, formatter=formatter), formatter
 
@@ -578,6 +586,15 @@ def dump_file_payload(filename: Optional[str], payload: str) -> None:
     is_flag=True,
     help="Perform the operation regardless of .sqlfluffignore configurations",
 )
+@click.option(
+    "--cache-dir",
+    default=None,
+    help=(
+        "Cache linting results in this directory, so that unchanged files "
+        "aren't linted again on subsequent runs. Overrides the `cache_dir` "
+        "config value."
+    ),
+)
 @click.argument("paths", nargs=-1, type=click.Path(allow_dash=True))
 def lint(
     paths: tuple[str],
@@ -618,9 +635,12 @@ def lint(
         extra_config_path, ignore_local_config, require_dialect=False, **kwargs
     )
     non_human_output = (format != FormatType.human.value) or (write_output is not None)
-    file_output = None
     output_stream = make_output_stream(config, format, write_output)
-    lnt, formatter = get_linter_and_formatter(config, output_stream)
+    # Serialised results are written as each file is linted.
+    record_writer = make_record_writer(format, write_output, annotation_level)
+    lnt, formatter = get_linter_and_formatter(
+        config, output_stream, record_writer=record_writer
+    )
 
     verbose = config.get("verbose")
     progress_bar_configuration.disable_progress_bar = disable_progress_bar
@@ -639,123 +659,40 @@ def lint(
     if verbose >= 1 and not non_human_output:
         click.echo(format_linting_result_header())
 
-    with PathAndUserErrorHandler(formatter):
-        # add stdin if specified via lone '-'
-        if ("-",) == paths:
-            if stdin_filename:
-                lnt.config = lnt.config.make_child_from_path(stdin_filename)
-            result = lnt.lint_string_wrapped(sys.stdin.read(), fname="stdin")
-        else:
-            result = lnt.lint_paths(
-                paths,
-                ignore_non_existent_files=False,
-                ignore_files=not disregard_sqlfluffignores,
-                processes=processes,
-                # If we're just linting in the CLI, we don't need to retain the
-                # raw file content. This allows us to reduce memory overhead.
-                retain_files=False,
-            )
+    try:
+        with PathAndUserErrorHandler(formatter):
+            # add stdin if specified via lone '-'
+            if ("-",) == paths:
+                if stdin_filename:
+                    lnt.config = lnt.config.make_child_from_path(stdin_filename)
+                result = lnt.lint_string_wrapped(sys.stdin.read(), fname="stdin")
+                if record_writer:
+                    for record in result.as_records():
+                        record_writer.write_record(record)
+            else:
+                result = lnt.lint_paths(
+                    paths,
+                    ignore_non_existent_files=False,
+                    ignore_files=not disregard_sqlfluffignores,
+                    processes=processes,
+                    # If we're just linting in the CLI, we don't need to retain
+                    # the raw file content. This allows us to reduce memory
+                    # overhead.
+                    retain_files=False,
+                    # The output is written as we go, so unless we need the
+                    # records for the timing output, don't keep them either.
+                    retain_records=bool(persist_timing),
+                )
+    finally:
+        # Finish any serialised output, even if linting failed part way, so
+        # that any output file is closed and complete.
+        if record_writer:
+            record_writer.close()
 
     # Output the final stats
     if verbose >= 1 and not non_human_output:
         click.echo(formatter.format_linting_stats(result, verbose=verbose))
 
-    if format == FormatType.json.value:
-        file_output = json.dumps(result.as_records())
-    elif format == FormatType.yaml.value:
-        file_output = yaml.dump(
-            result.as_records(),
-            sort_keys=False,
-            allow_unicode=True,
-        )
-    elif format == FormatType.none.value:
-        file_output = ""
-    elif format == FormatType.github_annotation.value:
-        if annotation_level == "error":
-            annotation_level = "failure"
-
-        github_result = []
-        for record in result.as_records():
-            filepath = record["filepath"]
-            for violation in record["violations"]:
-                # NOTE: The output format is designed for this GitHub action:
-                # https://github.com/yuzutech/annotations-action
-                # It is similar, but not identical, to the native GitHub format:
-                # https://docs.github.com/en/rest/reference/checks#annotations-items
-                github_result.append(
-                    {
-                        "file": filepath,
-                        "start_line": violation["start_line_no"],
-                        "start_column": violation["start_line_pos"],
-                        # NOTE: There should always be a start, there _may_ not be an
-                        # end, so in that case we default back to just reusing
-                        # the start.
-                        "end_line": violation.get(
-                            "end_line_no", violation["start_line_no"]
-                        ),
-                        "end_column": violation.get(
-                            "end_line_pos", violation["start_line_pos"]
-                        ),
-                        "title": "SQLFluff",
-                        "message": f"{violation['code']}: {violation['description']}",
-                        # The annotation_level is configurable, but will only apply
-                        # to any SQLFluff rules which have not been downgraded
-                        # to warnings using the `warnings` config value. Any which have
-                        # been set to warn rather than fail will always be given the
-                        # `notice` annotation level in the serialised result.
-                        "annotation_level": (
-                            annotation_level if not violation["warning"] else "notice"
-                        ),
-                    }
-                )
-        file_output = json.dumps(github_result)
-    elif format == FormatType.github_annotation_native.value:
-        if annotation_level == "failure":
-            annotation_level = "error"
-
-        github_result_native = []
-        for record in result.as_records():
-            filepath = record["filepath"]
-
-            # Add a group, titled with the filename
-            if record["violations"]:
-                github_result_native.append(f"::group::{filepath}")
-
-            for violation in record["violations"]:
-                # NOTE: The output format is designed for GitHub action:
-                # https://docs.github.com/en/actions/using-workflows/workflow-commands-for-github-actions#setting-a-notice-message
-
-                # The annotation_level is configurable, but will only apply
-                # to any SQLFluff rules which have not been downgraded
-                # to warnings using the `warnings` config value. Any which have
-                # been set to warn rather than fail will always be given the
-                # `notice` annotation level in the serialised result.
-                line = "::notice " if violation["warning"] else f"::{annotation_level} "
-
-                line += "title=SQLFluff,"
-                line += f"file={filepath},"
-                line += f"line={violation['start_line_no']},"
-                line += f"col={violation['start_line_pos']}"
-                if "end_line_no" in violation:
-                    line += f",endLine={violation['end_line_no']}"
-                if "end_line_pos" in violation:
-                    line += f",endColumn={violation['end_line_pos']}"
-                line += "::"
-                line += f"{violation['code']}: {violation['description']}"
-                if violation["name"]:
-                    line += f" [{violation['name']}]"
-
-                github_result_native.append(line)
-
-            # Close the group
-            if record["violations"]:
-                github_result_native.append("::endgroup::")
-
-        file_output = "\n".join(github_result_native)
-
-    if file_output:
-        dump_file_payload(write_output, file_output)
-
     if persist_timing:
         result.persist_timing_records(persist_timing)
 
@@ -910,19 +847,15 @@ def _paths_fix(
             # NOTE: This should enable us to limit the memory overhead of keeping
             # a large parsed project in memory unless necessary.
             retain_files=check,
+            # We only need the records if we're going to output them later.
+            retain_records=show_lint_violations or bool(persist_timing),
         )
 
     exit_code = _handle_unparsable(fix_even_unparsable, exit_code, result, formatter)
 
     # NB: We filter to linting violations here, because they're
     # the only ones which can be potentially fixed.
-    violation_records = result.as_records()
-    num_fixable = sum(
-        # Coerce to boolean so that we effectively count the ones which have fixes.
-        bool(v.get("fixes", []))
-        for rec in violation_records
-        for v in rec["violations"]
-    )
+    num_fixable = sum(p.num_fixable_lint_errors for p in result.paths)
 
     if num_fixable > 0:
         if check and formatter.verbosity >= 0:
@@ -1509,6 +1442,71 @@ def render(
             sys.exit(EXIT_SUCCESS)
 
 
+@cli.group()
+def cache() -> None:
+    """Manage the cache of linting results."""
+
+
+def _get_lint_cache(**kwargs) -> tuple[LintCache, OutputStreamFormatter]:
+    """Get the configured lint cache and a formatter, or exit if there isn't one."""
+    c = get_config(**kwargs, require_dialect=False)
+    _, formatter = get_linter_and_formatter(c)
+    lint_cache = LintCache.from_config(c)
+    if not lint_cache:
+        click.echo(
+            formatter.colorize(
+                "No cache directory configured. Set the `cache_dir` config value "
+                "or use the --cache-dir option.",
+                Color.red,
+            ),
+            err=True,
+        )
+        sys.exit(EXIT_ERROR)
+    return lint_cache, formatter
+
+
+def cache_options(f: Callable) -> Callable:
+    """Add cache options to commands via a decorator."""
+    f = click.option(
+        "--cache-dir",
+        default=None,
+        help="The cache directory to use. Defaults to the `cache_dir` config value.",
+    )(f)
+    return f
+
+
+@cache.command(name="clear")
+@common_options
+@cache_options
+def cache_clear(**kwargs) -> None:
+    """Remove all entries from the cache of linting results."""
+    lint_cache, formatter = _get_lint_cache(**kwargs)
+    removed = lint_cache.clear()
+    click.echo(f"Removed {removed} entries from {lint_cache.cache_dir}")
+
+
+@cache.command(name="stats")
+@common_options
+@cache_options
+def cache_stats(**kwargs) -> None:
+    """Show statistics about the cache of linting results."""
+    lint_cache, formatter = _get_lint_cache(**kwargs)
+    stats = lint_cache.stats()
+    click.echo(
+        formatter.cli_table(
+            [
+                ("cache dir", lint_cache.cache_dir),
+                ("entries", stats["entries"]),
+                ("size (bytes)", stats["bytes"]),
+                ("max entries", lint_cache.max_entries),
+            ],
+            cols=1,
+            col_width=60,
+            max_label_width=15,
+        )
+    )
+
+
 # This "__main__" handler allows invoking SQLFluff using "python -m", which
 # simplifies the use of cProfile, e.g.:
 # python -m cProfile -s cumtime -m sqlfluff.cli.commands lint slow_file.sql
@@ -15,9 +15,10 @@ from sqlfluff.cli.helpers import (
     pad_line,
     wrap_field,
 )
-from sqlfluff.cli.outputstream import OutputStream
+from sqlfluff.cli.outputstream import OutputStream, RecordWriter
 from sqlfluff.core import FluffConfig, Linter, SQLBaseError, TimingSummary
 from sqlfluff.core.linter import FormatterInterface, LintedFile, ParsedString
+from sqlfluff.core.linter.linted_dir import LintedDir
 from sqlfluff.core.types import Color
 
 
@@ -82,6 +83,8 @@ class OutputStreamFormatter(FormatterInterface):
         verbosity: Specifies how verbose output should be
         filter_empty: If True, empty messages will not be dispatched
         output_line_length: Maximum line length
+        record_writer: If provided, the serialised records of each linted
+            file are written to it as they're dispatched.
     """
 
     def __init__(
@@ -92,8 +95,10 @@ class OutputStreamFormatter(FormatterInterface):
         filter_empty: bool = True,
         output_line_length: int = 80,
         show_lint_violations: bool = False,
+        record_writer: Optional[RecordWriter] = None,
     ):
         self._output_stream = output_stream
+        self._record_writer = record_writer
         self.plain_output = self.should_produce_plain_output(nocolor)
         self.verbosity = verbosity
         self._filter_empty = filter_empty
@@ -275,6 +280,16 @@ class OutputStreamFormatter(FormatterInterface):
         )
         self._dispatch(s)
 
+    def dispatch_file_list(self, fnames: list[str]) -> None:
+        """Pass on the files to be linted, if we're outputting records."""
+        if self._record_writer:
+            self._record_writer.expect_files(fnames)
+
+    def dispatch_file_record(self, linted_file: LintedFile) -> None:
+        """Write the serialised record of a file, if we're outputting them."""
+        if self._record_writer:
+            self._record_writer.write_record(LintedDir.make_record(linted_file))
+
     def colorize(self, s: str, color: Optional[Color] = None) -> str:
         """Optionally use ANSI colour codes to colour a string."""
         return self.colorize_helper(self.plain_output, s, color)
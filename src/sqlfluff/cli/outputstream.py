@@ -1,15 +1,20 @@
 """Classes for managing linter output, used with OutputStreamFormatter."""
 
 import abc
+import json
 import os
-from typing import Any, Optional
+from typing import IO, TYPE_CHECKING, Any, Optional
 
 import click
+import yaml
 from tqdm import tqdm
 
 from sqlfluff.core import FluffConfig
 from sqlfluff.core.types import FormatType
 
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlfluff.core.linter.linted_dir import LintingRecord
+
 
 class OutputStream(abc.ABC):
     """Base class for linter output stream."""
@@ -75,3 +80,203 @@ def make_output_stream(
     else:
         # Discard human output as not required
         return FileOutput(config, os.devnull)
+
+
+class RecordWriter:
+    """Writes the serialised records of linted files as they arrive.
+
+    Rather than collecting all the results and serialising them at the end,
+    each file's record is written as soon as that file has been linted. That
+    means downstream tools can start consuming the output straight away, and
+    the records don't need to be held in memory.
+
+    The output is the same as serialising the whole list of records at once.
+    For `json` and `github-annotation` that's a JSON array, which is written
+    one element at a time. For `yaml` it's a sequence, with one item per
+    file. For `github-annotation-native` it's one line per violation.
+
+    The records are written in order of their file paths. If the files to
+    be linted are known in advance (see `expect_files()`), then each record
+    is written as soon as those which come before it have been. Files may
+    be linted in a different order (e.g. when using several processes), so
+    any which arrive early are held until then. Any records which are still
+    held (e.g. because a file was skipped) are written when closing.
+    """
+
+    def __init__(
+        self,
+        format: str,
+        output_path: Optional[str] = None,
+        annotation_level: str = "warning",
+    ) -> None:
+        self.format = format
+        self.output_path = output_path
+        self.annotation_level = annotation_level
+        self._file: Optional[IO[str]] = None
+        self._num_items = 0
+        # The paths of the files we're expecting records for, in order, and
+        # any records which have arrived before their turn.
+        self._expected: list[str] = []
+        self._next_expected = 0
+        self._held: dict[str, "LintingRecord"] = {}
+
+    def _write(self, payload: str) -> None:
+        if not self.output_path:
+            click.echo(payload, nl=False)
+            return
+        # NOTE: Only create the file once there's something to write.
+        if not self._file:
+            self._file = open(self.output_path, "w")
+        self._file.write(payload)
+        # Flush so that the output can be consumed as we go.
+        self._file.flush()
+
+    def _write_json_item(self, item: Any) -> None:
+        self._write(("[" if not self._num_items else ", ") + json.dumps(item))
+        self._num_items += 1
+
+    def expect_files(self, fnames: list[str]) -> None:
+        """Set the files which records are expected for."""
+        self._expected = sorted(set(fnames))
+        self._next_expected = 0
+
+    def write_record(self, record: "LintingRecord") -> None:
+        """Write the record of a single file, once those before it are written."""
+        if not self._expected:
+            self._write_record(record)
+            return
+        self._held[record["filepath"]] = record
+        while (
+            self._next_expected < len(self._expected)
+            and self._expected[self._next_expected] in self._held
+        ):
+            self._write_record(self._held.pop(self._expected[self._next_expected]))
+            self._next_expected += 1
+
+    def _write_record(self, record: "LintingRecord") -> None:
+        if self.format == FormatType.json.value:
+            self._write_json_item(record)
+        elif self.format == FormatType.yaml.value:
+            self._write(yaml.dump([record], sort_keys=False, allow_unicode=True))
+            self._num_items += 1
+        elif self.format == FormatType.github_annotation.value:
+            for annotation in self._github_annotations(record):
+                self._write_json_item(annotation)
+        elif self.format == FormatType.github_annotation_native.value:
+            for line in self._github_annotation_native_lines(record):
+                self._write(("\n" if self._num_items else "") + line)
+                self._num_items += 1
+
+    def close(self) -> None:
+        """Finish the output, closing any open structures."""
+        try:
+            for filepath in sorted(self._held):
+                self._write_record(self._held.pop(filepath))
+            if self.format in (
+                FormatType.json.value,
+                FormatType.github_annotation.value,
+            ):
+                self._write("]" if self._num_items else "[]")
+            elif self.format == FormatType.yaml.value and not self._num_items:
+                self._write(yaml.dump([]))
+        finally:
+            if self._file:
+                self._file.close()
+        if not self.output_path and (
+            self._num_items or self.format != FormatType.github_annotation_native.value
+        ):
+            # End any output on stdout with a newline.
+            click.echo("")
+
+    def _github_annotations(self, record: "LintingRecord") -> list[dict[str, Any]]:
+        """Make the annotations for a record, for the `github-annotation` format."""
+        annotation_level = self.annotation_level
+        if annotation_level == "error":
+            annotation_level = "failure"
+
+        annotations = []
+        for violation in record["violations"]:
+            # NOTE: The output format is designed for this GitHub action:
+            # https://github.com/yuzutech/annotations-action
+            # It is similar, but not identical, to the native GitHub format:
+            # https://docs.github.com/en/rest/reference/checks#annotations-items
+            annotations.append(
+                {
+                    "file": record["filepath"],
+                    "start_line": violation["start_line_no"],
+                    "start_column": violation["start_line_pos"],
+                    # NOTE: There should always be a start, there _may_ not be an
+                    # end, so in that case we default back to just reusing
+                    # the start.
+                    "end_line": violation.get(
+                        "end_line_no", violation["start_line_no"]
+                    ),
+                    "end_column": violation.get(
+                        "end_line_pos", violation["start_line_pos"]
+                    ),
+                    "title": "SQLFluff",
+                    "message": f"{violation['code']}: {violation['description']}",
+                    # The annotation_level is configurable, but will only apply
+                    # to any SQLFluff rules which have not been downgraded
+                    # to warnings using the `warnings` config value. Any which have
+                    # been set to warn rather than fail will always be given the
+                    # `notice` annotation level in the serialised result.
+                    "annotation_level": (
+                        annotation_level if not violation["warning"] else "notice"
+                    ),
+                }
+            )
+        return annotations
+
+    def _github_annotation_native_lines(self, record: "LintingRecord") -> list[str]:
+        """Make the lines for a record, for the `github-annotation-native` format."""
+        annotation_level = self.annotation_level
+        if annotation_level == "failure":
+            annotation_level = "error"
+
+        filepath = record["filepath"]
+        if not record["violations"]:
+            return []
+
+        # Add a group, titled with the filename
+        lines = [f"::group::{filepath}"]
+        for violation in record["violations"]:
+            # NOTE: The output format is designed for GitHub action:
+            # https://docs.github.com/en/actions/using-workflows/workflow-commands-for-github-actions#setting-a-notice-message
+
+            # The annotation_level is configurable, but will only apply
+            # to any SQLFluff rules which have not been downgraded
+            # to warnings using the `warnings` config value. Any which have
+            # been set to warn rather than fail will always be given the
+            # `notice` annotation level in the serialised result.
+            line = "::notice " if violation["warning"] else f"::{annotation_level} "
+
+            line += "title=SQLFluff,"
+            line += f"file={filepath},"
+            line += f"line={violation['start_line_no']},"
+            line += f"col={violation['start_line_pos']}"
+            if "end_line_no" in violation:
+                line += f",endLine={violation['end_line_no']}"
+            if "end_line_pos" in violation:
+                line += f",endColumn={violation['end_line_pos']}"
+            line += "::"
+            line += f"{violation['code']}: {violation['description']}"
+            if violation["name"]:
+                line += f" [{violation['name']}]"
+
+            lines.append(line)
+
+        # Close the group
+        lines.append("::endgroup::")
+        return lines
+
+
+def make_record_writer(
+    format: str,
+    output_path: Optional[str] = None,
+    annotation_level: str = "warning",
+) -> Optional[RecordWriter]:
+    """Create a RecordWriter for the format, if it's a serialised format."""
+    if format in (FormatType.human.value, FormatType.none.value):
+        return None
+    return RecordWriter(format, output_path, annotation_level)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from collections.abc import Iterable
 from copy import copy, deepcopy
@@ -507,6 +508,30 @@ class FluffConfig:
         # e.g. dialect_obj, which is generated on the fly.
         return dict_diff(self._configs, other._configs, ignore=["dialect_obj"])
 
+    def get_fingerprint(self) -> str:
+        """Return a stable hash of the resolved config values.
+
+        This is used to identify configs which would produce identical
+        results, for example when handing work to a child process or when
+        looking up cached results. The private values (e.g. the dialect and
+        templater objects) are derived from the public ones and so are not
+        included.
+
+        >>> a = FluffConfig(overrides={"dialect": "ansi"})
+        >>> b = FluffConfig(overrides={"dialect": "ansi"})
+        >>> a.get_fingerprint() == b.get_fingerprint()
+        True
+        >>> b.set_value(["max_line_length"], 120)
+        >>> a.get_fingerprint() == b.get_fingerprint()
+        False
+        """
+        records = sorted(
+            (key, repr(value))
+            for key, value in iter_records_from_nested_dict(self._configs)
+            if key[-1] not in self.private_vals
+        )
+        return hashlib.sha256(repr(records).encode("utf-8")).hexdigest()
+
     def get(
         self, val: str, section: Union[str, Iterable[str]] = "core", default: Any = None
     ) -> Any:
@@ -96,12 +96,26 @@ def dialect_readout() -> Iterator[DialectTuple]:
         )
 
 
+# A cache of expanded dialects, by label. Expanding a dialect makes a full
+# copy of its library, which is expensive for the larger dialects and would
+# otherwise happen for every config object created (i.e. for every file).
+# Expanded dialects are treated as immutable, so can be safely shared.
+_expanded_dialect_cache: dict[str, Dialect] = {}
+
+
 def dialect_selector(s: str) -> Dialect:
-    """Return a dialect given its name."""
-    dialect = load_raw_dialect(s)
-    # Expand any callable references at this point.
-    # NOTE: The result of .expand() is a new class.
-    return dialect.expand()
+    """Return a dialect given its name.
+
+    The expanded dialect is cached, so that repeated calls for the same
+    dialect (within the same process) return the same object.
+    """
+    dialect = _expanded_dialect_cache.get(s)
+    if dialect is None:
+        # Expand any callable references at this point.
+        # NOTE: The result of .expand() is a new class.
+        dialect = load_raw_dialect(s).expand()
+        _expanded_dialect_cache[s] = dialect
+    return dialect
 
 
 __all__ = [
@@ -1,6 +1,7 @@
 """Defines the base dialect class."""
 
 import sys
+from copy import deepcopy
 from typing import Any, Optional, Union, cast
 
 from sqlfluff.core.parser import (
@@ -50,6 +51,24 @@ class Dialect:
     def __repr__(self) -> str:  # pragma: no cover
         return f"<Dialect: {self.name}>"
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Dialect":
+        """Deep copy the dialect.
+
+        Expanded dialects are treated as immutable (and are shared between
+        configs by `dialect_selector`), so copying them just returns the same
+        object. This makes copying a config object with an expanded dialect
+        much cheaper. Unexpanded dialects are copied as normal.
+        """
+        if self.expanded:
+            return self
+        # Copy all the attributes as normal, without recursing back into
+        # this method.
+        new_dialect = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new_dialect
+        for key, value in self.__dict__.items():
+            setattr(new_dialect, key, deepcopy(value, memo))
+        return new_dialect
+
     def expand(self) -> "Dialect":
         """Expand any callable references to concrete ones.
 
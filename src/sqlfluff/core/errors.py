@@ -11,7 +11,7 @@ tracking.
 https://stackoverflow.com/questions/49715881/how-to-pickle-inherited-exceptions
 """
 
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union, cast
 
 if TYPE_CHECKING:  # pragma: no cover
     from sqlfluff.core.parser import BaseSegment, PositionMarker
@@ -257,6 +257,9 @@ class SQLLintError(SQLBaseError):
             for the failure in parsing. This is likely to be a subclass of
             `BaseSegment` rather than the parent class itself. This is mostly
             used for logging and for referencing position.
+        fix_factory (:obj:`callable`, optional): A function to build the
+            fixes, if they've been deferred (see `LintResult`). It's only
+            called when the fixes are first needed.
 
     """
 
@@ -271,10 +274,12 @@ class SQLLintError(SQLBaseError):
         ignore: bool = False,
         fatal: bool = False,
         warning: Optional[bool] = None,
+        fix_factory: Optional[Callable[[], list["LintFix"]]] = None,
     ) -> None:
         self.segment = segment
         self.rule = rule
         self.fixes = fixes or []
+        self._fix_factory = fix_factory
         super().__init__(
             description=description,
             pos=segment.pos_marker if segment else None,
@@ -297,6 +302,24 @@ class SQLLintError(SQLBaseError):
             self.warning,
         )
 
+    @property
+    def fixes(self) -> list["LintFix"]:
+        """The fixes for this error, building them first if deferred."""
+        if self._fix_factory:
+            self._fixes = self._fix_factory()
+            self._fix_factory = None
+        return self._fixes
+
+    @fixes.setter
+    def fixes(self, fixes: list["LintFix"]) -> None:
+        self._fixes = fixes
+        self._fix_factory = None
+
+    @property
+    def fixes_deferred(self) -> bool:
+        """Are the fixes for this error still to be built?"""
+        return self._fix_factory is not None
+
     def to_dict(self) -> SerializedObject:
         """Return a dict of properties.
 
@@ -333,8 +356,12 @@ class SQLLintError(SQLBaseError):
 
     @property
     def fixable(self) -> bool:
-        """Should this error be considered fixable?"""
-        if self.fixes:
+        """Should this error be considered fixable?
+
+        Deferred fixes aren't built to check this, because a fix factory
+        is only given if there are fixes.
+        """
+        if self._fix_factory or self._fixes:
             return True
         return False
 
@@ -44,6 +44,22 @@ class FormatterInterface(ABC):
         """Dispatch any violations found in a file."""
         ...
 
+    def dispatch_file_list(self, fnames: list[str]) -> None:
+        """Dispatch the list of files which are about to be linted.
+
+        This does nothing by default, it's only needed by formatters which
+        stream serialised output (to write the records in a stable order).
+        """
+        return None
+
+    def dispatch_file_record(self, linted_file: "LintedFile") -> None:
+        """Dispatch the serialised record of a file, once it's been linted.
+
+        This does nothing by default, it's only needed by formatters which
+        stream serialised output.
+        """
+        return None
+
     @abstractmethod
     def dispatch_dialect_warning(self, dialect: str) -> None:
         """Dispatch a warning for dialects."""
@@ -0,0 +1,365 @@
+"""Defines the LintCache class.
+
+This is an opt-in, persistent, on-disk cache of linting results. Entries
+are keyed on everything which determines the result of linting a file, so
+that unchanged files don't need to be templated, parsed or linted again.
+
+The cache only stores what is required to reproduce the *output* of linting
+(violations, noqa directives and statistics) and not the parse tree, which
+means it's only appropriate for linting and not for fixing.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from importlib import metadata
+from typing import Any, Optional
+
+from sqlfluff.core.config import FluffConfig
+from sqlfluff.core.errors import (
+    SQLBaseError,
+    SQLLexError,
+    SQLLintError,
+    SQLParseError,
+    SQLTemplaterError,
+    SQLUnusedNoQaWarning,
+)
+from sqlfluff.core.linter.linted_file import FileTimings, LintedFile
+from sqlfluff.core.rules import RulePack
+from sqlfluff.core.rules.noqa import IgnoreMask, NoQaDirective
+
+# Instantiate the linter logger
+linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
+
+# Bump this if the structure of the cache entries changes.
+CACHE_FORMAT_VERSION = 1
+
+
+class _CachedViolation(SQLBaseError):
+    """Behaviour shared by all violations replayed from the lint cache.
+
+    These behave like the violations they were created from, but without
+    references to the parse tree or the rule instances, which aren't stored.
+    """
+
+    def __init__(self, entry: dict[str, Any]) -> None:
+        self._entry = entry
+        # These are set here for compatibility with the lint and parse
+        # errors which we replay. The originals aren't stored in the cache.
+        self.segment: Any = None
+        self.rule: Any = None
+        self.fixes: list[Any] = []
+        SQLBaseError.__init__(
+            self,
+            description=entry["description"],
+            line_no=entry["line_no"],
+            line_pos=entry["line_pos"],
+            ignore=entry["ignore"],
+            fatal=entry["fatal"],
+            warning=entry["warning"],
+        )
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        """Prepare the cached violation for pickling."""
+        return _violation_from_entry, (self._entry,)
+
+    @property
+    def fixable(self) -> bool:
+        """Was this error fixable when it was originally linted?"""
+        return bool(self._entry["fixable"])
+
+    def rule_code(self) -> str:
+        """Fetch the code of the rule which cause this error."""
+        return str(self._entry["code"])
+
+    def rule_name(self) -> str:
+        """Fetch the name of the rule which cause this error."""
+        return str(self._entry["name"])
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dict of properties of the original violation."""
+        # NOTE: Copy it, so that any changes to the output don't affect us.
+        return json.loads(json.dumps(self._entry["record"]))
+
+
+class CachedLintError(_CachedViolation, SQLLintError):
+    """A linting error replayed from the lint cache."""
+
+    def __repr__(self) -> str:
+        return "<CachedLintError: rule {} pos:{!r}, description: {}>".format(
+            self.rule_code(),
+            (self.line_no, self.line_pos),
+            self.description,
+        )
+
+
+class CachedParseError(_CachedViolation, SQLParseError):
+    """A parsing error replayed from the lint cache."""
+
+
+class CachedTemplaterError(_CachedViolation, SQLTemplaterError):
+    """A templating error replayed from the lint cache."""
+
+
+class CachedLexError(_CachedViolation, SQLLexError):
+    """A lexing error replayed from the lint cache."""
+
+
+class CachedUnusedNoQaWarning(_CachedViolation, SQLUnusedNoQaWarning):
+    """An unused noqa warning replayed from the lint cache."""
+
+
+# The violation types which we know how to replay, along with the classes we
+# use to replay them. The index within this tuple is stored in the cache.
+_CACHEABLE_VIOLATION_TYPES: tuple[tuple[type[SQLBaseError], type[Any]], ...] = (
+    (SQLLintError, CachedLintError),
+    (SQLParseError, CachedParseError),
+    (SQLTemplaterError, CachedTemplaterError),
+    (SQLLexError, CachedLexError),
+    (SQLUnusedNoQaWarning, CachedUnusedNoQaWarning),
+)
+
+
+def _violation_to_entry(violation: SQLBaseError) -> Optional[dict[str, Any]]:
+    """Serialise a violation for the cache.
+
+    Returns None if the violation isn't of a type we know how to replay.
+    """
+    for idx, error_types in enumerate(_CACHEABLE_VIOLATION_TYPES):
+        # Only match on the exact types (or our cached versions of them) so
+        # that we don't silently lose the behaviour of any custom subclasses.
+        if type(violation) in error_types:
+            return {
+                "type": idx,
+                "description": violation.desc(),
+                "line_no": violation.line_no,
+                "line_pos": violation.line_pos,
+                "ignore": violation.ignore,
+                "fatal": violation.fatal,
+                "warning": violation.warning,
+                "fixable": violation.fixable,
+                "code": violation.rule_code(),
+                "name": violation.rule_name(),
+                "record": violation.to_dict(),
+            }
+    return None
+
+
+def _violation_from_entry(entry: dict[str, Any]) -> SQLBaseError:
+    """Rehydrate a violation from the cache."""
+    _, cached_type = _CACHEABLE_VIOLATION_TYPES[entry["type"]]
+    violation: SQLBaseError = cached_type(entry)
+    return violation
+
+
+class LintCache:
+    """A persistent on-disk cache of linting results.
+
+    Each entry is stored as a json file within the cache directory, keyed
+    on a hash of the file path, the source content, the fingerprint of the
+    resolved config for that file, the enabled rules and the version of
+    sqlfluff.
+
+    .. note::
+       The content of any *other* files used during templating (for example
+       jinja macros or dbt models) is not part of the key. If those change,
+       then the cache should be cleared.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: int = 0) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._version = metadata.version("sqlfluff")
+
+    @classmethod
+    def from_config(cls, config: FluffConfig) -> Optional["LintCache"]:
+        """Get the configured cache, or None if caching isn't enabled."""
+        cache_dir = config.get("cache_dir")
+        if not cache_dir:
+            return None
+        return cls(
+            cache_dir=str(cache_dir),
+            max_entries=config.get("cache_max_entries", default=0) or 0,
+        )
+
+    def make_key(
+        self, fname: str, source_str: str, config: FluffConfig, rule_pack: RulePack
+    ) -> str:
+        """Generate the cache key for a file."""
+        key_elements = [
+            CACHE_FORMAT_VERSION,
+            self._version,
+            fname,
+            hashlib.sha256(source_str.encode("utf-8")).hexdigest(),
+            config.get_fingerprint(),
+            sorted(rule_pack.codes()),
+        ]
+        return hashlib.sha256(json.dumps(key_elements).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _iter_entry_paths(self) -> Iterator[str]:
+        if not os.path.isdir(self.cache_dir):
+            return
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if filename.endswith(".json"):
+                    yield os.path.join(dirpath, filename)
+
+    def get(self, key: str, fname: str, encoding: str) -> Optional[LintedFile]:
+        """Fetch a cached result as a LintedFile, or None if not cached."""
+        t0 = time.monotonic()
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                payload = json.load(cache_file)
+            violations = [_violation_from_entry(v) for v in payload["violations"]]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            # A corrupt or unreadable entry is just treated as a miss.
+            linter_logger.info("Unable to read lint cache entry %s", path)
+            return None
+
+        # Touch the entry, so that eviction removes the least recently used.
+        try:
+            os.utime(path)
+        except OSError:  # pragma: no cover
+            pass
+
+        ignore_mask = None
+        if payload["ignore_mask"] is not None:
+            ignore_mask = IgnoreMask(
+                [
+                    NoQaDirective(
+                        line_no=d["line_no"],
+                        line_pos=d["line_pos"],
+                        rules=tuple(d["rules"]) if d["rules"] is not None else None,
+                        action=d["action"],
+                        raw_str=d["raw_str"],
+                    )
+                    for d in payload["ignore_mask"]
+                ]
+            )
+
+        linter_logger.info("Lint cache hit for %s", fname)
+        return LintedFile(
+            fname,
+            violations,
+            FileTimings({"cache": time.monotonic() - t0}, []),
+            None,
+            ignore_mask=ignore_mask,
+            templated_file=None,
+            encoding=encoding,
+            statistics=payload["statistics"],
+        )
+
+    def put(self, key: str, linted_file: LintedFile) -> bool:
+        """Store the result of linting a file in the cache.
+
+        Returns True if the result was stored. Results with fatal errors,
+        or with violations which we don't know how to replay, aren't stored.
+        """
+        violations = []
+        for violation in linted_file.violations:
+            entry = _violation_to_entry(violation)
+            if entry is None or violation.fatal:
+                linter_logger.info(
+                    "Not caching result for %s due to %r", linted_file.path, violation
+                )
+                return False
+            violations.append(entry)
+
+        ignore_mask = None
+        if linted_file.ignore_mask is not None:
+            ignore_mask = [
+                {
+                    "line_no": directive.line_no,
+                    "line_pos": directive.line_pos,
+                    "rules": directive.rules,
+                    "action": directive.action,
+                    "raw_str": directive.raw_str,
+                }
+                for directive in linted_file.ignore_mask._ignore_list
+            ]
+
+        payload = {
+            "violations": violations,
+            "ignore_mask": ignore_mask,
+            "statistics": linted_file.get_statistics(),
+        }
+
+        path = self._entry_path(key)
+        try:
+            self._ensure_cache_dir()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file and then move it into place, so that
+            # concurrent readers (e.g. other processes) never see a partial
+            # entry.
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(payload, tmp_file)
+            os.replace(tmp_path, path)
+        except OSError as err:  # pragma: no cover
+            linter_logger.warning("Unable to write to lint cache %s: %s", path, err)
+            return False
+        return True
+
+    def _ensure_cache_dir(self) -> None:
+        """Create the cache directory, ignored by git, if it doesn't exist."""
+        if os.path.isdir(self.cache_dir):
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(os.path.join(self.cache_dir, ".gitignore"), "w") as gitignore:
+            gitignore.write("# Created by sqlfluff automatically.\n*\n")
+
+    def evict(self) -> int:
+        """Remove the least recently used entries beyond `max_entries`.
+
+        Returns the number of entries removed.
+        """
+        if self.max_entries <= 0:
+            return 0
+        entries = []
+        for path in self._iter_entry_paths():
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:  # pragma: no cover
+                continue
+        if len(entries) <= self.max_entries:
+            return 0
+        entries.sort()
+        removed = 0
+        for _, path in entries[: len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:  # pragma: no cover
+                continue
+        linter_logger.info("Evicted %s entries from the lint cache.", removed)
+        return removed
+
+    def clear(self) -> int:
+        """Remove all entries from the cache.
+
+        Returns the number of entries removed.
+        """
+        removed = 0
+        for path in list(self._iter_entry_paths()):
+            os.remove(path)
+            removed += 1
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of entries and the total size of the cache."""
+        entries = 0
+        total_bytes = 0
+        for path in self._iter_entry_paths():
+            entries += 1
+            total_bytes += os.path.getsize(path)
+        return {"entries": entries, "bytes": total_bytes}
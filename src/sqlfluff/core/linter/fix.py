@@ -1,11 +1,13 @@
 """Helper classes & methods for applying fixes to segments."""
 
 import logging
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from sqlfluff.core.parser import BaseSegment, SourceFix
+from sqlfluff.core.parser.context import ParseContext
 from sqlfluff.core.rules.fix import LintFix
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -93,6 +95,162 @@ class AnchorEditInfo:
         return False  # pragma: no cover
 
 
+@dataclass
+class DirtyTypes:
+    """The types of the segments changed by applying fixes.
+
+    This is used by the linter to skip rules on later fix loops if none
+    of the segments they look at have changed. For each segment which is
+    rebuilt we also record the types of its direct children, because
+    rules often look at the siblings of the segments they're crawling.
+    """
+
+    # A bitmask of types (see `type_mask()`).
+    mask: int = field(default=0)
+
+    def add(self, segment: BaseSegment, descendants: bool = False) -> None:
+        """Record that this segment (and optionally all it contains) changed."""
+        self.mask |= segment.class_type_mask | (
+            segment.descendant_type_mask
+            if descendants
+            else segment.direct_descendant_type_mask
+        )
+
+
+class ReparseValidator:
+    """Checks that fixed segments still parse, for all the fixes to a file.
+
+    Rather than setting up a new parse context for each check, this keeps
+    one for the whole file. The results are also cached by the class of
+    the segment and its raw content, so that segments which come up again
+    (e.g. on later fix loops, or when fixes are retried) aren't reparsed.
+    The total time spent validating is recorded in `time`.
+    """
+
+    def __init__(self, dialect: "Dialect") -> None:
+        self.dialect = dialect
+        self.parse_context = ParseContext(dialect=dialect)
+        self.time = 0.0
+        self._results: dict[tuple[Any, ...], bool] = {}
+
+    def validate(self, segment: BaseSegment) -> bool:
+        """Check the segment by reparsing it (see `validate_segment_with_reparse`).
+
+        Segments which contain unparsable sections aren't cached, because
+        the result depends on which of them were there before.
+        """
+        t0 = time.monotonic()
+        key: Optional[tuple[Any, ...]] = None
+        if "unparsable" not in segment.descendant_type_set:
+            key = (
+                segment.__class__,
+                tuple(
+                    (raw_seg.__class__, raw_seg.raw, raw_seg.class_type_mask)
+                    for raw_seg in segment.raw_segments
+                    if not raw_seg.is_meta
+                ),
+            )
+        result = self._results.get(key) if key else None
+        if result is None:
+            result = segment.validate_segment_with_reparse(
+                self.dialect, parse_context=self.parse_context
+            )
+            if key:
+                self._results[key] = result
+        self.time += time.monotonic() - t0
+        return result
+
+
+def _fix_spans(fix: "LintFix") -> Optional[tuple[tuple[int, int], tuple[int, int]]]:
+    """Get the templated and source positions affected by a fix.
+
+    For edits and deletions this is the span of the anchor. For creations
+    it's the point before or after the anchor where the new segments will
+    be inserted. Returns None if the anchor has no position.
+    """
+    pos_marker = fix.anchor.pos_marker
+    if not pos_marker:
+        return None
+    spans = []
+    for _slice in (pos_marker.templated_slice, pos_marker.source_slice):
+        if fix.edit_type == "create_before":
+            spans.append((_slice.start, _slice.start))
+        elif fix.edit_type == "create_after":
+            spans.append((_slice.stop, _slice.stop))
+        else:
+            spans.append((_slice.start, _slice.stop))
+    return spans[0], spans[1]
+
+
+def _spans_overlap(a: tuple[int, int], b: tuple[int, int]) -> bool:
+    """Do two spans overlap?
+
+    Spans which just touch are only treated as overlapping if one of
+    them is a single point (i.e. an insertion or a zero length segment),
+    because then the order the edits are applied in would matter.
+    """
+    if a[0] == a[1] or b[0] == b[1]:
+        return a[0] <= b[1] and b[0] <= a[1]
+    return a[0] < b[1] and b[0] < a[1]
+
+
+@dataclass
+class FixBatch:
+    """The fixes from several rules, to be applied to a tree in one go.
+
+    Rather than rebuilding (and revalidating) the tree after each rule
+    which has fixes, the linter can collect the fixes from all the rules
+    in a loop and apply them together. Fixes from a rule are only added
+    if they don't touch any of the same parts of the file as the fixes
+    already in the batch, which keeps the result independent of the
+    order they're applied in. Rules whose fixes conflict are left for
+    the next loop, where they'll be run again on the fixed tree.
+    """
+
+    anchor_info: dict[int, AnchorEditInfo] = field(default_factory=dict)
+    # The fixes from each of the rules in the batch, in order.
+    rule_fixes: list[tuple[str, dict[int, AnchorEditInfo]]] = field(
+        default_factory=list
+    )
+    # The templated and source spans affected by the fixes in the batch.
+    _spans: list[tuple[tuple[int, int], tuple[int, int]]] = field(default_factory=list)
+
+    @property
+    def rule_codes(self) -> list[str]:
+        """The codes of the rules with fixes in the batch."""
+        return [code for code, _ in self.rule_fixes]
+
+    def add(self, rule_code: str, anchor_info: dict[int, AnchorEditInfo]) -> bool:
+        """Add the fixes from a rule, unless they conflict with the batch.
+
+        Returns True if the fixes were added.
+        """
+        spans = []
+        for anchor_id, info in anchor_info.items():
+            if anchor_id in self.anchor_info:
+                return False
+            for fix in info.fixes:
+                fix_spans = _fix_spans(fix)
+                if fix_spans is None:
+                    # We don't know where this fix is, so it can only be
+                    # applied on its own.
+                    if self.rule_fixes:
+                        return False
+                    continue
+                if any(
+                    _spans_overlap(fix_spans[0], other[0])
+                    or _spans_overlap(fix_spans[1], other[1])
+                    for other in self._spans
+                ):
+                    return False
+                spans.append(fix_spans)
+
+        self.anchor_info.update(anchor_info)
+        self.rule_fixes.append((rule_code, anchor_info))
+        self._spans += spans
+        return True
+
+
 def compute_anchor_edit_info(fixes: list["LintFix"]) -> dict[int, AnchorEditInfo]:
     """Group and count fixes by anchor, return dictionary."""
     anchor_info = defaultdict(AnchorEditInfo)  # type: ignore
@@ -104,19 +262,49 @@ def compute_anchor_edit_info(fixes: list["LintFix"]) -> dict[int, AnchorEditInfo
     return dict(anchor_info)
 
 
+def _fix_ancestors(
+    segment: BaseSegment, fixes: dict[int, AnchorEditInfo]
+) -> Optional[set[int]]:
+    """Get the uuids of all the segments which contain an anchor of the fixes.
+
+    This follows the parent references up from each anchor, so that any
+    other parts of the tree can be left untouched when applying the fixes.
+    If any of the anchors can't be traced back to `segment` (e.g. because
+    the parent references aren't present), then we return None, which means
+    that every part of the tree should be checked for anchors.
+    """
+    ancestors: set[int] = set()
+    for anchor_info in fixes.values():
+        seg = anchor_info.fixes[0].anchor
+        while seg is not segment:
+            _parent = seg.get_parent()
+            if not _parent or _parent[0].segments[_parent[1]] is not seg:
+                return None
+            seg = _parent[0]
+            if seg.uuid in ancestors:
+                # We've already traced the rest of this path.
+                break
+            ancestors.add(seg.uuid)
+    return ancestors
+
+
 def apply_fixes(
     segment: BaseSegment,
     dialect: "Dialect",
     rule_code: str,
     fixes: dict[int, AnchorEditInfo],
     fix_even_unparsable: bool = False,
+    dirty_types: Optional[DirtyTypes] = None,
+    validator: Optional[ReparseValidator] = None,
 ) -> tuple["BaseSegment", list["BaseSegment"], list["BaseSegment"], bool]:
     """Apply a dictionary of fixes to this segment.
 
     Used in to apply fixes found in linting. If a segment remains unchanged
     then the original is returned, but if any changes are made to it, or any
     of it's child segments, then it returns a copy rather than mutating the
-    original.
+    original. Only the segments which contain the anchors of the fixes are
+    rebuilt, any unchanged segments are shared with the original (and their
+    parent references updated to point to their new parents).
 
     Most fixes are usually applied when this method is called on their parent
     segment, this is because that's where we can insert or move segments relative
@@ -142,6 +330,39 @@ def apply_fixes(
     sections, but will do so *without validation*. That means that the final
     element of the return value will always return `True`, so that we don't interrupt
     the validity checking of any outer (parsable) sections.
+
+    If `dirty_types` is provided, then the types of any segments which are
+    removed, inserted or rebuilt are added to it.
+
+    A `validator` can be provided to share the validation between calls
+    for the same file (see `ReparseValidator`).
+    """
+    return _apply_fixes(
+        segment,
+        rule_code,
+        fixes,
+        fix_even_unparsable,
+        _fix_ancestors(segment, fixes),
+        dirty_types if dirty_types is not None else DirtyTypes(),
+        validator or ReparseValidator(dialect),
+    )
+
+
+def _apply_fixes(
+    segment: BaseSegment,
+    rule_code: str,
+    fixes: dict[int, AnchorEditInfo],
+    fix_even_unparsable: bool,
+    ancestors: Optional[set[int]],
+    dirty_types: DirtyTypes,
+    validator: ReparseValidator,
+) -> tuple["BaseSegment", list["BaseSegment"], list["BaseSegment"], bool]:
+    """Apply a dictionary of fixes to this segment (see `apply_fixes`).
+
+    `ancestors` is the set of uuids of segments which contain the anchors of
+    the fixes (or None if unknown), so that we only recurse into those.
+    The types of any changed segments are recorded in `dirty_types`, and
+    they are checked using the `validator`.
     """
     if not fixes or segment.is_raw():
         return segment, [], [], True
@@ -181,6 +402,9 @@ def apply_fixes(
                 seg,
             )
 
+            if f.edit_type in ("delete", "replace"):
+                dirty_types.add(seg, descendants=True)
+
             # Deletes are easy.
             if f.edit_type == "delete":
                 # We're just getting rid of this segment.
@@ -206,6 +430,7 @@ def apply_fixes(
             assert f.edit, f"Edit {f.edit_type!r} requires `edit`."
             consumed_pos = False
             for s in f.edit:
+                dirty_types.add(s, descendants=True)
                 seg_buffer.append(s)
                 # If one of them has the same raw representation
                 # then the first that matches gets to take the
@@ -230,8 +455,16 @@ def apply_fixes(
                 # segment on the end
                 seg_buffer.append(seg)
 
-    # Invalidate any caches
-    segment.invalidate_caches()
+    # Any of the original children which don't contain an anchor can be
+    # left as they are. NOTE: Segments from the edits are always recursed
+    # into, because they may need positioning.
+    if ancestors is not None:
+        original_ids = {id(seg) for seg in segment.segments}
+        unchanged = [
+            id(seg) in original_ids and seg.uuid not in ancestors for seg in seg_buffer
+        ]
+    else:
+        unchanged = [False] * len(seg_buffer)
 
     # If any fixes applied, do an intermediate reposition. When applying
     # fixes to children and then trying to reposition them, that recursion
@@ -247,8 +480,14 @@ def apply_fixes(
     # Then recurse (i.e. deal with the children) (Requeueing)
     seg_queue = seg_buffer
     seg_buffer = []
-    for seg in seg_queue:
-        s, pre, post, validated = apply_fixes(seg, dialect, rule_code, fixes)
+    for seg, is_unchanged in zip(seg_queue, unchanged):
+        if is_unchanged:
+            seg_buffer.append(seg)
+            validated = True
+            continue
+        s, pre, post, validated = _apply_fixes(
+            seg, rule_code, fixes, False, ancestors, dirty_types, validator
+        )
         # 'before' and 'after' will usually be empty. Only used when
         # lower-level fixes left 'seg' with non-code (usually
         # whitespace) segments as the first or last children. This is
@@ -303,6 +542,7 @@ def apply_fixes(
         if hasattr(err, "add_note"):
             err.add_note(f" After applying fixes: {fixes_applied}.")
         raise err
+    dirty_types.add(new_seg)
 
     # Handle any necessary validation.
     if requires_validate:
@@ -317,12 +557,14 @@ def apply_fixes(
             else:
                 # It was already unparsable, but we're being asked to validate.
                 # Don't any apply fixes from within this region and just return the
-                # original segment.
+                # original segment. Any segments it shared with the new one will
+                # have been given new parents, so reset those first.
+                segment.set_as_parent()
                 return segment, [], [], True
         # Otherwise only validate if there's a match_grammar. Otherwise we may get
         # strange results (for example with the BracketedSegment).
         elif hasattr(new_seg, "match_grammar"):
-            validated = new_seg.validate_segment_with_reparse(dialect)
+            validated = validator.validate(new_seg)
     else:
         validated = not requires_validate
     # Return the new segment and any non-code that needs to bubble up
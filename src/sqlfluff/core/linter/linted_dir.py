@@ -16,6 +16,7 @@ from sqlfluff.core.errors import (
 from sqlfluff.core.formatter import FormatterInterface
 from sqlfluff.core.linter.linted_file import TMP_PRS_ERROR_TYPES, LintedFile
 from sqlfluff.core.parser.segments.base import BaseSegment
+from sqlfluff.core.timing import RuleTimingSummary, TimingSummary
 
 
 class LintingRecord(TypedDict):
@@ -39,12 +40,21 @@ class LintedDir:
     object and allows us to either _keep_ those objects for later use, or
     extract the results from them and allow the original object to be discarded
     and save memory overhead if not required.
+
+    If `retain_records` is also False, then the serialised records of each
+    file aren't kept either, and only the statistics and timing summaries are.
+    The memory used then doesn't grow with the number of files, which allows
+    the results of very large projects to be streamed (as long as the results
+    of each file are reported as they're linted).
     """
 
-    def __init__(self, path: str, retain_files: bool = True) -> None:
+    def __init__(
+        self, path: str, retain_files: bool = True, retain_records: bool = True
+    ) -> None:
         self.files: list[LintedFile] = []
         self.path: str = path
         self.retain_files: bool = retain_files
+        self.retain_records: bool = retain_records
         # Records
         self._records: list[LintingRecord] = []
         # Stats
@@ -53,20 +63,19 @@ class LintedDir:
         self._num_unclean: int = 0
         self._num_violations: int = 0
         self.num_unfiltered_tmp_prs_errors: int = 0
-        self._unfiltered_tmp_prs_errors_map: dict[str, int] = {}
+        # The number of fixable lint errors in each file with (unfiltered)
+        # templating or parsing errors. Those fixes may later be discarded.
+        self._tmp_prs_files_fixable_map: dict[str, int] = {}
         self.num_tmp_prs_errors: int = 0
+        self.num_fixable_lint_errors: int = 0
         self.num_unfixable_lint_errors: int = 0
         # Timing
-        self.step_timings: list[dict[str, float]] = []
-        self.rule_timings: list[tuple[str, str, float]] = []
-
-    def add(self, file: LintedFile) -> None:
-        """Add a file to this path.
+        self.step_timings = TimingSummary()
+        self.rule_timings = RuleTimingSummary()
 
-        This function _always_ updates the metadata tracking, but may
-        or may not persist the `file` object itself depending on the
-        `retain_files` argument given on instantiation.
-        """
+    @staticmethod
+    def make_record(file: LintedFile) -> LintingRecord:
+        """Generate the serialised record of a file."""
         # Generate serialised violations.
         violation_records = sorted(
             # Keep the warnings
@@ -78,22 +87,7 @@ class LintedDir:
         record: LintingRecord = {
             "filepath": file.path,
             "violations": violation_records,
-            "statistics": {
-                "source_chars": (
-                    len(file.templated_file.source_str) if file.templated_file else 0
-                ),
-                "templated_chars": (
-                    len(file.templated_file.templated_str) if file.templated_file else 0
-                ),
-                # These are all the segments in the tree
-                "segments": (
-                    file.tree.count_segments(raw_only=False) if file.tree else 0
-                ),
-                # These are just the "leaf" nodes of the tree
-                "raw_segments": (
-                    file.tree.count_segments(raw_only=True) if file.tree else 0
-                ),
-            },
+            "statistics": file.get_statistics(),
             "timings": {},
         }
 
@@ -104,8 +98,19 @@ class LintedDir:
                 # individual rule timings, by code.
                 **file.timings.get_rule_timing_dict(),
             }
+        return record
 
-        self._records.append(record)
+    def add(self, file: LintedFile) -> None:
+        """Add a file to this path.
+
+        This function _always_ updates the metadata tracking, but may
+        or may not persist the `file` object itself depending on the
+        `retain_files` and `retain_records` arguments given on instantiation.
+        """
+        # Keep the warnings
+        violations = file.get_violations(filter_warning=False)
+        if self.retain_records:
+            self._records.append(self.make_record(file))
 
         # Update the stats
         self._num_files += 1
@@ -120,19 +125,26 @@ class LintedDir:
             filter_warning=False,
         )
         self.num_unfiltered_tmp_prs_errors += _unfiltered_tmp_prs_errors
-        self._unfiltered_tmp_prs_errors_map[file.path] = _unfiltered_tmp_prs_errors
         self.num_tmp_prs_errors += file.num_violations(
             types=TMP_PRS_ERROR_TYPES,
         )
+        # NOTE: Count these in the same way as the serialised records (i.e.
+        # including warnings), so they agree if the fixes are discarded later.
+        _num_fixable = sum(
+            isinstance(v, SQLLintError) and v.fixable for v in violations
+        )
+        self.num_fixable_lint_errors += _num_fixable
+        if _unfiltered_tmp_prs_errors:
+            self._tmp_prs_files_fixable_map[file.path] = _num_fixable
         self.num_unfixable_lint_errors += file.num_violations(
             types=SQLLintError,
             fixable=False,
         )
 
-        # Append timings if present
+        # Add timings if present
         if file.timings:
-            self.step_timings.append(file.timings.step_timings)
-            self.rule_timings.extend(file.timings.rule_timings)
+            self.step_timings.add(file.timings.step_timings)
+            self.rule_timings.add(file.timings.rule_timings)
 
         # Finally, if set to persist files, do that.
         if self.retain_files:
@@ -196,6 +208,7 @@ class LintedDir:
         This method is useful for serialization as all objects will be builtin python
         types (ints, strs).
         """
+        assert self.retain_records, "cannot `as_records()` without `retain_records`"
         return self._records
 
     def stats(self) -> dict[str, int]:
@@ -230,19 +243,22 @@ class LintedDir:
         if self.num_unfiltered_tmp_prs_errors:
             # Filter serialised versions if present.
             for record in self._records:
-                if self._unfiltered_tmp_prs_errors_map[record["filepath"]]:
+                if record["filepath"] in self._tmp_prs_files_fixable_map:
                     for v_dict in record["violations"]:
                         if v_dict.get("fixes", []):
-                            # We're changing a violating with fixes, to one without,
-                            # so we need to increment the cache value.
-                            self.num_unfixable_lint_errors += 1
                             v_dict["fixes"] = []
             # Filter the full versions if present.
             for linted_file in self.files:
-                if self._unfiltered_tmp_prs_errors_map[linted_file.path]:
+                if linted_file.path in self._tmp_prs_files_fixable_map:
                     for violation in linted_file.violations:
                         if isinstance(violation, SQLLintError):
                             violation.fixes = []
+            # We're changing violations with fixes, to ones without, so we
+            # need to update the cached counts.
+            for num_fixable in self._tmp_prs_files_fixable_map.values():
+                self.num_fixable_lint_errors -= num_fixable
+                self.num_unfixable_lint_errors += num_fixable
+            self._tmp_prs_files_fixable_map = {}
 
     @property
     def tree(self) -> Optional[BaseSegment]:
@@ -13,7 +13,7 @@ import tempfile
 from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import NamedTuple, Optional, Union
+from typing import Any, NamedTuple, Optional, Union
 
 from sqlfluff.core.errors import (
     CheckTuple,
@@ -73,6 +73,32 @@ class LintedFile(NamedTuple):
     ignore_mask: Optional[IgnoreMask]
     templated_file: Optional[TemplatedFile]
     encoding: str
+    # Precomputed statistics, for when the tree and templated file are not
+    # available (e.g. when the result has been replayed from the lint cache).
+    statistics: Optional[dict[str, int]] = None
+    # The number of rules which had nothing to look at in the file, and so
+    # were skipped.
+    rules_skipped: int = 0
+
+    def get_statistics(self) -> dict[str, int]:
+        """Return statistics about the file, its parse tree and linting."""
+        if self.statistics is not None:
+            return self.statistics
+        return {
+            "source_chars": (
+                len(self.templated_file.source_str) if self.templated_file else 0
+            ),
+            "templated_chars": (
+                len(self.templated_file.templated_str) if self.templated_file else 0
+            ),
+            # These are all the segments in the tree
+            "segments": (self.tree.count_segments(raw_only=False) if self.tree else 0),
+            # These are just the "leaf" nodes of the tree
+            "raw_segments": (
+                self.tree.count_segments(raw_only=True) if self.tree else 0
+            ),
+            "rules_skipped": self.rules_skipped,
+        }
 
     def check_tuples(
         self, raise_on_non_linting_violations: bool = True
@@ -106,14 +132,20 @@ class LintedFile(NamedTuple):
         fewer fixes).
         """
         new_violations = []
-        dedupe_buffer = set()
+        # The source signature of a linting error includes its fixes. So that
+        # we don't build any deferred fixes unless we need to, violations are
+        # grouped by position and description first, and the full signatures
+        # are only compared within those groups.
+        dedupe_buffer: dict[tuple[Any, ...], list[SQLBaseError]] = defaultdict(list)
         for v in violations:
-            signature = v.source_signature()
-            if signature not in dedupe_buffer:
-                new_violations.append(v)
-                dedupe_buffer.add(signature)
-            else:
+            group = dedupe_buffer[(v.check_tuple(), v.desc())]
+            if group and any(
+                v.source_signature() == other.source_signature() for other in group
+            ):
                 linter_logger.debug("Removing duplicate source violation: %r", v)
+            else:
+                new_violations.append(v)
+                group.append(v)
         # Sort on return so that if any are out of order, they're now ordered
         # appropriately. This happens most often when linting multiple variants.
         return sorted(new_violations, key=lambda v: (v.line_no, v.line_pos))
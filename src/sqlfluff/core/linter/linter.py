@@ -1,6 +1,7 @@
 """Defines the linter class."""
 
 import fnmatch
+import hashlib
 import logging
 import os
 import time
@@ -21,6 +22,7 @@ from sqlfluff.core.errors import (
 )
 from sqlfluff.core.formatter import FormatterInterface
 from sqlfluff.core.helpers.file import get_encoding
+from sqlfluff.core.linter.cache import LintCache
 from sqlfluff.core.linter.common import (
     ParsedString,
     ParsedVariant,
@@ -28,7 +30,14 @@ from sqlfluff.core.linter.common import (
     RuleTuple,
 )
 from sqlfluff.core.linter.discovery import paths_from_path
-from sqlfluff.core.linter.fix import apply_fixes, compute_anchor_edit_info
+from sqlfluff.core.linter.fix import (
+    AnchorEditInfo,
+    DirtyTypes,
+    FixBatch,
+    ReparseValidator,
+    apply_fixes,
+    compute_anchor_edit_info,
+)
 from sqlfluff.core.linter.linted_dir import LintedDir
 from sqlfluff.core.linter.linted_file import (
     TMP_PRS_ERROR_TYPES,
@@ -37,23 +46,45 @@ from sqlfluff.core.linter.linted_file import (
 )
 from sqlfluff.core.linter.linting_result import LintingResult
 from sqlfluff.core.parser import Lexer, Parser
-from sqlfluff.core.parser.segments.base import BaseSegment, SourceFix
+from sqlfluff.core.parser.segments.base import BaseSegment
 from sqlfluff.core.rules import BaseRule, RulePack, get_ruleset
+from sqlfluff.core.rules.dispatch import MultiRuleDispatcher
 from sqlfluff.core.rules.fix import LintFix
 from sqlfluff.core.rules.noqa import IgnoreMask
 
 if TYPE_CHECKING:  # pragma: no cover
     from sqlfluff.core.dialects import Dialect
+    from sqlfluff.core.parser import SourceFix
     from sqlfluff.core.parser.segments.meta import MetaSegment
     from sqlfluff.core.templaters import RawTemplater, TemplatedFile
 
 
 RuleTimingsType = list[tuple[str, str, float]]
+# A version of a file while fixing, used to catch infinite loops. This is a
+# digest of the fixed templated file and the list of source fixes, so that we
+# don't need to keep a copy of every version of the file.
+TreeVersionType = bytes
 
 # Instantiate the linter logger
 linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
 
 
+def _tree_version(raw: str, source_fixes: Sequence["SourceFix"]) -> TreeVersionType:
+    """Get a digest of a version of a file, for catching infinite loops.
+
+    This covers the fixed templated file and the source fixes to apply. We use
+    a strong digest (rather than `hash()`), so that a collision can't stop us
+    fixing early.
+    """
+    digest = hashlib.blake2b()
+    for part in (raw, *(repr(fix) for fix in source_fixes)):
+        encoded = part.encode("utf-8")
+        # Prefix each part with its length, so the parts can't run together.
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.digest()
+
+
 class Linter:
     """The interface class to interact with the linter."""
 
@@ -296,6 +327,77 @@ class Linter:
             f"One fix for {code} not applied, it would re-cause the same error."
         )
 
+    @staticmethod
+    def _rules_with_targets(rules: list[BaseRule], tree: BaseSegment) -> list[BaseRule]:
+        """Filter the rules to those which could find anything in this tree.
+
+        Most rules only look for particular types of segment, so there's no
+        point running them on a file which doesn't contain any of them (see
+        `BaseCrawler.has_targets_in()`).
+        """
+        return [rule for rule in rules if rule.crawl_behaviour.has_targets_in(tree)]
+
+    @classmethod
+    def _apply_fixes_to_tree(
+        cls,
+        tree: BaseSegment,
+        tree_version: TreeVersionType,
+        previous_versions: set[TreeVersionType],
+        config: FluffConfig,
+        rule_code: str,
+        anchor_info: dict[int, AnchorEditInfo],
+        dirty_types: DirtyTypes,
+        validator: ReparseValidator,
+    ) -> Optional[tuple[BaseSegment, TreeVersionType]]:
+        """Apply some fixes to the tree, and check the result.
+
+        Returns the new tree and its version, or None if the fixes
+        couldn't be applied, or would take us back to a previous version.
+        """
+        new_tree, _, _, _valid = apply_fixes(
+            tree,
+            config.get("dialect_obj"),
+            rule_code,
+            anchor_info,
+            fix_even_unparsable=config.get("fix_even_unparsable"),
+            dirty_types=dirty_types,
+            validator=validator,
+        )
+
+        # Check for infinite loops. We use a combination of the
+        # fixed templated file and the list of source fixes to
+        # apply.
+        new_tree_version = _tree_version(new_tree.raw, new_tree.source_fixes)
+        # Was anything actually applied? If not, then the fixes we
+        # had cannot be safely applied and we should stop trying.
+        if new_tree_version == tree_version:
+            linter_logger.debug(
+                f"Fixes for {rule_code} could not be safely be "
+                "applied. Likely due to initially unparsable file."
+            )
+        elif not _valid:
+            # The fixes result in an invalid file. Don't apply
+            # the fix and skip onward. Show a warning.
+            linter_logger.warning(
+                f"Fixes for {rule_code} not applied, as it "
+                "would result in an unparsable file. Please "
+                "report this as a bug with a minimal query "
+                "which demonstrates this warning."
+            )
+        elif new_tree_version not in previous_versions:
+            # We've not seen this version of the file so far.
+            return new_tree, new_tree_version
+        else:
+            # Applying these fixes took us back to a state
+            # which we've seen before. We're in a loop, so
+            # we want to stop.
+            cls._warn_unfixable(rule_code)
+        # We're not using the new tree, but any unchanged
+        # segments were shared with it (and so now have parent
+        # references into it). Point them back at this tree.
+        tree.set_as_parent()
+        return None
+
     # ### Class Methods
     # These compose the base static methods into useful recipes.
 
@@ -367,8 +469,18 @@ class Linter:
         fname: Optional[str] = None,
         templated_file: Optional["TemplatedFile"] = None,
         formatter: Optional[FormatterInterface] = None,
+        validator: Optional[ReparseValidator] = None,
+        statistics: Optional[dict[str, int]] = None,
     ) -> tuple[BaseSegment, list[SQLBaseError], Optional[IgnoreMask], RuleTimingsType]:
-        """Lint and optionally fix a tree object."""
+        """Lint and optionally fix a tree object.
+
+        If fixing, the fixed segments are checked by reparsing them using
+        the `validator` (if not provided, one is created for this tree).
+
+        If `statistics` is provided, the number of rules which had nothing to
+        look at in the file on the first pass (and so were skipped) is
+        recorded in it as `rules_skipped`.
+        """
         # Keep track of the linting errors on the very first linter pass. The
         # list of issues output by "lint" and "fix" only includes issues present
         # in the initial SQL code, EXCLUDING any issues that may be created by
@@ -377,9 +489,19 @@ class Linter:
         # A placeholder for the fixes we had on the previous loop
         last_fixes: Optional[list[LintFix]] = None
         # Keep a set of previous versions to catch infinite loops.
-        previous_versions: set[tuple[str, tuple["SourceFix", ...]]] = {(tree.raw, ())}
+        previous_versions: set[TreeVersionType] = {_tree_version(tree.raw, ())}
+        tree_version = _tree_version(tree.raw, tree.source_fixes)
+        # For each rule, the bitmask of the types of segments which have been
+        # changed by fixes since it last ran. Rules which haven't run yet
+        # aren't in here, and are always run.
+        dirty_since_run: dict[str, int] = {}
         # Keep a buffer for recording rule timings.
         rule_timings: RuleTimingsType = []
+        # Share the reparse validation of fixed segments between all the fixes.
+        validator = validator or ReparseValidator(config.get("dialect_obj"))
+        # Count the rules skipped on the first pass.
+        statistics = {} if statistics is None else statistics
+        statistics["rules_skipped"] = 0
 
         # If we are fixing then we want to loop up to the runaway_limit, otherwise just
         # once for linting.
@@ -437,6 +559,46 @@ class Linter:
                     # In order to compute initial_linting_errors correctly, need
                     # to run all rules on the first loop of the main phase.
                     rules_this_phase = rule_pack.rules
+
+                if not fix:
+                    # When only linting, no fixes are applied between rules, so
+                    # we can evaluate all the rules in a single walk of the tree.
+                    # The results are still collected in the order of the rules.
+                    # Rules with nothing to look at in this file are skipped.
+                    rules_with_targets = cls._rules_with_targets(rules_this_phase, tree)
+                    statistics["rules_skipped"] += len(rules_this_phase) - len(
+                        rules_with_targets
+                    )
+                    dispatcher = MultiRuleDispatcher(rules_with_targets)
+                    progress_bar_results = tqdm(
+                        dispatcher.crawl(
+                            tree,
+                            dialect=config.get("dialect_obj"),
+                            templated_file=templated_file,
+                            ignore_mask=ignore_mask,
+                            fname=fname,
+                            config=config,
+                        ),
+                        desc="lint by rules",
+                        leave=False,
+                        disable=progress_bar_configuration.disable_progress_bar,
+                    )
+                    for crawler, linting_errors, rule_time in progress_bar_results:
+                        progress_bar_results.set_description(f"rule {crawler.code}")
+                        initial_linting_errors += linting_errors
+                        rule_timings.append((crawler.code, crawler.name, rule_time))
+                    continue
+
+                # Optionally, collect the fixes from all the rules in this loop
+                # and apply them together at the end of it (only in the main
+                # phase, the post phase is only run twice).
+                batch = (
+                    FixBatch()
+                    if config.get("batch_fixes", default=False) and phase == "main"
+                    else None
+                )
+                deferred_codes: list[str] = []
+
                 progress_bar_crawler = tqdm(
                     rules_this_phase,
                     desc="lint by rules",
@@ -456,6 +618,31 @@ class Linter:
                         and not crawler.is_fix_compatible
                     ):
                         continue
+                    # Performance: Skip rules with nothing to look at in the
+                    # file as it currently is.
+                    if not crawler.crawl_behaviour.has_targets_in(tree):
+                        linter_logger.debug(
+                            f"Skipping {crawler.code}, nothing to look at in the "
+                            "file."
+                        )
+                        if is_first_linter_pass():
+                            statistics["rules_skipped"] += 1
+                        continue
+                    # Performance: Skip rules if nothing they would look at
+                    # has changed since they last ran. They would just find
+                    # the same (unfixable) results as before.
+                    if (
+                        crawler.code in dirty_since_run
+                        and not crawler.crawl_behaviour.is_affected_by(
+                            dirty_since_run[crawler.code]
+                        )
+                    ):
+                        linter_logger.debug(
+                            f"Skipping {crawler.code}, no relevant changes since "
+                            "it last ran."
+                        )
+                        continue
+                    dirty_since_run[crawler.code] = 0
 
                     progress_bar_crawler.set_description(f"rule {crawler.code}")
                     t0 = time.monotonic()
@@ -498,7 +685,7 @@ class Linter:
                             cls._report_conflicting_fixes_same_anchor(message)
                             for lint_result in linting_errors:
                                 lint_result.fixes = []
-                        elif fixes == last_fixes:
+                        elif batch is None and fixes == last_fixes:
                             # If we generate the same fixes two times in a row,
                             # that means we're in a loop, and we want to stop.
                             # (Fixes should address issues, hence different
@@ -510,59 +697,84 @@ class Linter:
                                 "the previous pass. Assuming that we cannot apply them "
                                 "safely. Passing gracefully."
                             )
+                        elif batch is not None:
+                            # Collect the fixes, to apply them together at the
+                            # end of the loop. If they conflict with those from
+                            # an earlier rule, then leave them for the next loop
+                            # (where this rule will be run again).
+                            if not batch.add(crawler.code, anchor_info):
+                                linter_logger.debug(
+                                    f"Fixes for {crawler.code} conflict with "
+                                    "those from an earlier rule. Deferring them "
+                                    "to the next loop."
+                                )
+                                deferred_codes.append(crawler.code)
+                                del dirty_since_run[crawler.code]
                         else:
                             # This is the happy path. We have fixes, now we want to
                             # apply them.
                             last_fixes = fixes
-                            new_tree, _, _, _valid = apply_fixes(
+                            dirty_types = DirtyTypes()
+                            result = cls._apply_fixes_to_tree(
                                 tree,
-                                config.get("dialect_obj"),
+                                tree_version,
+                                previous_versions,
+                                config,
                                 crawler.code,
                                 anchor_info,
-                                fix_even_unparsable=config.get("fix_even_unparsable"),
+                                dirty_types,
+                                validator,
                             )
-
-                            # Check for infinite loops. We use a combination of the
-                            # fixed templated file and the list of source fixes to
-                            # apply.
-                            loop_check_tuple = (
-                                new_tree.raw,
-                                tuple(new_tree.source_fixes),
-                            )
-                            # Was anything actually applied? If not, then the fixes we
-                            # had cannot be safely applied and we should stop trying.
-                            if loop_check_tuple == (tree.raw, tuple(tree.source_fixes)):
-                                linter_logger.debug(
-                                    f"Fixes for {crawler.code} could not be safely be "
-                                    "applied. Likely due to initially unparsable file."
-                                )
-                            elif not _valid:
-                                # The fixes result in an invalid file. Don't apply
-                                # the fix and skip onward. Show a warning.
-                                linter_logger.warning(
-                                    f"Fixes for {crawler.code} not applied, as it "
-                                    "would result in an unparsable file. Please "
-                                    "report this as a bug with a minimal query "
-                                    "which demonstrates this warning."
-                                )
-                            elif loop_check_tuple not in previous_versions:
-                                # We've not seen this version of the file so
-                                # far. Continue.
-                                tree = new_tree
-                                previous_versions.add(loop_check_tuple)
+                            if result:
+                                tree, tree_version = result
+                                previous_versions.add(tree_version)
+                                for code in dirty_since_run:
+                                    dirty_since_run[code] |= dirty_types.mask
                                 changed = True
                                 continue
-                            else:
-                                # Applying these fixes took us back to a state
-                                # which we've seen before. We're in a loop, so
-                                # we want to stop.
-                                cls._warn_unfixable(crawler.code)
 
                     # Record rule timing
                     rule_timings.append(
                         (crawler.code, crawler.name, time.monotonic() - t0)
                     )
 
+                if batch and batch.rule_fixes:
+                    linter_logger.info(
+                        f"Applying batched fixes for {batch.rule_codes}. "
+                        f"Deferred: {deferred_codes}"
+                    )
+                    # Try applying all the fixes in one go first. If that
+                    # fails (e.g. because the combination doesn't parse), then
+                    # fall back to applying the fixes for each rule in turn.
+                    # The fixes in a batch don't overlap, so the anchors of the
+                    # later ones are still present after applying the earlier.
+                    fix_sets = [(",".join(batch.rule_codes), batch.anchor_info)]
+                    if len(batch.rule_fixes) > 1:
+                        fix_sets += batch.rule_fixes
+                    for rule_code, anchor_info in fix_sets:
+                        dirty_types = DirtyTypes()
+                        result = cls._apply_fixes_to_tree(
+                            tree,
+                            tree_version,
+                            previous_versions,
+                            config,
+                            rule_code,
+                            anchor_info,
+                            dirty_types,
+                            validator,
+                        )
+                        if result:
+                            tree, tree_version = result
+                            previous_versions.add(tree_version)
+                            for code in dirty_since_run:
+                                dirty_since_run[code] |= dirty_types.mask
+                            changed = True
+                            if anchor_info is batch.anchor_info:
+                                break
+                # Make sure any deferred rules get another chance, even if
+                # none of the other fixes could be applied.
+                changed = changed or bool(deferred_codes)
+
                 if fix and not changed:
                     # We did not change the file. Either the file is clean (no
                     # fixes), or any fixes which are present will take us back
@@ -598,6 +810,9 @@ class Linter:
                     # Reason: When the linter hits the loop limit, the file is often
                     # messy, e.g. some of the fixes were applied repeatedly, possibly
                     # other weird things. We don't want the user to see this junk!
+                    # NOTE: It may share segments with the later trees, so reset
+                    # their parent references first.
+                    save_tree.set_as_parent()
                     return save_tree, initial_linting_errors, ignore_mask, rule_timings
 
         if config.get("ignore_templated_areas", default=True):
@@ -622,6 +837,7 @@ class Linter:
         time_dict = parsed.time_dict
         tree: Optional[BaseSegment] = None
         templated_file: Optional[TemplatedFile] = None
+        rules_skipped = 0
         t0 = time.monotonic()
 
         # First identify the root variant. That's the first variant
@@ -640,6 +856,9 @@ class Linter:
         if root_variant:
             linter_logger.info("lint_parsed - linting root variant (%s)", parsed.fname)
             assert root_variant.tree  # We just checked this.
+            # Share the reparse validation of fixes between all the variants.
+            validator = ReparseValidator(parsed.config.get("dialect_obj"))
+            lint_statistics: dict[str, int] = {}
             (
                 fixed_tree,
                 initial_linting_errors,
@@ -653,7 +872,10 @@ class Linter:
                 fname=parsed.fname,
                 templated_file=variant.templated_file,
                 formatter=formatter,
+                validator=validator,
+                statistics=lint_statistics,
             )
+            rules_skipped = lint_statistics["rules_skipped"]
 
             # Set legacy variables for now
             # TODO: Revise this
@@ -683,9 +905,15 @@ class Linter:
                     fname=parsed.fname,
                     templated_file=alternate_variant.templated_file,
                     formatter=formatter,
+                    validator=validator,
                 )
                 violations += alt_linting_errors
 
+            if fix:
+                # Record the time spent checking that the fixed sections of
+                # the file still parse, which is a large part of fixing.
+                time_dict["validation"] = validator.time
+
         # If no root variant, we should still apply ignores to any parsing
         # or templating fails.
         else:
@@ -734,15 +962,27 @@ class Linter:
             ignore_mask=ignore_mask,
             templated_file=templated_file,
             encoding=encoding,
+            rules_skipped=rules_skipped,
         )
 
+        cls.dispatch_linted_file(linted_file, parsed.config, fix, formatter)
+        return linted_file
+
+    @staticmethod
+    def dispatch_linted_file(
+        linted_file: LintedFile,
+        config: FluffConfig,
+        fix: bool = False,
+        formatter: Optional[FormatterInterface] = None,
+    ) -> None:
+        """Dispatch the violations for a linted file to the formatter."""
         # This is the main command line output from linting.
         if formatter:
             formatter.dispatch_file_violations(
-                parsed.fname,
+                linted_file.path,
                 linted_file,
                 only_fixable=fix,
-                warn_unused_ignores=parsed.config.get("warn_unused_ignores"),
+                warn_unused_ignores=config.get("warn_unused_ignores"),
             )
 
         # Safety flag for unset dialects
@@ -752,9 +992,22 @@ class Linter:
             if formatter:  # pragma: no cover TODO?
                 formatter.dispatch_dialect_warning(
                     # The dialect property is the string, not the dialect object
-                    cast(str, parsed.config.get("dialect"))
+                    cast(str, config.get("dialect"))
                 )
 
+    @classmethod
+    def replay_cached(
+        cls,
+        linted_file: LintedFile,
+        config: FluffConfig,
+        formatter: Optional[FormatterInterface] = None,
+    ) -> LintedFile:
+        """Replay a LintedFile loaded from the lint cache.
+
+        Cached results are only used when linting (not fixing), and are
+        dispatched to the formatter just as a fresh result would be.
+        """
+        cls.dispatch_linted_file(linted_file, config, fix=False, formatter=formatter)
         return linted_file
 
     @classmethod
@@ -1022,8 +1275,15 @@ class Linter:
         fixed_file_suffix: str = "",
         fix_even_unparsable: bool = False,
         retain_files: bool = True,
+        retain_records: bool = True,
     ) -> LintingResult:
-        """Lint an iterable of paths."""
+        """Lint an iterable of paths.
+
+        If neither `retain_files` nor `retain_records` are set, then only the
+        statistics and timings of each file are kept once it has been linted
+        (and reported to the formatter), so that memory use stays flat however
+        many files there are.
+        """
         # If no paths specified - assume local
         if not paths:  # pragma: no cover
             paths = (os.getcwd(),)
@@ -1035,7 +1295,9 @@ class Linter:
         sql_exts = self.config.get("sql_file_exts", default=".sql").lower().split(",")
 
         for path in paths:
-            linted_dir = LintedDir(path, retain_files=retain_files)
+            linted_dir = LintedDir(
+                path, retain_files=retain_files, retain_records=retain_records
+            )
             result.add(linted_dir)
             for fname in paths_from_path(
                 path,
@@ -1067,6 +1329,8 @@ class Linter:
 
         if self.formatter and effective_processes != 1:
             self.formatter.dispatch_processing_header(effective_processes)
+        if self.formatter:
+            self.formatter.dispatch_file_list(expanded_paths)
 
         # Show files progress bar only when there is more than one.
         first_path = expanded_paths[0] if expanded_paths else ""
@@ -1080,6 +1344,8 @@ class Linter:
         for i, linted_file in enumerate(runner.run(expanded_paths, fix), start=1):
             linted_dir = expanded_path_to_linted_dir[linted_file.path]
             linted_dir.add(linted_file)
+            if self.formatter:
+                self.formatter.dispatch_file_record(linted_file)
             # If any fatal errors, then stop iteration.
             if any(v.fatal for v in linted_file.violations):  # pragma: no cover
                 linter_logger.error("Fatal linting error. Halting further linting.")
@@ -1105,6 +1371,11 @@ class Linter:
             if i < len(expanded_paths):
                 progress_bar_files.set_description(f"file {expanded_paths[i]}")
 
+        # Keep the lint cache to size, now that we've finished adding to it.
+        lint_cache = LintCache.from_config(self.config)
+        if lint_cache and not fix:
+            lint_cache.evict()
+
         result.stop_timer()
         return result
 
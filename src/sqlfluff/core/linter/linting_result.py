@@ -126,9 +126,8 @@ class LintingResult:
         for dir in self.paths:
             # Add timings from cached values.
             # NOTE: This is so we don't rely on having the raw file objects any more.
-            for t in dir.step_timings:
-                timing.add(t)
-            rules_timing.add(dir.rule_timings)
+            timing.merge(dir.step_timings)
+            rules_timing.merge(dir.rule_timings)
         return {**timing.summary(), **rules_timing.summary()}
 
     def persist_timing_records(self, filename: str) -> None:
@@ -139,8 +138,15 @@ class LintingResult:
             "templated_chars",
             "segments",
             "raw_segments",
+            "rules_skipped",
+        ]
+        timing_fields = [
+            "templating",
+            "lexing",
+            "parsing",
+            "linting",
+            "validation",
         ]
-        timing_fields = ["templating", "lexing", "parsing", "linting"]
 
         # Iterate through all the files to get rule timing information so
         # we know what headings we're going to need.
@@ -24,12 +24,56 @@ from typing import Callable, Optional, Union
 from sqlfluff.core import FluffConfig, Linter
 from sqlfluff.core.errors import SQLFluffSkipFile
 from sqlfluff.core.linter import LintedFile, RenderedFile
+from sqlfluff.core.linter.cache import LintCache
 from sqlfluff.core.plugin.host import is_main_process
+from sqlfluff.core.rules import BaseRule
 
 linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
 
 PartialLintCallable = Callable[[], LintedFile]
 
+# Linters used when rendering in worker processes, keyed by the fingerprint
+# of the root config they were built from. These are populated by the pool
+# initializer in each worker so that individual tasks only need to carry a
+# filename and the config fingerprint.
+_worker_linters: dict[str, Linter] = {}
+
+
+def _lint_and_cache(
+    lint_cache: LintCache, key: str, partial: PartialLintCallable
+) -> LintedFile:
+    """Lint a file, and then store the result in the lint cache."""
+    linted_file = partial()
+    lint_cache.put(key, linted_file)
+    return linted_file
+
+
+def _lint_path_in_worker(fingerprint: str, fname: str, fix: bool) -> LintedFile:
+    """Load, render, parse and lint a single file within a worker.
+
+    This does all of the per-file work, including loading the file config
+    and templating, which would otherwise happen in the main process.
+    """
+    linter = _worker_linters[fingerprint]
+    lint_cache = None if fix else LintCache.from_config(linter.config)
+    if not lint_cache:
+        rendered = linter.render_file(fname, linter.config)
+        rule_pack = linter.get_rulepack(config=rendered.config)
+        return linter.lint_rendered(rendered, rule_pack, fix)
+
+    raw_file, config, encoding = linter.load_raw_file_and_config(fname, linter.config)
+    rule_pack = linter.get_rulepack(config=config)
+    key = lint_cache.make_key(fname, raw_file, config, rule_pack)
+    cached = lint_cache.get(key, fname, encoding)
+    if cached:
+        return cached
+    rendered = linter.render_string(raw_file, fname, config, encoding)
+    return _lint_and_cache(
+        lint_cache,
+        key,
+        functools.partial(linter.lint_rendered, rendered, rule_pack, fix),
+    )
+
 
 class BaseRunner(ABC):
     """Base runner class."""
@@ -63,6 +107,11 @@ class BaseRunner(ABC):
 
         Generates filenames and objects which return LintedFiles.
         """
+        lint_cache = None if fix else LintCache.from_config(self.config)
+        if lint_cache:
+            yield from self._iter_cached_partials(fnames, lint_cache)
+            return
+
         for fname, rendered in self.iter_rendered(fnames):
             # Generate a fresh ruleset
             rule_pack = self.linter.get_rulepack(config=rendered.config)
@@ -79,6 +128,55 @@ class BaseRunner(ABC):
                 ),
             )
 
+    def _iter_cached_partials(
+        self,
+        fnames: list[str],
+        lint_cache: LintCache,
+    ) -> Iterator[tuple[str, PartialLintCallable]]:
+        """Iterate through partials for linted files, using the lint cache.
+
+        Files are loaded (but not rendered) to generate their cache key. If
+        a result is already cached, then it's replayed rather than rendering,
+        parsing and linting the file again. Otherwise the result is stored in
+        the cache once it has been linted.
+        """
+        # Formatters may or may not be passed. They don't pickle
+        # nicely so aren't appropriate in a multiprocessing world.
+        formatter = self.linter.formatter if self.pass_formatter else None
+        for fname in self.linter.templater.sequence_files(
+            fnames, config=self.config, formatter=self.linter.formatter
+        ):
+            try:
+                raw_file, config, encoding = self.linter.load_raw_file_and_config(
+                    fname, self.config
+                )
+            except SQLFluffSkipFile as s:
+                linter_logger.warning(str(s))
+                continue
+            rule_pack = self.linter.get_rulepack(config=config)
+            key = lint_cache.make_key(fname, raw_file, config, rule_pack)
+            cached = lint_cache.get(key, fname, encoding)
+            if cached:
+                yield (
+                    fname,
+                    functools.partial(
+                        self.linter.replay_cached, cached, config, formatter
+                    ),
+                )
+                continue
+            rendered = self.linter.render_string(raw_file, fname, config, encoding)
+            yield (
+                fname,
+                functools.partial(
+                    _lint_and_cache,
+                    lint_cache,
+                    key,
+                    functools.partial(
+                        self.linter.lint_rendered, rendered, rule_pack, False, formatter
+                    ),
+                ),
+            )
+
     @abstractmethod
     def run(self, fnames: list[str], fix: bool) -> Iterator[LintedFile]:
         """Run linting on the specified list of files."""
@@ -98,6 +196,11 @@ class BaseRunner(ABC):
         if isinstance(e, IOError):
             # IOErrors are caught in commands.py, so propagate it
             raise (e)  # pragma: no cover
+        if isinstance(e, SQLFluffSkipFile):
+            # Files skipped while rendering in a worker come back here
+            # rather than via `iter_rendered()`, but deserve the same handling.
+            linter_logger.warning(str(e))
+            return
         linter_logger.warning(
             f"""Unable to lint {fname} due to an internal error. \
 Please report this as an issue with your query's contents and stacktrace below!
@@ -131,6 +234,34 @@ class ParallelRunner(BaseRunner):
     def __init__(self, linter: Linter, config: FluffConfig, processes: int) -> None:
         super().__init__(linter, config)
         self.processes = processes
+        self.render_in_workers: bool = config.get("render_in_workers", default=False)
+
+    def iter_worker_partials(
+        self,
+        fnames: list[str],
+        fingerprint: str,
+        fix: bool = False,
+    ) -> Iterator[tuple[str, PartialLintCallable]]:
+        """Iterate through partials which do all of their work in a worker.
+
+        Unlike `iter_partials()`, nothing is loaded or rendered in the main
+        process. Each partial carries only the filename and the fingerprint
+        of the root config, which the worker uses to look up the linter set
+        up by `_init_worker_linter()`.
+
+        The template header for each file is dispatched from here, because
+        the workers don't have the formatter. The config for the file isn't
+        loaded in this process, so any config diff for it isn't shown.
+        """
+        for fname in self.linter.templater.sequence_files(
+            fnames, config=self.config, formatter=self.linter.formatter
+        ):
+            if self.linter.formatter:
+                self.linter.formatter.dispatch_template_header(fname, self.config, None)
+            yield (
+                fname,
+                functools.partial(_lint_path_in_worker, fingerprint, fname, fix),
+            )
 
     def run(self, fnames: list[str], fix: bool) -> Iterator[LintedFile]:
         """Parallel implementation.
@@ -139,16 +270,32 @@ class ParallelRunner(BaseRunner):
         passed directly into the pool as they're ready. This means
         the main thread can do the IO work while passing the parsing
         and linting work out to the threads.
+
+        If `render_in_workers` is configured, then the main thread only
+        sequences the files, and the loading of config, templating, parsing
+        and linting all happen within the workers.
         """
+        initializer: Callable[[], None] = self._init_global
+        partials = self.iter_partials(fnames, fix=fix)
+        if self.render_in_workers:
+            fingerprint = self.config.get_fingerprint()
+            initializer = functools.partial(
+                self._init_worker_linter,
+                fingerprint,
+                self.config,
+                self.linter.user_rules,
+            )
+            partials = self.iter_worker_partials(fnames, fingerprint, fix=fix)
+
         with self._create_pool(
             self.processes,
-            self._init_global,
+            initializer,
         ) as pool:
             try:
                 for lint_result in self._map(
                     pool,
                     self._apply,
-                    self.iter_partials(fnames, fix=fix),
+                    partials,
                 ):
                     if isinstance(lint_result, DelayedException):
                         try:
@@ -194,6 +341,22 @@ class ParallelRunner(BaseRunner):
         is_main_process.set(False)
         super()._init_global()
 
+    @classmethod
+    def _init_worker_linter(
+        cls,
+        fingerprint: str,
+        config: FluffConfig,
+        user_rules: list[type[BaseRule]],
+    ) -> None:
+        """Initialise a worker which will render as well as lint files."""
+        cls._init_global()
+        linter = Linter(config=config, user_rules=user_rules)
+        if linter.templater is None:
+            # Templaters don't pickle, so when passed into a child process
+            # the config won't have one. Rehydrate it here.
+            linter.templater = config.get_templater()
+        _worker_linters[fingerprint] = linter
+
     @classmethod
     def _create_pool(
         cls, processes: int, initializer: Callable[[], None]
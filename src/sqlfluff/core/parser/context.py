@@ -55,6 +55,7 @@ class ParseContext:
         self,
         dialect: "Dialect",
         indentation_config: Optional[dict[str, Any]] = None,
+        parse_cache_max_entries: int = 0,
     ) -> None:
         """Initialize a new instance of the class.
 
@@ -63,6 +64,10 @@ class ParseContext:
             indentation_config (Optional[dict[str, Any]], optional): The indentation
                 configuration used by Indent and Dedent to control the intended
                 indentation of certain features. Defaults to None.
+            parse_cache_max_entries (int, optional): The maximum number of
+                entries in the parse cache. When the cache grows beyond this,
+                the oldest entries are evicted. Defaults to 0, which means
+                the cache is unbounded.
         """
         self.dialect = dialect
         # Indentation config is used by Indent and Dedent and used to control
@@ -76,12 +81,17 @@ class ParseContext:
         # A dict for parse caching. This is reset for each file,
         # but persists for the duration of an individual file parse.
         self._parse_cache: dict[tuple[Any, ...], "MatchResult"] = {}
+        self.parse_cache_max_entries = parse_cache_max_entries
         # A dictionary for keeping track of some statistics on parsing
         # for performance optimisation.
-        # Focused around BaseGrammar._longest_trimmed_match().
-        # Initialise only with "next_counts", the rest will be int
-        # and are dealt with in .increment().
-        self.parse_stats: dict[str, Any] = {"next_counts": defaultdict(int)}
+        # Focused around BaseGrammar._longest_trimmed_match() and the
+        # parse cache.
+        self.parse_stats: dict[str, Any] = {
+            "next_counts": defaultdict(int),
+            "parse_cache_hits": 0,
+            "parse_cache_misses": 0,
+            "parse_cache_evictions": 0,
+        }
         # The following attributes are only accessible via a copy
         # and not in the init method.
         # NOTE: We default to the name `File` which is not
@@ -127,6 +137,7 @@ class ParseContext:
         return cls(
             dialect=config.get("dialect_obj"),
             indentation_config=indentation_config,
+            parse_cache_max_entries=config.get("parse_cache_max_entries", default=0),
         )
 
     def _set_terminators(
@@ -277,6 +288,9 @@ class ParseContext:
             yield self
         finally:
             self._tqdm.close()
+            # Reset, so that the context can be used for another parse.
+            self._tqdm = None
+            self._current_char = 0
 
     def update_progress(self, char_idx: int) -> None:
         """Update the progress bar if configured.
@@ -303,10 +317,43 @@ class ParseContext:
 
         If no match is found in the cache, this returns None.
         """
-        return self._parse_cache.get((loc_key, matcher_key))
+        match = self._parse_cache.get((loc_key, matcher_key))
+        if match is None:
+            self.parse_stats["parse_cache_misses"] += 1
+        else:
+            self.parse_stats["parse_cache_hits"] += 1
+        return match
 
     def put_parse_cache(
         self, loc_key: tuple[Any, ...], matcher_key: str, match: "MatchResult"
     ) -> None:
-        """Store a match in the cache for later retrieval."""
+        """Store a match in the cache for later retrieval.
+
+        If the cache is bounded and this takes it over the limit, then the
+        oldest quarter of the entries are evicted.
+        """
         self._parse_cache[(loc_key, matcher_key)] = match
+        if 0 < self.parse_cache_max_entries < len(self._parse_cache):
+            self._evict_parse_cache()
+
+    def clear_parse_cache(self) -> None:
+        """Clear the parse cache.
+
+        This is useful when parsing a file in independent sections, where
+        entries from earlier sections won't be used again.
+        """
+        self._parse_cache = {}
+
+    def _evict_parse_cache(self) -> None:
+        """Evict the oldest entries from the parse cache.
+
+        The parser generally works forward through the file, so the oldest
+        entries are usually those for positions behind the current one,
+        which are the least likely to be needed again. Evicting entries in
+        batches, rather than one at a time, keeps the cost low.
+        """
+        keep = (self.parse_cache_max_entries * 3) // 4
+        evict = len(self._parse_cache) - keep
+        # Dicts retain insertion order, so the most recent entries are last.
+        self._parse_cache = dict(list(self._parse_cache.items())[evict:])
+        self.parse_stats["parse_cache_evictions"] += evict
@@ -199,6 +199,7 @@ class AnyNumberOf(BaseGrammar):
                     self._elements,
                     working_idx,
                     ctx,
+                    use_index=True,
                 )
 
             # Did we fail to match?
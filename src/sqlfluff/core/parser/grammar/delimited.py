@@ -150,6 +150,9 @@ class Delimited(OneOf):
                     ),
                     idx=working_idx,
                     parse_context=ctx,
+                    # The elements of the grammar are persistent, so can
+                    # use an index for pruning (but the delimiters aren't).
+                    use_index=not seeking_delimiter,
                 )
 
             if not match:
@@ -2,8 +2,9 @@
 
 import logging
 from collections.abc import Iterator
-from typing import Any, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
 from uuid import UUID, uuid4
+from weakref import WeakKeyDictionary
 
 import regex
 
@@ -25,6 +26,9 @@ from sqlfluff.core.parser.segments import (
 from sqlfluff.core.templaters import TemplatedFile
 from sqlfluff.core.templaters.base import TemplatedFileSlice
 
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlfluff.core.dialects import Dialect
+
 # Instantiate the lexer logger
 lexer_logger = logging.getLogger("sqlfluff.lexer")
 
@@ -104,12 +108,27 @@ class TemplateElement(NamedTuple):
         )
 
     def to_segment(
-        self, pos_marker: PositionMarker, subslice: Optional[slice] = None
+        self,
+        pos_marker: PositionMarker,
+        subslice: Optional[slice] = None,
+        token_cache: Optional["TokenCache"] = None,
     ) -> RawSegment:
-        """Create a segment from this lexed element."""
-        return self.matcher.construct_segment(
-            self.raw[subslice] if subslice else self.raw, pos_marker=pos_marker
-        )
+        """Create a segment from this lexed element.
+
+        If a `token_cache` is provided, then segments for tokens which have
+        been seen before (with the same matcher and raw) are cloned from the
+        first one, sharing everything except their position.
+        """
+        raw = self.raw[subslice] if subslice else self.raw
+        if token_cache is None:
+            return self.matcher.construct_segment(raw, pos_marker=pos_marker)
+        key = (self.matcher, raw)
+        prototype = token_cache.get(key)
+        if prototype is not None:
+            return prototype.clone_at(pos_marker)
+        segment = self.matcher.construct_segment(raw, pos_marker=pos_marker)
+        token_cache[key] = segment
+        return segment
 
 
 class LexMatch(NamedTuple):
@@ -124,6 +143,8 @@ class LexMatch(NamedTuple):
 
 
 LexerType = Union["RegexLexer", "StringLexer"]
+# A cache of previously lexed segments, keyed by their matcher and raw.
+TokenCache = dict[tuple["StringLexer", str], RawSegment]
 
 
 class StringLexer:
@@ -164,7 +185,15 @@ class StringLexer:
 
     def _match(self, forward_string: str) -> Optional[LexedElement]:
         """The private match function. Just look for a literal string."""
-        if forward_string.startswith(self.template):
+        return self._match_at(forward_string, 0)
+
+    def _match_at(self, string: str, pos: int) -> Optional[LexedElement]:
+        """Look for a literal string at a position within a string.
+
+        This is equivalent to `self._match(string[pos:])`, but without
+        copying the remainder of the string.
+        """
+        if string.startswith(self.template, pos):
             return LexedElement(self.template, self)
         else:
             return None
@@ -268,20 +297,26 @@ class StringLexer:
             :obj:`LexMatch`
 
         """
-        if len(forward_string) == 0:  # pragma: no cover
+        pos, new_elements = self.match_at(forward_string, 0)
+        return LexMatch(forward_string[pos:], new_elements)
+
+    def match_at(self, string: str, pos: int) -> tuple[int, list[LexedElement]]:
+        """Given a string and a position, match what we can from that position.
+
+        Returns:
+            :obj:`tuple` of the position after the match (which is unchanged
+            if there was no match) and the list of matched elements.
+
+        """
+        if pos >= len(string):  # pragma: no cover
             raise ValueError("Unexpected empty string!")
-        matched = self._match(forward_string)
+        matched = self._match_at(string, pos)
 
         if matched:
             # Handle potential subdivision elsewhere.
-            new_elements = self._subdivide(matched)
-
-            return LexMatch(
-                forward_string[len(matched.raw) :],
-                new_elements,
-            )
+            return pos + len(matched.raw), self._subdivide(matched)
         else:
-            return LexMatch(forward_string, [])
+            return pos, []
 
     def construct_segment(self, raw: str, pos_marker: PositionMarker) -> RawSegment:
         """Construct a segment using the given class a properties.
@@ -306,6 +341,115 @@ class StringLexer:
         return self.segment_class(raw=raw, pos_marker=pos_marker, **_kwargs)
 
 
+def _positional_template(template: str) -> Optional[str]:
+    r"""Adapt a regex template for matching at a position within a string.
+
+    Using `match(string, pos)` is equivalent to using `match(string[pos:])`
+    except for assertions which can see the content before `pos`. To keep
+    the same behaviour, `^` and `\A` are replaced with `\G` (which matches
+    at `pos`). Lookbehinds and word boundaries are fine once the pattern
+    has definitely consumed some content, but not before. NOTE: This
+    assumes that lookbehinds are no wider than the content before them,
+    which holds for the single character lookbehinds used in the dialects.
+    If the template can't be safely adapted, then None is returned.
+
+    >>> _positional_template(r"(^--|#)[^\n]*")
+    '(\\G--|#)[^\\n]*'
+    >>> _positional_template(r"(?>\d+|\.\d+)((?<=\.)|(?=\b))")
+    '(?>\\d+|\\.\\d+)((?<=\\.)|(?=\\b))'
+    >>> _positional_template(r"a?(?<!a)b") is None
+    True
+    """
+    # Multiline mode changes the meaning of `^`, so don't try.
+    if regex.search(r"\(\?[a-zA-Z]*m", template):
+        return None
+    buff: list[str] = []
+    # Could we still be at the start of the match (i.e. nothing consumed)?
+    at_start = True
+    # The value of `at_start` before the most recent atom, so that we can
+    # handle quantifiers which allow the atom to match nothing.
+    before_atom = True
+    # For each open group, the value of `at_start` at the start of the
+    # group, whether any finished alternatives could still be at the start,
+    # and whether it's a zero width lookaround.
+    group_stack: list[tuple[bool, bool, bool]] = []
+    idx = 0
+    while idx < len(template):
+        char = template[idx]
+        if char == "\\":
+            escape = template[idx : idx + 2]
+            if escape == "\\A":
+                buff.append("\\G")
+            elif escape in ("\\b", "\\B"):
+                if at_start:
+                    return None
+                buff.append(escape)
+            else:
+                buff.append(escape)
+                before_atom, at_start = at_start, False
+            idx += 2
+        elif char == "[":
+            # Copy the whole character class, in which `^` means negation.
+            end = idx + 1
+            if template[end : end + 1] == "^":
+                end += 1
+            if template[end : end + 1] == "]":
+                end += 1
+            while end < len(template) and template[end] != "]":
+                end += 2 if template[end] == "\\" else 1
+            buff.append(template[idx : end + 1])
+            before_atom, at_start = at_start, False
+            idx = end + 1
+        elif char == "^":
+            buff.append("\\G")
+            idx += 1
+        elif char == "(":
+            group_prefix = regex.match(
+                r"\((\?([:>=!|]|<[=!]|P?<\w+>|'\w+'|[a-zA-Z-]+[:)]))?",
+                template[idx:],
+            )
+            assert group_prefix
+            prefix = group_prefix.group(0)
+            buff.append(prefix)
+            idx += len(prefix)
+            if prefix.endswith(")"):
+                # Inline flags, which don't match anything.
+                continue
+            if prefix in ("(?<=", "(?<!") and at_start:
+                return None
+            lookaround = prefix in ("(?=", "(?!", "(?<=", "(?<!")
+            group_stack.append((at_start, False, lookaround))
+        elif char == "|":
+            buff.append(char)
+            idx += 1
+            if group_stack:
+                group_start, any_at_start, lookaround = group_stack[-1]
+                group_stack[-1] = (group_start, any_at_start or at_start, lookaround)
+                at_start = group_start
+            else:
+                # A top level alternative. Nothing has been consumed.
+                at_start = True
+        elif char == ")":
+            buff.append(char)
+            idx += 1
+            group_start, any_at_start, lookaround = group_stack.pop()
+            before_atom = group_start
+            # Lookarounds don't consume anything.
+            at_start = group_start if lookaround else any_at_start or at_start
+        elif char in "?*" or template.startswith(("{0", "{,"), idx):
+            # This quantifier means the previous atom might match nothing.
+            at_start = at_start or before_atom
+            buff.append(char)
+            idx += 1
+        else:
+            buff.append(char)
+            # Other quantifiers (and their modifiers) don't consume content.
+            if char not in "+{},0123456789":
+                before_atom, at_start = at_start, False
+            idx += 1
+    return "".join(buff)
+
+
 class RegexLexer(StringLexer):
     """This RegexLexer matches based on regular expressions."""
 
@@ -315,10 +459,22 @@ class RegexLexer(StringLexer):
         # do get matched by .
         flags = regex.DOTALL
         self._compiled_regex = regex.compile(self.template, flags)
+        # A version of the regex for matching at a position within a larger
+        # string (or None if the template can't be safely adapted for that).
+        positional_template = _positional_template(self.template)
+        self._compiled_positional_regex = (
+            regex.compile(positional_template, flags)
+            if positional_template is not None
+            else None
+        )
 
-    def _match(self, forward_string: str) -> Optional[LexedElement]:
-        """Use regexes to match chunks."""
-        match = self._compiled_regex.match(forward_string)
+    def _match_at(self, string: str, pos: int) -> Optional[LexedElement]:
+        """Use regexes to match chunks at a position within a string."""
+        if self._compiled_positional_regex is not None:
+            match = self._compiled_positional_regex.match(string, pos)
+        else:
+            # Fall back to slicing the string.
+            match = self._compiled_regex.match(string[pos:])
         if match:
             # We can only match strings with length
             match_str = match.group(0)
@@ -346,6 +502,157 @@ class RegexLexer(StringLexer):
         return None
 
 
+def _combinable_template(matcher: StringLexer) -> Optional[str]:
+    """Get a regex template for a matcher, for use in a combined regex.
+
+    Returns None if the matcher can't be safely combined with others, in
+    which case it should be matched on its own.
+    """
+    # NOTE: We check the exact types, so that subclasses which might do
+    # something different when matching aren't combined.
+    if type(matcher) is StringLexer:
+        return regex.escape(matcher.template) if matcher.template else None
+    elif type(matcher) is not RegexLexer:
+        return None
+    template = _positional_template(matcher.template)
+    if template is None:
+        return None
+    # Named groups, backreferences and conditionals would interfere with
+    # (or be affected by) the other templates in a combined regex.
+    if regex.search(r"\(\?P?[<'=]\w|\\[1-9gk]|\(\?\(", template):
+        return None
+    # Leading inline flags need to be scoped to the template.
+    flags = regex.match(r"\(\?([a-zA-Z]+)\)", template)
+    if flags:
+        template = f"(?{flags.group(1)}:{template[flags.end():]})"
+    # Flags anywhere else would apply to the whole combined regex.
+    if regex.search(r"\(\?[a-zA-Z]+\)", template):
+        return None
+    return template
+
+
+class CompiledLexer:
+    """A compiled form of a list of lexer matchers.
+
+    This gives the same results as `Lexer.lex_match_at()` but rather than
+    trying each matcher in turn for each element, consecutive matchers are
+    combined into one regex using an ordered alternation of named groups.
+    Because regex alternation tries each option in order and takes the first
+    which matches, the first matching matcher still takes precedence.
+
+    The combined regexes are compiled lazily for each first character of the
+    string being matched, so that any `StringLexer` matchers which can't
+    match starting with that character are left out.
+
+    Matchers which can't be safely combined (e.g. because of backreferences,
+    or custom matcher classes) are still tried on their own, in order.
+    """
+
+    def __init__(self, lexer_matchers: list[StringLexer]) -> None:
+        self.lexer_matchers = lexer_matchers
+        self._templates = [_combinable_template(m) for m in lexer_matchers]
+        # A lookup from first character to the plan for matching.
+        self._plans: dict[str, list[Union[StringLexer, "_CombinedMatchers"]]] = {}
+
+    def _plan(self, char: str) -> list[Union[StringLexer, "_CombinedMatchers"]]:
+        """Generate (and cache) the plan for matching a given first character."""
+        plan = self._plans.get(char)
+        if plan is not None:
+            return plan
+        plan = []
+        run: list[tuple[StringLexer, str]] = []
+        for matcher, template in zip(self.lexer_matchers, self._templates):
+            # String matchers which can't match this character can be skipped.
+            if type(matcher) is StringLexer and not matcher.template.startswith(char):
+                continue
+            if template is None:
+                if run:
+                    plan.append(_combine_run(run))
+                    run = []
+                plan.append(matcher)
+            else:
+                run.append((matcher, template))
+        if run:
+            plan.append(_combine_run(run))
+        self._plans[char] = plan
+        return plan
+
+    def match_at(self, string: str, pos: int) -> tuple[int, list[LexedElement]]:
+        """Iteratively match from a position using the compiled matchers.
+
+        Returns:
+            :obj:`tuple` of the position reached (i.e. the first position
+            which couldn't be matched, or the end of the string), and the
+            list of matched elements.
+        """
+        elem_buff: list[LexedElement] = []
+        str_len = len(string)
+        while pos < str_len:
+            for step in self._plan(string[pos]):
+                new_pos, elements = step.match_at(string, pos)
+                if elements:
+                    elem_buff += elements
+                    pos = new_pos
+                    break
+            else:
+                # We've got so far, but now can't match.
+                break
+        return pos, elem_buff
+
+
+class _CombinedMatchers:
+    """A set of consecutive lexer matchers, combined into one regex."""
+
+    def __init__(self, matchers: list[StringLexer], compiled_regex: regex.Pattern):
+        self.matchers = matchers
+        self._compiled_regex = compiled_regex
+
+    def match_at(self, string: str, pos: int) -> tuple[int, list[LexedElement]]:
+        """Match the first of the matchers which matches at a position."""
+        match = self._compiled_regex.match(string, pos)
+        if not match:
+            return pos, []
+        assert match.lastgroup
+        idx = int(match.lastgroup[2:])
+        matcher = self.matchers[idx]
+        raw = match.group(0)
+        if not raw:  # pragma: no cover
+            # Individual regex matchers don't accept zero length matches, so
+            # carry on with the rest of the matchers, one by one.
+            for matcher in self.matchers[idx + 1 :]:
+                new_pos, elements = matcher.match_at(string, pos)
+                if elements:
+                    return new_pos, elements
+            return pos, []
+        return pos + len(raw), matcher._subdivide(LexedElement(raw, matcher))
+
+
+def _combine_run(
+    run: list[tuple[StringLexer, str]],
+) -> Union[StringLexer, _CombinedMatchers]:
+    """Combine a run of matchers, or just return the matcher if only one."""
+    if len(run) == 1:
+        return run[0][0]
+    combined = "|".join(
+        f"(?P<_m{idx}>{template})" for idx, (_, template) in enumerate(run)
+    )
+    return _CombinedMatchers([m for m, _ in run], regex.compile(combined, regex.DOTALL))
+
+
+# A cache of compiled lexers for each dialect. Expanded dialects are
+# shared and treated as immutable (see `dialect_selector`).
+_compiled_lexer_cache: "WeakKeyDictionary[Dialect, CompiledLexer]" = WeakKeyDictionary()
+
+
+def get_compiled_lexer(dialect: "Dialect") -> CompiledLexer:
+    """Get the (cached) compiled lexer for a dialect."""
+    compiled = _compiled_lexer_cache.get(dialect)
+    if compiled is None:
+        compiled = CompiledLexer(dialect.get_lexer_matchers())
+        _compiled_lexer_cache[dialect] = compiled
+    return compiled
+
+
 def _handle_zero_length_slice(
     tfs: TemplatedFileSlice,
     next_tfs: Optional[TemplatedFileSlice],
@@ -488,6 +795,9 @@ def _iter_segments(
     # We keep a map of previous block locations in case they re-occur.
     block_stack = BlockTracker()
     templated_file_slices = templated_file.sliced_file
+    # Most tokens in a file are repeats (whitespace, newlines, keywords and
+    # common identifiers), so we share the content of repeated tokens.
+    token_cache: TokenCache = {}
 
     # Now work out source slices, and add in template placeholders.
     for idx, element in enumerate(lexed_elements):
@@ -566,6 +876,7 @@ def _iter_segments(
                             templated_file,
                         ),
                         subslice=slice(consumed_element_length, None),
+                        token_cache=token_cache,
                     )
 
                     # If it was an exact match, consume the templated element too.
@@ -623,6 +934,7 @@ def _iter_segments(
                                 consumed_element_length,
                                 incremental_length,
                             ),
+                            token_cache=token_cache,
                         )
                         consumed_element_length += incremental_length
                         continue
@@ -676,6 +988,7 @@ def _iter_segments(
                                 templated_file,
                             ),
                             subslice=slice(consumed_element_length, None),
+                            token_cache=token_cache,
                         )
 
                         # If it was an exact match, consume the templated element too.
@@ -739,7 +1052,14 @@ class Lexer:
         # Use the provided config or create one from the dialect.
         self.config = config or FluffConfig.from_kwargs(dialect=dialect)
         # Store the matchers
-        self.lexer_matchers = self.config.get("dialect_obj").get_lexer_matchers()
+        dialect_obj = self.config.get("dialect_obj")
+        self.lexer_matchers = dialect_obj.get_lexer_matchers()
+        # Optionally use the compiled form of the matchers.
+        self.compiled_lexer: Optional[CompiledLexer] = (
+            get_compiled_lexer(dialect_obj)
+            if self.config.get("compiled_lexer", default=False)
+            else None
+        )
 
         self.last_resort_lexer = last_resort_lexer or RegexLexer(
             "<unlexable>",
@@ -765,24 +1085,29 @@ class Lexer:
             template = raw
             str_buff = str(template)
 
-        # Lex the string to get a tuple of LexedElement
+        # Lex the string to get a tuple of LexedElement. We work through
+        # the string by position, rather than slicing off the remainder
+        # of the string after each match, which would be quadratic.
         element_buffer: list[LexedElement] = []
+        pos = 0
         while True:
-            res = self.lex_match(str_buff, self.lexer_matchers)
-            element_buffer += res.elements
-            if res.forward_string:
-                resort_res = self.last_resort_lexer.match(res.forward_string)
-                if not resort_res:  # pragma: no cover
+            if self.compiled_lexer:
+                pos, elements = self.compiled_lexer.match_at(str_buff, pos)
+            else:
+                pos, elements = self.lex_match_at(str_buff, pos, self.lexer_matchers)
+            element_buffer += elements
+            if pos < len(str_buff):
+                pos, elements = self.last_resort_lexer.match_at(str_buff, pos)
+                if not elements:  # pragma: no cover
                     # If we STILL can't match, then just panic out.
                     raise SQLLexError(
                         "Fatal. Unable to lex characters: {0!r}".format(
-                            res.forward_string[:10] + "..."
-                            if len(res.forward_string) > 9
-                            else res.forward_string
+                            str_buff[pos : pos + 10] + "..."
+                            if len(str_buff) - pos > 9
+                            else str_buff[pos:]
                         )
                     )
-                str_buff = resort_res.forward_string
-                element_buffer += resort_res.elements
+                element_buffer += elements
             else:  # pragma: no cover TODO?
                 break
 
@@ -845,22 +1170,37 @@ class Lexer:
     @staticmethod
     def lex_match(forward_string: str, lexer_matchers: list[StringLexer]) -> LexMatch:
         """Iteratively match strings using the selection of submatchers."""
+        pos, elem_buff = Lexer.lex_match_at(forward_string, 0, lexer_matchers)
+        return LexMatch(forward_string[pos:], elem_buff)
+
+    @staticmethod
+    def lex_match_at(
+        string: str, pos: int, lexer_matchers: list[StringLexer]
+    ) -> tuple[int, list[LexedElement]]:
+        """Iteratively match from a position using the selection of submatchers.
+
+        Returns:
+            :obj:`tuple` of the position reached (i.e. the first position
+            which couldn't be matched, or the end of the string), and the
+            list of matched elements.
+        """
         elem_buff: list[LexedElement] = []
+        str_len = len(string)
         while True:
-            if len(forward_string) == 0:
-                return LexMatch(forward_string, elem_buff)
+            if pos >= str_len:
+                return pos, elem_buff
             for matcher in lexer_matchers:
-                res = matcher.match(forward_string)
-                if res.elements:
+                new_pos, elements = matcher.match_at(string, pos)
+                if elements:
                     # If we have new segments then whoop!
-                    elem_buff += res.elements
-                    forward_string = res.forward_string
+                    elem_buff += elements
+                    pos = new_pos
                     # Cycle back around again and start with the top
                     # matcher again.
                     break
             else:
                 # We've got so far, but now can't match. Return
-                return LexMatch(forward_string, elem_buff)
+                return pos, elem_buff
 
     @staticmethod
     def map_template_slices(
@@ -3,7 +3,7 @@
 This class is a construct to keep track of positions within a file.
 """
 
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
 from typing import TYPE_CHECKING, Any, Optional
 
 from sqlfluff.core.helpers.slice import zero_slice
@@ -12,7 +12,6 @@ if TYPE_CHECKING:
     from sqlfluff.core.templaters import TemplatedFile  # pragma: no cover
 
 
-@dataclass(frozen=True)
 class PositionMarker:
     """A reference to a position in a file.
 
@@ -27,25 +26,107 @@ class PositionMarker:
         - Positions within the fixed file are identified with a line number and line
           position, which identify a point.
         - Arithmetic comparisons are on the location in the fixed file.
+
+    There is one of these for every segment in a parsed file, and so to keep
+    them compact, they use `__slots__` and store the positions in the source
+    and templated files as integer offsets. The `source_slice` and
+    `templated_slice` are created from these as required. Position markers
+    are immutable.
     """
 
-    source_slice: slice
-    templated_slice: slice
+    __slots__ = (
+        "_source_start",
+        "_source_stop",
+        "_templated_start",
+        "_templated_stop",
+        "templated_file",
+        "working_line_no",
+        "working_line_pos",
+    )
+
+    _source_start: int
+    _source_stop: int
+    _templated_start: int
+    _templated_stop: int
     templated_file: "TemplatedFile"
-    # If not set, these will be initialised in the post init.
-    working_line_no: int = -1
-    working_line_pos: int = -1
+    working_line_no: int
+    working_line_pos: int
 
-    def __post_init__(self) -> None:
+    def __init__(
+        self,
+        source_slice: slice,
+        templated_slice: slice,
+        templated_file: "TemplatedFile",
+        # If not set, these will be inferred from the templated file.
+        working_line_no: int = -1,
+        working_line_pos: int = -1,
+    ) -> None:
+        # Use the base method because the class is immutable.
+        _set = object.__setattr__
+        _set(self, "_source_start", source_slice.start)
+        _set(self, "_source_stop", source_slice.stop)
+        _set(self, "_templated_start", templated_slice.start)
+        _set(self, "_templated_stop", templated_slice.stop)
+        _set(self, "templated_file", templated_file)
         # If the working position has not been explicitly set
         # then infer it from the position in the templated file.
         # This is accurate up until the point that any fixes have
         # been applied.
-        if self.working_line_no == -1 or self.working_line_pos == -1:
-            line_no, line_pos = self.templated_position()
-            # Use the base method because we're working with a frozen class
-            object.__setattr__(self, "working_line_no", line_no)
-            object.__setattr__(self, "working_line_pos", line_pos)
+        if working_line_no == -1 or working_line_pos == -1:
+            working_line_no, working_line_pos = self.templated_position()
+        _set(self, "working_line_no", working_line_no)
+        _set(self, "working_line_pos", working_line_pos)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # NOTE: The default pickling of slots would need `__setattr__`.
+        return (
+            self.__class__,
+            (
+                self.source_slice,
+                self.templated_slice,
+                self.templated_file,
+                self.working_line_no,
+                self.working_line_pos,
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(source_slice={self.source_slice!r}, "
+            f"templated_slice={self.templated_slice!r}, "
+            f"templated_file={self.templated_file!r}, "
+            f"working_line_no={self.working_line_no!r}, "
+            f"working_line_pos={self.working_line_pos!r})"
+        )
+
+    def __hash__(self) -> int:
+        return hash(
+            (
+                self._source_start,
+                self._source_stop,
+                self._templated_start,
+                self._templated_stop,
+                self.templated_file,
+                self.working_line_no,
+                self.working_line_pos,
+            )
+        )
+
+    @property
+    def source_slice(self) -> slice:
+        """The slice of the source file for this position."""
+        return slice(self._source_start, self._source_stop)
+
+    @property
+    def templated_slice(self) -> slice:
+        """The slice of the templated file for this position."""
+        return slice(self._templated_start, self._templated_stop)
 
     def __str__(self) -> str:
         return self.to_source_string()
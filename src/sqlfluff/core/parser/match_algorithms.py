@@ -6,7 +6,8 @@ or BaseGrammar to un-bloat those classes.
 
 from collections import defaultdict
 from collections.abc import Sequence
-from typing import DefaultDict, Optional, cast
+from typing import TYPE_CHECKING, DefaultDict, Optional, cast
+from weakref import WeakKeyDictionary
 
 from sqlfluff.core.errors import SQLParseError
 from sqlfluff.core.parser.context import ParseContext
@@ -14,6 +15,9 @@ from sqlfluff.core.parser.match_result import MatchResult
 from sqlfluff.core.parser.matchable import Matchable
 from sqlfluff.core.parser.segments import BaseSegment, BracketedSegment, Dedent, Indent
 
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlfluff.core.dialects import Dialect
+
 
 def skip_start_index_forward_to_code(
     segments: Sequence[BaseSegment], start_idx: int, max_idx: Optional[int] = None
@@ -78,20 +82,102 @@ def first_non_whitespace(
     return None
 
 
+class PruneIndex:
+    """A precomputed index for pruning a sequence of options.
+
+    This gives the same result as the loop in `prune_options()`, but rather
+    than evaluating the simple hints of every option on each call, the
+    positions of the options which could match are indexed by their simple
+    raws and types. The pruned options for a given first raw and set of
+    types are then cached, so that for large grammars (e.g. the options
+    for a statement) pruning becomes a dictionary lookup.
+
+    Options without simple hints are always included.
+    """
+
+    def __init__(
+        self, options: Sequence[Matchable], parse_context: ParseContext
+    ) -> None:
+        self.options = options
+        self._always: list[int] = []
+        self._by_raw: DefaultDict[str, list[int]] = defaultdict(list)
+        self._by_type: DefaultDict[str, list[int]] = defaultdict(list)
+        for opt_idx, opt in enumerate(options):
+            simple = opt.simple(parse_context=parse_context)
+            if simple is None:
+                self._always.append(opt_idx)
+                continue
+            simple_raws, simple_types = simple
+            for raw in simple_raws:
+                self._by_raw[raw].append(opt_idx)
+            for _type in simple_types:
+                self._by_type[_type].append(opt_idx)
+        self._pruned: dict[tuple[Optional[str], frozenset[str]], list[Matchable]] = {}
+
+    def prune(self, first_raw: str, first_types: frozenset[str]) -> list[Matchable]:
+        """Get the options which could match a given first raw and types."""
+        # Raws which don't appear in any of the options are all equivalent,
+        # so they share a key. That keeps the cache small for identifiers.
+        key = (first_raw if first_raw in self._by_raw else None, first_types)
+        pruned = self._pruned.get(key)
+        if pruned is None:
+            positions = set(self._always)
+            positions.update(self._by_raw.get(first_raw, ()))
+            for _type in first_types:
+                positions.update(self._by_type.get(_type, ()))
+            pruned = [self.options[opt_idx] for opt_idx in sorted(positions)]
+            self._pruned[key] = pruned
+        return list(pruned)
+
+
+# A cache of prune indexes for each dialect, keyed by the `id()` of the
+# sequence of options. Expanded dialects are shared and treated as
+# immutable (see `dialect_selector`), as are the grammars within them.
+_prune_index_cache: "WeakKeyDictionary[Dialect, dict[int, PruneIndex]]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_prune_index(
+    options: Sequence[Matchable], parse_context: ParseContext
+) -> Optional[PruneIndex]:
+    """Get the (cached) prune index for a sequence of options.
+
+    The index is only cached for expanded dialects, because the simple
+    hints of the options may change if an unexpanded dialect is altered.
+    Otherwise returns None.
+    """
+    dialect = parse_context.dialect
+    if not dialect or not dialect.expanded:
+        return None
+    indexes = _prune_index_cache.get(dialect)
+    if indexes is None:
+        indexes = _prune_index_cache[dialect] = {}
+    index = indexes.get(id(options))
+    # NOTE: The index holds a reference to the options, so as long as the
+    # index exists, its id can't be reused by a different sequence.
+    if index is None or index.options is not options:
+        index = indexes[id(options)] = PruneIndex(options, parse_context)
+    return index
+
+
 def prune_options(
     options: Sequence[Matchable],
     segments: Sequence[BaseSegment],
     parse_context: ParseContext,
     start_idx: int = 0,
+    use_index: bool = False,
 ) -> list[Matchable]:
     """Use the simple matchers to prune which options to match on.
 
     Works in the context of a grammar making choices between options
     such as AnyOf or the content of Delimited.
-    """
-    available_options = []
-    prune_buff = []
 
+    If `use_index` is set, then a cached `PruneIndex` is used for the
+    options. This should only be set if the sequence of options is
+    persistent (e.g. the elements of a grammar in the dialect) rather
+    than being created for each call, otherwise the cache will grow.
+    """
     # Find the first code element to match against.
     first = first_non_whitespace(segments, start_idx=start_idx)
     # If we don't have an appropriate option to match against,
@@ -100,6 +186,14 @@ def prune_options(
         return list(options)
     first_raw, first_types = first
 
+    if use_index:
+        index = get_prune_index(options, parse_context)
+        if index:
+            return index.prune(first_raw, first_types)
+
+    available_options = []
+    prune_buff = []
+
     for opt in options:
         simple = opt.simple(parse_context=parse_context)
         if simple is None:
@@ -142,6 +236,7 @@ def longest_match(
     matchers: Sequence[Matchable],
     idx: int,
     parse_context: ParseContext,
+    use_index: bool = False,
 ) -> tuple[MatchResult, Optional[Matchable]]:
     """Return longest match from a selection of matchers.
 
@@ -166,7 +261,9 @@ def longest_match(
     The things which determine the performance of this method are:
     1. Pruning. This method uses `prune_options()` to filter down which matchable
         options proceed to the full matching step. Ideally only very few do and this
-        can handle the majority of the filtering.
+        can handle the majority of the filtering. For persistent sequences of
+        matchers (i.e. the elements of a grammar), set `use_index` so that
+        the pruning uses a cached `PruneIndex`.
     2. Caching. This method uses the parse cache (`check_parse_cache` and
         `put_parse_cache`) on the ParseContext to speed up repetitive matching
         operations. As we make progress through a file there will often not be a
@@ -192,7 +289,11 @@ def longest_match(
     # some complexity from this function so that we just take the first segment.
     # Maybe that's just small potatoes though.
     available_options = prune_options(
-        matchers, segments, parse_context=parse_context, start_idx=idx
+        matchers,
+        segments,
+        parse_context=parse_context,
+        start_idx=idx,
+        use_index=use_index,
     )
 
     # If no available options, return no match.
@@ -1,6 +1,8 @@
 """Defines the Parser class."""
 
-from collections.abc import Sequence
+import multiprocessing
+import signal
+from collections.abc import Iterator, Sequence
 from typing import TYPE_CHECKING, Optional
 
 from sqlfluff.core.config import FluffConfig
@@ -8,8 +10,37 @@ from sqlfluff.core.parser.context import ParseContext
 from sqlfluff.core.parser.helpers import check_still_complete
 
 if TYPE_CHECKING:  # pragma: no cover
+    from sqlfluff.core.parser.match_result import MatchResult
     from sqlfluff.core.parser.segments import BaseFileSegment, BaseSegment
 
+# The minimum number of statements for each process when parsing a file in
+# parallel. Starting the processes is relatively expensive, so there's no
+# benefit for smaller files.
+MIN_STATEMENTS_PER_PROCESS = 50
+
+# The root segment and parse context in each parsing worker process.
+_worker_state: Optional[tuple[type["BaseFileSegment"], ParseContext]] = None
+
+
+def _init_parse_worker(config: FluffConfig) -> None:  # pragma: no cover
+    """Set up a worker process for parsing chunks of a file."""
+    global _worker_state
+    _worker_state = (
+        config.get("dialect_obj").get_root_segment(),
+        ParseContext.from_config(config=config),
+    )
+    # Let the parent process handle keyboard interrupts (as in the runner).
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _match_chunk(
+    chunk: tuple[tuple["BaseSegment", ...], int, int],
+) -> "MatchResult":  # pragma: no cover
+    """Match a chunk of a file in a worker process."""
+    assert _worker_state, "Parse worker not initialised."
+    root_segment, ctx = _worker_state
+    return next(root_segment.match_chunks([chunk], ctx))
+
 
 class Parser:
     """Instantiates parsed queries from a sequence of lexed raw segments."""
@@ -27,6 +58,52 @@ class Parser:
             "dialect_obj"
         ).get_root_segment()
 
+    def _parse_processes(self, num_chunks: int) -> int:
+        """How many processes should be used to parse a file in chunks?
+
+        This is set by the `parse_processes` config value, but limited so
+        that each process has enough chunks to make it worthwhile. Parsing
+        in parallel is only done from the main process, so that it isn't
+        attempted from the worker processes when linting in parallel.
+        """
+        processes: int = self.config.get("parse_processes", default=1)
+        if processes <= 0:
+            processes = max(multiprocessing.cpu_count() + processes, 1)
+        if multiprocessing.parent_process() is not None:
+            return 1
+        return min(processes, num_chunks // MIN_STATEMENTS_PER_PROCESS)
+
+    def _match_chunks(
+        self,
+        chunks: Sequence[tuple[tuple["BaseSegment", ...], int, int]],
+        parse_context: ParseContext,
+    ) -> Iterator["MatchResult"]:
+        """Match chunks of a file, in parallel if configured.
+
+        In parallel, the chunks are sent to the worker processes which
+        return the matches, rather than the parsed segments. The matches
+        are applied to the original segments in this process, so that
+        the resulting tree still references the original templated file.
+        """
+        processes = self._parse_processes(len(chunks))
+        if processes <= 1:
+            yield from self.RootSegment.match_chunks(chunks, parse_context)
+            return
+
+        parse_context.logger.info(
+            "Parsing %s chunks with %s processes.", len(chunks), processes
+        )
+        # NOTE: This uses the "spawn" method for the same reasons as
+        # the runner (see `MultiProcessRunner`).
+        with multiprocessing.get_context("spawn").Pool(
+            processes, initializer=_init_parse_worker, initargs=(self.config,)
+        ) as pool:
+            # Send the chunks in batches, so that the templated file which
+            # the segments reference is only pickled once for each batch.
+            yield from pool.imap(
+                _match_chunk, chunks, chunksize=max(len(chunks) // processes // 4, 1)
+            )
+
     def parse(
         self,
         segments: Sequence["BaseSegment"],
@@ -47,9 +124,19 @@ class Parser:
         # Kick off parsing with the root segment. The BaseFileSegment has
         # a unique entry point to facilitate exactly this. All other segments
         # will use the standard .match() route.
-        root = self.RootSegment.root_parse(
-            tuple(segments), fname=fname, parse_context=ctx
-        )
+        root: Optional["BaseFileSegment"] = None
+        if self.config.get("parse_by_statement", default=False):
+            # Optionally try parsing each statement independently first.
+            root = self.RootSegment.root_parse_statements(
+                tuple(segments),
+                fname=fname,
+                parse_context=ctx,
+                match_chunks=lambda chunks: self._match_chunks(chunks, ctx),
+            )
+        if not root:
+            root = self.RootSegment.root_parse(
+                tuple(segments), fname=fname, parse_context=ctx
+            )
 
         # Basic Validation, that we haven't dropped anything.
         check_still_complete(tuple(segments), (root,), ())
@@ -12,8 +12,9 @@ Here we define:
 from __future__ import annotations
 
 import logging
+import threading
 import weakref
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from functools import cached_property
 from io import StringIO
@@ -85,6 +86,44 @@ class PathStep:
     code_idxs: tuple[int, ...]
 
 
+# Each segment type is assigned a bit, so that sets of types can be held
+# as integer bitmasks, which are much faster to combine and compare than
+# sets of strings. Bits are assigned in the order that types are first
+# seen, so masks are only meaningful within the current process.
+_type_bits: dict[str, int] = {}
+_type_names: list[str] = []
+_type_bits_lock = threading.Lock()
+
+
+def type_mask(types: Iterable[str]) -> int:
+    """Get the bitmask for a collection of segment types.
+
+    Any types which haven't been seen before are assigned a new bit.
+    """
+    mask = 0
+    for seg_type in types:
+        bit = _type_bits.get(seg_type)
+        if bit is None:
+            with _type_bits_lock:
+                bit = _type_bits.get(seg_type)
+                if bit is None:
+                    bit = _type_bits[seg_type] = 1 << len(_type_names)
+                    _type_names.append(seg_type)
+        mask |= bit
+    return mask
+
+
+def type_names(mask: int) -> frozenset[str]:
+    """Get the set of segment types from a bitmask."""
+    names = []
+    while mask:
+        # Isolate the lowest set bit.
+        bit = mask & -mask
+        names.append(_type_names[bit.bit_length() - 1])
+        mask ^= bit
+    return frozenset(names)
+
+
 def _iter_base_types(
     new_type: Optional[str], bases: tuple[type[BaseSegment]]
 ) -> Iterator[str]:
@@ -135,6 +174,7 @@ class SegmentMetaclass(type, Matchable):
         # Populate the `_class_types` property on creation.
         added_type = class_dict.get("type", None)
         class_dict["_class_types"] = frozenset(_iter_base_types(added_type, bases))
+        class_dict["_class_type_mask"] = type_mask(class_dict["_class_types"])
         return cast(type["BaseSegment"], type.__new__(mcs, name, bases, class_dict))
 
 
@@ -159,6 +199,7 @@ class BaseSegment(metaclass=SegmentMetaclass):
     # `type` should be the *category* of this kind of segment
     type: ClassVar[str] = "base"
     _class_types: ClassVar[frozenset[str]]  # NOTE: Set by SegmentMetaclass
+    _class_type_mask: ClassVar[int]  # NOTE: Set by SegmentMetaclass
     # We define the type here but no value. Subclasses must provide a value.
     match_grammar: Matchable
     comment_separate = False
@@ -268,6 +309,16 @@ class BaseSegment(metaclass=SegmentMetaclass):
         s = self.__dict__.copy()
         # Kill the parent ref. It won't pickle well.
         s["_parent"] = None
+        # Type masks are specific to this process, so they're recalculated
+        # after unpickling.
+        s.pop("class_type_mask", None)
+        s.pop("descendant_type_mask", None)
+        s.pop("direct_descendant_type_mask", None)
+        # The type index of a file segment is keyed on the ids of the
+        # segments, which won't be the same after unpickling.
+        s.pop("type_index", None)
+        # Any analysis isn't worth sending to another process.
+        s.pop("analysis_cache", None)
         return s
 
     def __setstate__(self, state: dict[str, Any]) -> None:
@@ -326,29 +377,66 @@ class BaseSegment(metaclass=SegmentMetaclass):
         # custom.
         return self._class_types
 
+    @property
+    def class_type_mask(self) -> int:
+        """The bitmask of types for this segment (see `type_mask()`)."""
+        return self._class_type_mask
+
     @cached_property
-    def descendant_type_set(self) -> frozenset[str]:
-        """The set of all contained types.
+    def descendant_type_mask(self) -> int:
+        """The bitmask of all contained types (see `type_mask()`).
 
         This is used for rule crawling.
 
         NOTE: Does not include the types of the parent segment itself.
         """
-        return frozenset(
-            chain.from_iterable(
-                seg.descendant_type_set | seg.class_types for seg in self.segments
-            )
-        )
+        mask = 0
+        for seg in self.segments:
+            mask |= seg.descendant_type_mask | seg.class_type_mask
+        return mask
 
     @cached_property
-    def direct_descendant_type_set(self) -> set[str]:
-        """The set of all directly child types.
+    def direct_descendant_type_mask(self) -> int:
+        """The bitmask of all directly child types (see `type_mask()`).
 
         This is used for rule crawling.
 
         NOTE: Does not include the types of the parent segment itself.
         """
-        return set(chain.from_iterable(seg.class_types for seg in self.segments))
+        mask = 0
+        for seg in self.segments:
+            mask |= seg.class_type_mask
+        return mask
+
+    @cached_property
+    def descendant_type_set(self) -> frozenset[str]:
+        """The set of all contained types.
+
+        NOTE: Does not include the types of the parent segment itself.
+        """
+        return type_names(self.descendant_type_mask)
+
+    @cached_property
+    def direct_descendant_type_set(self) -> set[str]:
+        """The set of all directly child types.
+
+        NOTE: Does not include the types of the parent segment itself.
+        """
+        return set(type_names(self.direct_descendant_type_mask))
+
+    @cached_property
+    def analysis_cache(self) -> dict[Any, Any]:
+        """Storage for the results of analysing this segment.
+
+        Several rules need the same analysis of a segment (e.g. the aliases
+        and references of a SELECT), so it's stored here to share it between
+        them. Any unchanged segments are shared between versions of the tree
+        when fixing, and so their analysis is shared too. Like the other
+        cached properties, it's reset if the segments change.
+
+        NOTE: The results are shared, so they shouldn't be modified.
+        """
+        return {}
 
     @cached_property
     def raw_upper(self) -> str:
@@ -504,9 +592,13 @@ class BaseSegment(metaclass=SegmentMetaclass):
                 segment.raw, line_no, line_pos
             )
 
-            # NOTE: If the position is already correct, we still
-            # need to copy, but we don't need to reposition any further.
-            if segment.segments and old_position != new_position:
+            # NOTE: If the position is already correct, then neither the
+            # segment nor any of its children need repositioning, so we
+            # can reuse it rather than copying it.
+            if old_position and old_position == new_position:
+                segment_buffer += (segment,)
+                continue
+            elif segment.segments:
                 # Recurse to work out the child segments FIRST, before
                 # copying the parent so we don't double the work.
                 assert new_position
@@ -661,6 +753,9 @@ class BaseSegment(metaclass=SegmentMetaclass):
             "full_type_set",
             "descendant_type_set",
             "direct_descendant_type_set",
+            "descendant_type_mask",
+            "direct_descendant_type_mask",
+            "analysis_cache",
             "_code_indices",
             "_hash",
         ]:
@@ -721,9 +816,16 @@ class BaseSegment(metaclass=SegmentMetaclass):
         if not self._parent:
             return None
         _parent = self._parent()
-        if not _parent or self not in _parent.segments:
+        if not _parent:
             return None
         assert self._parent_idx is not None
+        # Check the stored index first, which avoids comparing this segment
+        # with all of its siblings (which can be very slow).
+        _segments = _parent.segments
+        if self._parent_idx < len(_segments) and _segments[self._parent_idx] is self:
+            return _parent, self._parent_idx
+        if self not in _segments:
+            return None
         return _parent, self._parent_idx
 
     def get_type(self) -> str:
@@ -898,6 +1000,7 @@ class BaseSegment(metaclass=SegmentMetaclass):
         # If segments were provided, use them.
         elif segments:
             new_segment.segments = segments
+            new_segment.set_as_parent(recurse=False)
         # Otherwise we should handle recursive segment coping.
         # We use the native .copy() method (this method!) appropriately
         # so that the same logic is applied in recursion.
@@ -1026,6 +1129,27 @@ class BaseSegment(metaclass=SegmentMetaclass):
         if isinstance(no_recursive_seg_type, str):
             no_recursive_seg_type = [no_recursive_seg_type]
 
+        yield from self._recursive_crawl(
+            seg_type,
+            type_mask(seg_type),
+            recurse_into,
+            no_recursive_seg_type,
+            allow_self,
+        )
+
+    def _recursive_crawl(
+        self,
+        seg_type: tuple[str, ...],
+        seg_type_mask: int,
+        recurse_into: bool,
+        no_recursive_seg_type: Optional[list[str]],
+        allow_self: bool = True,
+    ) -> Iterator[BaseSegment]:
+        """Recursively crawl for segments of a given type.
+
+        This is the implementation of `recursive_crawl()`, with the
+        bitmask of the types calculated once in advance.
+        """
         # Assuming there is a segment to be found, first check self (if allowed):
         if allow_self and self.is_type(*seg_type):
             match = True
@@ -1035,7 +1159,7 @@ class BaseSegment(metaclass=SegmentMetaclass):
 
         # Check whether the types we're looking for are in this segment
         # at all. If not, exit early.
-        if not self.descendant_type_set.intersection(seg_type):
+        if not self.descendant_type_mask & seg_type_mask:
             # Terminate iteration.
             return None
 
@@ -1047,10 +1171,11 @@ class BaseSegment(metaclass=SegmentMetaclass):
                 # NOTE: Setting no_recursive_seg_type can significantly
                 # improve performance in many cases.
                 if not no_recursive_seg_type or not seg.is_type(*no_recursive_seg_type):
-                    yield from seg.recursive_crawl(
-                        *seg_type,
-                        recurse_into=recurse_into,
-                        no_recursive_seg_type=no_recursive_seg_type,
+                    yield from seg._recursive_crawl(
+                        seg_type,
+                        seg_type_mask,
+                        recurse_into,
+                        no_recursive_seg_type,
                     )
 
     def path_to(self, other: BaseSegment) -> list[PathStep]:
@@ -1179,9 +1304,20 @@ class BaseSegment(metaclass=SegmentMetaclass):
     def validate_segment_with_reparse(
         self,
         dialect: Dialect,
+        parse_context: Optional[ParseContext] = None,
     ) -> bool:
-        """Checks correctness of new segment by re-parsing it."""
-        ctx = ParseContext(dialect=dialect)
+        """Checks correctness of new segment by re-parsing it.
+
+        Optionally an existing `parse_context` can be provided, to avoid
+        setting up a new one for each check. Its parse cache is cleared
+        first, because the cached matches are for a different sequence
+        of segments.
+        """
+        if parse_context:
+            parse_context.clear_parse_cache()
+            ctx = parse_context
+        else:
+            ctx = ParseContext(dialect=dialect)
         # We're going to check the rematch without any metas because the
         # matching routines will assume they haven't already been added.
         # We also strip any non-code from the ends which might have moved.
@@ -1,11 +1,25 @@
 """Definition of the BaseFileSegment."""
 
 from abc import abstractmethod
-from typing import Optional
+from collections.abc import Iterator, Sequence
+from functools import cached_property
+from typing import Callable, Optional, Union
 
 from sqlfluff.core.parser.context import ParseContext
 from sqlfluff.core.parser.markers import PositionMarker
-from sqlfluff.core.parser.segments.base import BaseSegment, UnparsableSegment
+from sqlfluff.core.parser.match_result import MatchResult
+from sqlfluff.core.parser.segments.base import (
+    BaseSegment,
+    PathStep,
+    UnparsableSegment,
+)
+from sqlfluff.core.parser.segments.type_index import SegmentTypeIndex
+
+# A callable to match a sequence of chunks of a file (as tuples of the
+# segments and the start and end indices of the code within them).
+ChunkMatcher = Callable[
+    [Sequence[tuple[tuple[BaseSegment, ...], int, int]]], Iterator[MatchResult]
+]
 
 
 class BaseFileSegment(BaseSegment):
@@ -36,23 +50,86 @@ class BaseFileSegment(BaseSegment):
         """File path of a parsed SQL file."""
         return self._file_path
 
+    @cached_property
+    def type_index(self) -> SegmentTypeIndex:
+        """An index of all the segments in the file, by type.
+
+        This is built on first use, and then reused for any searches of the
+        file until the tree changes.
+        """
+        return SegmentTypeIndex(self)
+
+    def _recalculate_caches(self) -> None:
+        super()._recalculate_caches()
+        self.__dict__.pop("type_index", None)
+
+    def recursive_crawl(
+        self,
+        *seg_type: str,
+        recurse_into: bool = True,
+        no_recursive_seg_type: Optional[Union[str, list[str]]] = None,
+        allow_self: bool = True,
+    ) -> Iterator[BaseSegment]:
+        """Recursively crawl for segments of a given type.
+
+        This has the same behaviour as `BaseSegment.recursive_crawl()`, but
+        uses the `type_index` rather than walking the tree.
+        """
+        if isinstance(no_recursive_seg_type, str):
+            no_recursive_seg_type = [no_recursive_seg_type]
+
+        if allow_self and self.is_type(*seg_type):
+            yield self
+            if not recurse_into:
+                return None
+
+        for entry in self.type_index.select(
+            seg_type,
+            block_types=no_recursive_seg_type or (),
+            recurse_into=recurse_into,
+        ):
+            yield entry.segment
+
+    def path_to(self, other: BaseSegment) -> list[PathStep]:
+        """Get the path from the file to a segment within it.
+
+        This has the same behaviour as `BaseSegment.path_to()`, but uses
+        the positions of the segments recorded in the `type_index` rather
+        than following (or searching for) the parents of `other`.
+        """
+        entry = self.type_index.get_entry(other)
+        # If the segment isn't in the index, then fall back to a search.
+        if not entry or entry.segment is not other:
+            return super().path_to(other)
+
+        path = []
+        parent: BaseSegment = self
+        for segment in entry.parent_stack + (other,):
+            segment_entry = self.type_index.get_entry(segment)
+            assert segment_entry
+            path.append(
+                PathStep(
+                    parent,
+                    segment_entry.idx,
+                    len(parent.segments),
+                    parent._code_indices,
+                )
+            )
+            parent = segment
+        return path
+
     @abstractmethod
     def get_table_references(self) -> set[str]:
         """Use parsed tree to extract table references."""
 
-    @classmethod
-    def root_parse(
-        cls,
-        segments: tuple[BaseSegment, ...],
-        parse_context: ParseContext,
-        fname: Optional[str] = None,
-    ) -> "BaseFileSegment":
-        """This is the entry method into parsing a file lexed segments.
-
-        For single pass matching, this trims any non code off
-        the start, matches the middle and then trims the end.
+    @staticmethod
+    def _trim_non_code(segments: tuple[BaseSegment, ...]) -> tuple[int, int]:
+        """Find the indices of the first and last code segments.
 
-        Anything unexpected at the end is regarded as unparsable.
+        Returns:
+            :obj:`tuple` of the index of the first code segment, and the
+            index after the last code segment. If there are no code
+            segments then these will be equal.
         """
         # Trim the start
         _start_idx = 0
@@ -66,36 +143,52 @@ class BaseFileSegment(BaseSegment):
             if segments[_end_idx - 1].is_code:
                 break
 
-        if _start_idx == _end_idx:
-            # Return just a file of non-code segments.
-            return cls(segments, fname=fname)
+        return _start_idx, _end_idx
+
+    @classmethod
+    def root_match(
+        cls,
+        segments: tuple[BaseSegment, ...],
+        start_idx: int,
+        end_idx: int,
+        parse_context: ParseContext,
+    ) -> MatchResult:
+        """Match the code section of a sequence of segments.
 
-        # Match the middle
+        The code section should already have been trimmed of any non-code
+        at the start and end (i.e. using `_trim_non_code()`).
+        """
         assert not hasattr(
             cls, "parse_grammar"
         ), "`parse_grammar` is deprecated on FileSegment."
         assert cls.match_grammar
 
-        # Set up the progress bar for parsing.
-        _final_seg = segments[-1]
-        assert _final_seg.pos_marker
-        _closing_position = _final_seg.pos_marker.templated_slice.stop
-        with parse_context.progress_bar(_closing_position):
-            # NOTE: Don't call .match() on the segment class itself, but go
-            # straight to the match grammar inside.
-            match = cls.match_grammar.match(
-                segments[:_end_idx], _start_idx, parse_context
-            )
+        # NOTE: Don't call .match() on the segment class itself, but go
+        # straight to the match grammar inside.
+        match = cls.match_grammar.match(segments[:end_idx], start_idx, parse_context)
 
         parse_context.logger.info("Root Match:\n%s", match.stringify())
+        return match
+
+    @classmethod
+    def _apply_root_match(
+        cls,
+        segments: tuple[BaseSegment, ...],
+        start_idx: int,
+        end_idx: int,
+        match: MatchResult,
+    ) -> tuple[BaseSegment, ...]:
+        """Apply the match of the code section of a sequence of segments.
+
+        Anything unexpected at the end is regarded as unparsable.
+        """
         _matched = match.apply(segments)
-        _unmatched = segments[match.matched_slice.stop : _end_idx]
+        _unmatched = segments[match.matched_slice.stop : end_idx]
 
-        content: tuple[BaseSegment, ...]
         if not match:
-            content = (
+            return (
                 UnparsableSegment(
-                    segments[_start_idx:_end_idx], expected=str(cls.match_grammar)
+                    segments[start_idx:end_idx], expected=str(cls.match_grammar)
                 ),
             )
         elif _unmatched:
@@ -103,7 +196,7 @@ class BaseFileSegment(BaseSegment):
             for _idx in range(len(_unmatched)):
                 if _unmatched[_idx].is_code:
                     break
-            content = (
+            return (
                 _matched
                 + _unmatched[:_idx]
                 + (
@@ -112,10 +205,201 @@ class BaseFileSegment(BaseSegment):
                     ),
                 )
             )
-        else:
-            content = _matched + _unmatched
+        return _matched + _unmatched
+
+    @classmethod
+    def root_parse(
+        cls,
+        segments: tuple[BaseSegment, ...],
+        parse_context: ParseContext,
+        fname: Optional[str] = None,
+    ) -> "BaseFileSegment":
+        """This is the entry method into parsing a file lexed segments.
+
+        For single pass matching, this trims any non code off
+        the start, matches the middle and then trims the end.
+
+        Anything unexpected at the end is regarded as unparsable.
+        """
+        _start_idx, _end_idx = cls._trim_non_code(segments)
+
+        if _start_idx == _end_idx:
+            # Return just a file of non-code segments.
+            return cls(segments, fname=fname)
+
+        # Set up the progress bar for parsing.
+        _final_seg = segments[-1]
+        assert _final_seg.pos_marker
+        _closing_position = _final_seg.pos_marker.templated_slice.stop
+        with parse_context.progress_bar(_closing_position):
+            match = cls.root_match(segments, _start_idx, _end_idx, parse_context)
+        content = cls._apply_root_match(segments, _start_idx, _end_idx, match)
 
         return cls(
             segments[:_start_idx] + content + segments[_end_idx:],
             fname=fname,
         )
+
+    @classmethod
+    def match_chunks(
+        cls,
+        chunks: Sequence[tuple[tuple[BaseSegment, ...], int, int]],
+        parse_context: ParseContext,
+    ) -> Iterator[MatchResult]:
+        """Match each of a sequence of chunks in turn.
+
+        Each chunk is a tuple of the segments, and the indices of the
+        start and end of the code section within them (see `root_match()`).
+        """
+        for chunk, start_idx, end_idx in chunks:
+            match = cls.root_match(chunk, start_idx, end_idx, parse_context)
+            # NOTE: The indices in the cached matches are relative to
+            # the chunk, so the cache must be cleared before moving on.
+            parse_context.clear_parse_cache()
+            yield match
+
+    @classmethod
+    def root_parse_statements(
+        cls,
+        segments: tuple[BaseSegment, ...],
+        parse_context: ParseContext,
+        fname: Optional[str] = None,
+        match_chunks: Optional[ChunkMatcher] = None,
+    ) -> Optional["BaseFileSegment"]:
+        """Parse a file by splitting it into statements first.
+
+        The segments are split into chunks at the top level statement
+        delimiters (see `split_statements()`), each chunk is matched
+        independently, and the results are stitched back together into a
+        single file segment. The parse cache is cleared between chunks,
+        which bounds its size by the size of each statement rather than
+        the whole file.
+
+        By default the chunks are matched in turn using `match_chunks()`,
+        but an alternative can be provided (e.g. to match them in parallel)
+        using the `match_chunks` argument. It should be a callable taking
+        the same `chunks` argument, and returning the match for each.
+
+        This only gives the same result as `root_parse()` where each
+        statement can be parsed independently, and so if the file can't
+        be split safely, or any chunk doesn't parse as just statements and
+        delimiters, then this returns None, and `root_parse()` should be
+        used instead.
+        """
+        chunks = split_statements(segments)
+        if not chunks or len(chunks) == 1:
+            return None
+
+        # Trim each chunk, and only match those which contain code.
+        trimmed_chunks = [(chunk, *cls._trim_non_code(chunk)) for chunk in chunks]
+        code_chunks = [c for c in trimmed_chunks if c[1] != c[2]]
+
+        content: tuple[BaseSegment, ...] = ()
+        _final_seg = segments[-1]
+        assert _final_seg.pos_marker
+        _closing_position = _final_seg.pos_marker.templated_slice.stop
+        with parse_context.progress_bar(_closing_position):
+            if match_chunks:
+                matches = match_chunks(code_chunks)
+            else:
+                matches = cls.match_chunks(code_chunks, parse_context)
+            for chunk, _start_idx, _end_idx in trimmed_chunks:
+                if _start_idx == _end_idx:
+                    content += chunk
+                    continue
+                _content = cls._apply_root_match(
+                    chunk, _start_idx, _end_idx, next(matches)
+                )
+                # Only chunks which parse as a sequence of statements and
+                # delimiters can be stitched together. This excludes any
+                # chunks which are unparsable, or dialects which group
+                # statements together at the top level (e.g. into batches).
+                if any(
+                    seg.is_code and not seg.is_type(*_TOP_LEVEL_TYPES)
+                    for seg in _content
+                ):
+                    parse_context.logger.info(
+                        "Unable to parse chunk as statements, reverting to "
+                        "parsing the whole file."
+                    )
+                    return None
+                content += chunk[:_start_idx] + _content + chunk[_end_idx:]
+                _last_pos = chunk[_end_idx - 1].pos_marker
+                assert _last_pos
+                parse_context.update_progress(_last_pos.templated_slice.stop)
+
+        return cls(content, fname=fname)
+
+
+# The types of the code segments which are expected at the top level of a
+# file which has been parsed by statement.
+_TOP_LEVEL_TYPES = ("statement", "statement_terminator")
+# Keywords which start (or continue) procedural blocks, in which
+# statement delimiters may not be at the top level. If any of these
+# are found, files are not split into statements.
+_BLOCK_KEYWORDS = frozenset(
+    ("BEGIN", "DECLARE", "LOOP", "WHILE", "REPEAT", "DELIMITER", "GO")
+)
+# Keywords which are only part of procedural blocks outside of a CASE
+# expression.
+_CASE_KEYWORDS = frozenset(("ELSE", "END"))
+
+
+def split_statements(
+    segments: tuple[BaseSegment, ...],
+) -> Optional[list[tuple[BaseSegment, ...]]]:
+    """Split a sequence of lexed segments into statements.
+
+    The segments are split after each top level semicolon (along with
+    any immediately following semicolons), i.e. any which aren't within
+    brackets. Quoted literals and comments are already single segments
+    after lexing and so don't need any special handling.
+
+    Delimiters within procedural blocks (e.g. `BEGIN ... END`) aren't
+    at the top level of the file, and so this is conservative and if
+    there are any signs of procedural blocks, this returns None to
+    indicate that the segments can't safely be split. That includes any
+    `END` or `ELSE` keywords which aren't part of a `CASE` expression,
+    and `IF` at the start of a statement.
+
+    >>> from sqlfluff.core.parser import Lexer
+    >>> segments, _ = Lexer(dialect="ansi").lex("SELECT (1;2); SELECT 3;")
+    >>> [''.join(s.raw for s in c) for c in split_statements(segments)]
+    ['SELECT (1;2);', ' SELECT 3;', '']
+    >>> segments, _ = Lexer(dialect="ansi").lex("BEGIN; SELECT 1; END;")
+    >>> split_statements(segments) is None
+    True
+    """
+    chunks: list[tuple[BaseSegment, ...]] = []
+    bracket_depth = 0
+    case_depth = 0
+    chunk_start = 0
+    statement_start = True
+    for idx, seg in enumerate(segments):
+        if not seg.is_code:
+            continue
+        raw = seg.raw_upper
+        if raw in ("(", "[", "{"):
+            bracket_depth += 1
+        elif raw in (")", "]", "}"):
+            bracket_depth -= 1
+        elif raw == "CASE":
+            case_depth += 1
+        elif raw in _BLOCK_KEYWORDS or (raw == "IF" and statement_start):
+            return None
+        elif raw in _CASE_KEYWORDS and not case_depth:
+            return None
+        elif raw == "END":
+            case_depth -= 1
+        statement_start = False
+
+        if raw == ";" and bracket_depth == 0:
+            statement_start = True
+            # Include any immediately following delimiters in this chunk.
+            if idx + 1 < len(segments) and segments[idx + 1].raw == ";":
+                continue
+            chunks.append(segments[chunk_start : idx + 1])
+            chunk_start = idx + 1
+
+    chunks.append(segments[chunk_start:])
+    return chunks
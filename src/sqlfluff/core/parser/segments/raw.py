@@ -4,13 +4,14 @@ This is designed to be the root segment, without
 any children, and the output of the lexer.
 """
 
+from functools import cached_property
 from typing import Any, Callable, Optional, Union, cast
 from uuid import uuid4
 
 import regex as re
 
 from sqlfluff.core.parser.markers import PositionMarker
-from sqlfluff.core.parser.segments.base import BaseSegment, SourceFix
+from sqlfluff.core.parser.segments.base import BaseSegment, SourceFix, type_mask
 
 
 class RawSegment(BaseSegment):
@@ -71,9 +72,7 @@ class RawSegment(BaseSegment):
         self._source_fixes = source_fixes
         # UUID for matching (the int attribute of it)
         self.uuid = uuid or uuid4().int
-        self.representation = "<{}: ({}) {!r}>".format(
-            self.__class__.__name__, self.pos_marker, self.raw
-        )
+        self.representation = self._make_representation()
         self.quoted_value = quoted_value
         self.escape_replacements = escape_replacements
         self.casefold = casefold
@@ -89,6 +88,11 @@ class RawSegment(BaseSegment):
         """Overwrite BaseSegment's __setattr__ with BaseSegment's superclass."""
         super(BaseSegment, self).__setattr__(key, value)
 
+    def _make_representation(self) -> str:
+        return "<{}: ({}) {!r}>".format(
+            self.__class__.__name__, self.pos_marker, self.raw
+        )
+
     # ################ PUBLIC PROPERTIES
 
     @property
@@ -129,6 +133,25 @@ class RawSegment(BaseSegment):
         """
         return frozenset(self.instance_types) | super().class_types
 
+    @cached_property
+    def class_type_mask(self) -> int:
+        """The bitmask of types for this segment, including inherited.
+
+        This is cached because it's used heavily when building the masks
+        of the segments containing this one.
+        """
+        return type_mask(self.instance_types) | self._class_type_mask
+
+    @property
+    def descendant_type_mask(self) -> int:
+        """Raw segments have no descendants."""
+        return 0
+
+    @property
+    def direct_descendant_type_mask(self) -> int:
+        """Raw segments have no descendants."""
+        return 0
+
     @property
     def source_fixes(self) -> list[SourceFix]:
         """Return any source fixes as list."""
@@ -136,6 +159,27 @@ class RawSegment(BaseSegment):
 
     # ################ INSTANCE METHODS
 
+    def clone_at(self, pos_marker: PositionMarker) -> "RawSegment":
+        """Create a new segment with the same content at a different position.
+
+        This is designed for freshly lexed segments, which aren't yet part
+        of a tree. Unlike `copy()`, the new segment shares all the content
+        of this one (the raw string, its normalised forms, the types etc.)
+        and only the position, uuid and representation are new. That makes
+        it much cheaper than constructing a new segment for repeated tokens.
+        """
+        cls = self.__class__
+        new_segment = cls.__new__(cls)
+        # NOTE: We set the attributes one by one (in the order they were
+        # originally set) rather than using `__dict__.update()`, because
+        # that preserves the compact storage of the instance attributes.
+        for key, value in self.__dict__.items():
+            object.__setattr__(new_segment, key, value)
+        new_segment.pos_marker = pos_marker
+        new_segment.uuid = uuid4().int
+        new_segment.representation = new_segment._make_representation()
+        return new_segment
+
     def invalidate_caches(self) -> None:
         """Overwrite superclass functionality."""
         pass
@@ -0,0 +1,130 @@
+"""An index of the segments in a tree by type.
+
+Many rules search the whole tree for segments of particular types. Rather
+than walking the tree each time, the root segment builds this index once
+(for each version of the tree) and searches are then done against it. The
+index also records the position of each segment in the tree, which is used
+to find the path to a segment without searching.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from heapq import merge
+from operator import attrgetter
+from typing import TYPE_CHECKING, NamedTuple, Optional, cast
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlfluff.core.parser.segments.base import BaseSegment
+
+
+class TypeIndexEntry(NamedTuple):
+    """A segment in the type index, with its position in the tree.
+
+    Segments are numbered in the order they would be reached when walking
+    the tree (i.e. parents before their children). `pre` is the number of
+    this segment, and `end` is the number after its last descendant, so the
+    descendants of a segment are the ones numbered in `range(pre + 1, end)`.
+    """
+
+    pre: int
+    end: int
+    segment: "BaseSegment"
+    # The path from the root to the segment, *not* including the root itself
+    # (to avoid a reference cycle) and not including the segment either.
+    parent_stack: tuple["BaseSegment", ...]
+    # The index of the segment within its parent.
+    idx: int
+
+
+class SegmentTypeIndex:
+    """An index of all the descendants of a segment, by type.
+
+    NOTE: The index is a snapshot of the tree when it was built. It is cached
+    on the root segment and reset (along with the other cached properties)
+    when the children of the root are changed, but mutating segments deeper
+    in the tree *in place* requires calling `invalidate_caches()` on the
+    root, as it does for `descendant_type_set`.
+    """
+
+    def __init__(self, root: "BaseSegment") -> None:
+        entries: list[Optional[TypeIndexEntry]] = []
+        for idx, child in enumerate(root.segments):
+            self._add_entries(child, (), idx, entries)
+        self._entries_by_type: dict[str, list[TypeIndexEntry]] = defaultdict(list)
+        # NOTE: The index holds a reference to each segment, so their ids
+        # are unique for the lifetime of the index.
+        self._entries_by_id: dict[int, TypeIndexEntry] = {}
+        for entry in cast(list[TypeIndexEntry], entries):
+            for seg_type in entry.segment.class_types:
+                self._entries_by_type[seg_type].append(entry)
+            self._entries_by_id[id(entry.segment)] = entry
+
+    @classmethod
+    def _add_entries(
+        cls,
+        segment: "BaseSegment",
+        parent_stack: tuple["BaseSegment", ...],
+        idx: int,
+        entries: list[Optional[TypeIndexEntry]],
+    ) -> None:
+        """Recursively add entries for a segment and its descendants."""
+        pre = len(entries)
+        # Reserve the place for this segment, so the entries stay in tree
+        # order. We fill it in once we know where the descendants end.
+        entries.append(None)
+        if segment.segments:
+            child_stack = parent_stack + (segment,)
+            for child_idx, child in enumerate(segment.segments):
+                cls._add_entries(child, child_stack, child_idx, entries)
+        entries[pre] = TypeIndexEntry(pre, len(entries), segment, parent_stack, idx)
+
+    def get_entry(self, segment: "BaseSegment") -> Optional[TypeIndexEntry]:
+        """Get the entry for a segment, or None if it's not in the index."""
+        return self._entries_by_id.get(id(segment))
+
+    def select(
+        self,
+        types: Iterable[str],
+        block_types: Iterable[str] = (),
+        recurse_into: bool = True,
+    ) -> Iterator[TypeIndexEntry]:
+        """Yield the entries for segments of any of the given types, in order.
+
+        Args:
+            types: The types of segment to look for.
+            block_types: Types of segment to exclude, along with all of
+                their descendants.
+            recurse_into: Whether to include segments of the given types
+                which are descendants of other matching segments.
+        """
+        types = tuple(types)
+        block_types = tuple(block_types)
+        candidates = [
+            self._entries_by_type[seg_type]
+            for seg_type in set(types + block_types)
+            if seg_type in self._entries_by_type
+        ]
+        if not candidates:
+            return None
+        entries: Iterable[TypeIndexEntry] = (
+            candidates[0]
+            if len(candidates) == 1
+            else merge(*candidates, key=attrgetter("pre"))
+        )
+        # Any entries numbered before this are skipped, either because we've
+        # already seen them (if they have more than one of the types) or
+        # because they're within a segment we're not recursing into.
+        next_pre = 0
+        for entry in entries:
+            if entry.pre < next_pre:
+                continue
+            next_pre = entry.pre + 1
+            if block_types:
+                if entry.segment.is_type(*block_types):
+                    next_pre = entry.end
+                    continue
+                if not entry.segment.is_type(*types):
+                    continue
+            yield entry
+            if not recurse_into:
+                next_pre = entry.end
@@ -26,6 +26,7 @@ from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     DefaultDict,
     Optional,
@@ -94,6 +95,12 @@ class LintResult:
         source (:obj:`str`, optional): A string identifier for what
             generated the result. Within larger libraries like reflow this
             can be useful for tracking where a result came from.
+        fix_factory (:obj:`callable`, optional): As an alternative to
+            `fixes`, a function which returns them. This allows rules to
+            skip building fixes which aren't needed (e.g. when only linting),
+            while still reporting the issue as fixable. It should only be
+            given if there are fixes, and it may be called after the rule
+            has moved on, so shouldn't rely on the `RuleContext`.
 
     """
 
@@ -104,11 +111,13 @@ class LintResult:
         memory: Optional[Any] = None,
         description: Optional[str] = None,
         source: Optional[str] = None,
+        fix_factory: Optional[Callable[[], list["LintFix"]]] = None,
     ):
         # An anchor of none, means no issue
         self.anchor = anchor
-        # Fixes might be blank
+        # Fixes might be blank, or deferred until they're needed.
         self.fixes = fixes or []
+        self._fix_factory = fix_factory
         # Memory is passed back in the linting result
         self.memory = memory
         # store a description_override for later
@@ -130,11 +139,42 @@ class LintResult:
             return f"LintResult({self.description}: {self.anchor}{fix_coda})"
         return f"LintResult({self.anchor}{fix_coda})"
 
-    def to_linting_error(self, rule: "BaseRule") -> Optional[SQLLintError]:
-        """Convert a linting result to a :exc:`SQLLintError` if appropriate."""
+    @property
+    def fixes(self) -> list["LintFix"]:
+        """The fixes for this result, building them first if deferred."""
+        if self._fix_factory:
+            self._fixes = self._fix_factory()
+            self._fix_factory = None
+        return self._fixes
+
+    @fixes.setter
+    def fixes(self, fixes: list["LintFix"]) -> None:
+        self._fixes = fixes
+        self._fix_factory = None
+
+    @property
+    def fixable(self) -> bool:
+        """Does this result have fixes (without building any deferred ones)."""
+        return bool(self._fix_factory or self._fixes)
+
+    def to_linting_error(
+        self, rule: "BaseRule", defer_fixes: bool = False
+    ) -> Optional[SQLLintError]:
+        """Convert a linting result to a :exc:`SQLLintError` if appropriate.
+
+        If `defer_fixes` is set, any deferred fixes are passed on to the
+        error to build if needed, rather than being built now.
+        """
         if self.anchor:
             # Allow description override from the LintResult
             description = self.description or rule.description
+            if defer_fixes and self._fix_factory:
+                return SQLLintError(
+                    rule=rule,
+                    segment=self.anchor,
+                    description=description,
+                    fix_factory=self._fix_factory,
+                )
             return SQLLintError(
                 rule=rule,
                 segment=self.anchor,
@@ -513,91 +553,130 @@ class BaseRule(metaclass=RuleMetaclass):
         memory = root_context.memory
         context = root_context
         for context in self.crawl_behaviour.crawl(root_context):
-            try:
-                context.memory = memory
-                res = self._eval(context=context)
-            except (bdb.BdbQuit, KeyboardInterrupt):  # pragma: no cover
-                raise
-            # Any exception at this point would halt the linter and
-            # cause the user to get no results
-            except Exception as e:
-                # If a filename is present, include it in the critical exception.
-                self.logger.critical(
-                    (
-                        f"Applying rule {self.code} to {fname!r} "
-                        f"threw an Exception: {e}"
-                        if fname
-                        else f"Applying rule {self.code} threw an Exception: {e}"
+            memory, ok = self.eval_in_context(
+                context, memory, templated_file, ignore_mask, fname, tree, vs, fixes
+            )
+            if not ok:
+                return vs, context.raw_stack, fixes, context.memory
+        return vs, context.raw_stack if context else tuple(), fixes, context.memory
+
+    def eval_in_context(
+        self,
+        context: RuleContext,
+        memory: Any,
+        templated_file: Optional["TemplatedFile"],
+        ignore_mask: Optional["IgnoreMask"],
+        fname: Optional[str],
+        tree: BaseSegment,
+        vs: list[SQLLintError],
+        fixes: list[LintFix],
+    ) -> tuple[Any, bool]:
+        """Evaluate the rule on a single context yielded by the crawler.
+
+        Any violations and fixes found are appended to `vs` and `fixes`.
+
+        Returns:
+            A tuple of (memory, ok). The memory is that which should be
+            passed to the next evaluation of the rule. If `ok` is False,
+            then the rule threw an exception, and crawling should stop.
+        """
+        try:
+            context.memory = memory
+            res = self._eval(context=context)
+        except (bdb.BdbQuit, KeyboardInterrupt):  # pragma: no cover
+            raise
+        # Any exception at this point would halt the linter and
+        # cause the user to get no results
+        except Exception as e:
+            # If a filename is present, include it in the critical exception.
+            self.logger.critical(
+                (
+                    f"Applying rule {self.code} to {fname!r} "
+                    f"threw an Exception: {e}"
+                    if fname
+                    else f"Applying rule {self.code} threw an Exception: {e}"
+                ),
+                exc_info=True,
+            )
+            assert context.segment.pos_marker
+            exception_line, _ = context.segment.pos_marker.source_position()
+            self._log_critical_errors(e)
+            vs.append(
+                SQLLintError(
+                    rule=self,
+                    segment=context.segment,
+                    fixes=[],
+                    description=(
+                        f"Unexpected exception: {str(e)};\n"
+                        "Could you open an issue at "
+                        "https://github.com/sqlfluff/sqlfluff/issues ?\n"
+                        "You can ignore this exception for now, by adding "
+                        f"'-- noqa: {self.code}' at the end\n"
+                        f"of line {exception_line}\n"
                     ),
-                    exc_info=True,
-                )
-                assert context.segment.pos_marker
-                exception_line, _ = context.segment.pos_marker.source_position()
-                self._log_critical_errors(e)
-                vs.append(
-                    SQLLintError(
-                        rule=self,
-                        segment=context.segment,
-                        fixes=[],
-                        description=(
-                            f"Unexpected exception: {str(e)};\n"
-                            "Could you open an issue at "
-                            "https://github.com/sqlfluff/sqlfluff/issues ?\n"
-                            "You can ignore this exception for now, by adding "
-                            f"'-- noqa: {self.code}' at the end\n"
-                            f"of line {exception_line}\n"
-                        ),
-                    )
                 )
-                return vs, context.raw_stack, fixes, context.memory
+            )
+            return memory, False
 
-            new_lerrs: list[SQLLintError] = []
-            new_fixes: list[LintFix] = []
+        new_lerrs: list[SQLLintError] = []
+        new_fixes: list[LintFix] = []
 
-            if res is None or res == []:
-                # Assume this means no problems (also means no memory)
-                pass
-            elif isinstance(res, LintResult):
-                # Extract any memory
-                memory = res.memory
-                self._adjust_anchors_for_fixes(context, res)
+        if res is None or res == []:
+            # Assume this means no problems (also means no memory)
+            pass
+        elif isinstance(res, LintResult):
+            # Extract any memory
+            memory = res.memory
+            self._adjust_anchors_for_fixes(context, res)
+            self._process_lint_result(
+                res,
+                templated_file,
+                ignore_mask,
+                new_lerrs,
+                new_fixes,
+                tree,
+                defer_fixes=not context.fix,
+            )
+        elif isinstance(res, list) and all(
+            isinstance(elem, LintResult) for elem in res
+        ):
+            # Extract any memory from the *last* one, assuming
+            # it was the last to be added
+            memory = res[-1].memory
+            for elem in res:
+                self._adjust_anchors_for_fixes(context, elem)
                 self._process_lint_result(
-                    res, templated_file, ignore_mask, new_lerrs, new_fixes, tree
+                    elem,
+                    templated_file,
+                    ignore_mask,
+                    new_lerrs,
+                    new_fixes,
+                    tree,
+                    defer_fixes=not context.fix,
                 )
-            elif isinstance(res, list) and all(
-                isinstance(elem, LintResult) for elem in res
-            ):
-                # Extract any memory from the *last* one, assuming
-                # it was the last to be added
-                memory = res[-1].memory
-                for elem in res:
-                    self._adjust_anchors_for_fixes(context, elem)
-                    self._process_lint_result(
-                        elem, templated_file, ignore_mask, new_lerrs, new_fixes, tree
-                    )
-            else:  # pragma: no cover
-                raise TypeError(
-                    "Got unexpected result [{!r}] back from linting rule: {!r}".format(
-                        res, self.code
-                    )
+        else:  # pragma: no cover
+            raise TypeError(
+                "Got unexpected result [{!r}] back from linting rule: {!r}".format(
+                    res, self.code
                 )
+            )
 
-            for lerr in new_lerrs:
-                self.logger.info("!! Violation Found: %r", lerr.description)
-            if new_fixes:
-                if not self.is_fix_compatible:  # pragma: no cover
-                    rules_logger.error(
-                        f"Rule {self.code} returned a fix but is not documented as "
-                        "`is_fix_compatible`, you may encounter unusual fixing "
-                        "behaviour. Report this a bug to the developer of this rule."
-                    )
-                for lfix in new_fixes:
-                    self.logger.info("!! Fix Proposed: %r", lfix)
+        for lerr in new_lerrs:
+            self.logger.info("!! Violation Found: %r", lerr.description)
+        if new_fixes:
+            if not self.is_fix_compatible:  # pragma: no cover
+                rules_logger.error(
+                    f"Rule {self.code} returned a fix but is not documented as "
+                    "`is_fix_compatible`, you may encounter unusual fixing "
+                    "behaviour. Report this a bug to the developer of this rule."
+                )
+            for lfix in new_fixes:
+                self.logger.info("!! Fix Proposed: %r", lfix)
 
-            # Consume the new results
-            vs += new_lerrs
-            fixes += new_fixes
-        return vs, context.raw_stack if context else tuple(), fixes, context.memory
+        # Consume the new results
+        vs += new_lerrs
+        fixes += new_fixes
+        return memory, True
 
     # HELPER METHODS --------
     @staticmethod
@@ -613,12 +692,15 @@ class BaseRule(metaclass=RuleMetaclass):
         new_lerrs: list[SQLLintError],
         new_fixes: list[LintFix],
         root: BaseSegment,
+        defer_fixes: bool = False,
     ) -> None:
         # Unless the rule declares that it's already template safe. Do safety
         # checks.
         if not self.template_safe_fixes:
             self.discard_unsafe_fixes(res, templated_file)
-        lerr = res.to_linting_error(rule=self)
+        # When only linting, any deferred fixes are left for the error to
+        # build if they're needed (e.g. for serialised output).
+        lerr = res.to_linting_error(rule=self, defer_fixes=defer_fixes)
         if not lerr:
             return None
         if ignore_mask:
@@ -631,7 +713,14 @@ class BaseRule(metaclass=RuleMetaclass):
         # NOTE: We use `.passes_filter` here to do the test for unparsable
         # to avoid duplicating code because that test is already implemented
         # there.
-        anchors = [lerr.segment] + [fix.anchor for fix in lerr.fixes]
+        anchors = [lerr.segment]
+        # Deferred fixes only need building if there's anything they could
+        # be filtered out by.
+        if not lerr.fixes_deferred or (
+            not self.crawl_behaviour.works_on_unparsable
+            and "unparsable" in root.descendant_type_set
+        ):
+            anchors += [fix.anchor for fix in lerr.fixes]
         for anchor in anchors:
             if not self.crawl_behaviour.passes_filter(anchor):  # pragma: no cover
                 # NOTE: This clause is untested, because it's a hard to produce
@@ -652,7 +741,8 @@ class BaseRule(metaclass=RuleMetaclass):
                 return None
 
         new_lerrs.append(lerr)
-        new_fixes.extend(res.fixes)
+        if not lerr.fixes_deferred:
+            new_fixes.extend(lerr.fixes)
 
     @staticmethod
     def filter_meta(
@@ -704,7 +794,13 @@ class BaseRule(metaclass=RuleMetaclass):
         By removing its fixes, a LintResult will still be reported, but it
         will be treated as _unfixable_.
         """
-        if not lint_result.fixes or not templated_file:
+        # NOTE: In a file with no templating, no fixes can be unsafe, so we
+        # don't need to build any deferred ones.
+        if (
+            not lint_result.fixable
+            or not templated_file
+            or templated_file.is_fully_literal
+        ):
             return
 
         # Check for fixes that touch templated code.
@@ -2,9 +2,10 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
-from typing import Any, cast
+from typing import Any, Optional, cast
 
-from sqlfluff.core.parser.segments.base import BaseSegment
+from sqlfluff.core.parser.segments.base import BaseSegment, type_mask
+from sqlfluff.core.parser.segments.file import BaseFileSegment
 from sqlfluff.core.parser.segments.raw import RawSegment
 from sqlfluff.core.rules.context import RuleContext
 
@@ -28,6 +29,26 @@ class BaseCrawler(ABC):
         """
         return self.works_on_unparsable or not segment.is_type("unparsable")
 
+    def is_affected_by(self, dirty_type_mask: int) -> bool:
+        """Could changes to segments of these types change what is crawled.
+
+        This is used when fixing, to skip rules on later loops if none of
+        the segments they would visit have changed since they last ran.
+        The `dirty_type_mask` is the bitmask of the types of the segments
+        which have been changed (see `DirtyTypes`). By default we assume
+        any change could matter.
+        """
+        return bool(dirty_type_mask)
+
+    def has_targets_in(self, root: BaseSegment) -> bool:
+        """Could this crawler find anything to process in this tree.
+
+        This allows the linter to skip rules entirely for files with no
+        relevant segments, which for most files is most rules. By default
+        we assume there could be.
+        """
+        return True
+
     @abstractmethod
     def crawl(self, context: RuleContext) -> Iterator[RuleContext]:
         """Yields a RuleContext for each segment the rule should process."""
@@ -37,8 +58,28 @@ class RootOnlyCrawler(BaseCrawler):
     """A crawler that doesn't crawl.
 
     This just yields one context on the root-level (topmost) segment of the file.
+
+    Optionally, `required_types` can be given, if the rule could only ever
+    find something to do in files which contain segments of those types.
+    Files without any such segments are then skipped.
     """
 
+    def __init__(
+        self, required_types: Optional[set[str]] = None, **kwargs: Any
+    ) -> None:
+        self.required_types = required_types
+        self.required_types_mask = type_mask(required_types or ())
+        super().__init__(**kwargs)
+
+    def has_targets_in(self, root: BaseSegment) -> bool:
+        """Could this crawler find anything to process in this tree."""
+        if not self.required_types:
+            return True
+        return bool(
+            self.required_types_mask
+            & (root.descendant_type_mask | root.class_type_mask)
+        )
+
     def crawl(self, context: RuleContext) -> Iterator[RuleContext]:
         """Yields a RuleContext for each segment the rule should process."""
         if self.passes_filter(context.segment):
@@ -51,6 +92,12 @@ class SegmentSeekerCrawler(BaseCrawler):
     The segment type(s) are specified on creation.
     """
 
+    # Whether this crawler can search using the type index of the file
+    # rather than walking the tree (see `BaseFileSegment.type_index`).
+    # That's only possible if the criteria in `is_self_match()` are
+    # just the types of the segment.
+    use_type_index = True
+
     def __init__(
         self,
         types: set[str],
@@ -59,6 +106,7 @@ class SegmentSeekerCrawler(BaseCrawler):
         **kwargs: Any,
     ) -> None:
         self.types = types
+        self.types_mask = type_mask(types)
         # Tracking a raw stack involves a lot of tuple manipulation, so we
         # only do it when required - otherwise we skip it. Rules can explicitly
         # request it when defining their crawler.
@@ -74,6 +122,28 @@ class SegmentSeekerCrawler(BaseCrawler):
         """Does this segment match the relevant criteria."""
         return segment.is_type(*self.types)
 
+    def is_affected_by(self, dirty_type_mask: int) -> bool:
+        """Could changes to segments of these types change what is crawled.
+
+        If none of the changed segments (or their direct children) are of
+        the types we're looking for, then every segment we would yield is
+        unchanged. The raw stack spans the whole file though, so if that's
+        required we assume any change could matter.
+        """
+        if self.provide_raw_stack:
+            return bool(dirty_type_mask)
+        return bool(self.types_mask & dirty_type_mask)
+
+    def has_targets_in(self, root: BaseSegment) -> bool:
+        """Could this crawler find anything to process in this tree.
+
+        This is the same check as `crawl()` makes on each segment before
+        looking inside it.
+        """
+        return bool(
+            self.types_mask & (root.descendant_type_mask | root.class_type_mask)
+        )
+
     def crawl(self, context: RuleContext) -> Iterator[RuleContext]:
         """Yields a RuleContext for each segment the rule should process.
 
@@ -103,7 +173,7 @@ class SegmentSeekerCrawler(BaseCrawler):
             return
 
         # Check whether one of the targets is present (set intersection)
-        if not self.types & context.segment.descendant_type_set:
+        if not self.types_mask & context.segment.descendant_type_mask:
             # None present. Don't look further.
             # This aggressive pruning helps performance.
             # Track raw stack if required.
@@ -111,6 +181,18 @@ class SegmentSeekerCrawler(BaseCrawler):
                 context.raw_stack += tuple(context.segment.raw_segments)
             return
 
+        # If we're at the root of a file, then we can find the segments
+        # using its type index rather than walking the tree. This isn't
+        # possible if we're tracking the raw stack, because that requires
+        # visiting all the raw segments.
+        if (
+            self.use_type_index
+            and not self.provide_raw_stack
+            and isinstance(context.segment, BaseFileSegment)
+        ):
+            yield from self._crawl_type_index(context, context.segment)
+            return
+
         # NOTE: Full context is not implemented yet. More dev work required
         # before everything will be available here.
 
@@ -129,6 +211,28 @@ class SegmentSeekerCrawler(BaseCrawler):
             context.segment_idx = idx
             yield from self.crawl(context)
 
+    def _crawl_type_index(
+        self, context: RuleContext, root: BaseFileSegment
+    ) -> Iterator[RuleContext]:
+        """Yields a RuleContext for each matching descendant of the root.
+
+        This is equivalent to walking the tree in `crawl()`, but uses the
+        type index of the file instead.
+        """
+        root_stack = context.parent_stack + (root,)
+        for entry in root.type_index.select(
+            self.types,
+            # Unparsable sections are skipped in the same way as
+            # `passes_filter()` would when walking the tree.
+            block_types=() if self.works_on_unparsable else ("unparsable",),
+            recurse_into=self.allow_recurse,
+        ):
+            # As above, we modify the existing context in place.
+            context.segment = entry.segment
+            context.parent_stack = root_stack + entry.parent_stack
+            context.segment_idx = entry.idx
+            yield context
+
 
 class ParentOfSegmentCrawler(SegmentSeekerCrawler):
     """A crawler that efficiently searches for parents of specific segment types.
@@ -136,6 +240,8 @@ class ParentOfSegmentCrawler(SegmentSeekerCrawler):
     The segment type(s) are specified on creation.
     """
 
+    use_type_index = False
+
     def is_self_match(self, segment: BaseSegment) -> bool:
         """Does this segment match the relevant criteria.
 
@@ -144,4 +250,4 @@ class ParentOfSegmentCrawler(SegmentSeekerCrawler):
         for, then we know that this segment is a parent of that
         kind of segment.
         """
-        return bool(self.types & segment.direct_descendant_type_set)
+        return bool(self.types_mask & segment.direct_descendant_type_mask)
@@ -0,0 +1,265 @@
+"""Defines the MultiRuleDispatcher class.
+
+This runs several rules over a tree in a single walk, rather than
+each rule crawling the whole tree separately.
+"""
+
+import pathlib
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Optional, cast
+
+from sqlfluff.core.errors import SQLLintError
+from sqlfluff.core.parser import BaseSegment, RawSegment
+from sqlfluff.core.rules.base import BaseRule
+from sqlfluff.core.rules.context import RuleContext
+from sqlfluff.core.rules.crawlers import (
+    ParentOfSegmentCrawler,
+    RootOnlyCrawler,
+    SegmentSeekerCrawler,
+)
+from sqlfluff.core.rules.fix import LintFix
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlfluff.core.config import FluffConfig
+    from sqlfluff.core.dialects import Dialect
+    from sqlfluff.core.rules.noqa import IgnoreMask
+    from sqlfluff.core.templaters import TemplatedFile
+
+
+class _RuleCrawlState:
+    """The state of a single rule during a multi-rule walk.
+
+    This is the equivalent of the local state within `BaseRule.crawl()`
+    for that rule. Each rule has its own context, so that the raw stack,
+    memory and position within the tree are tracked separately.
+    """
+
+    __slots__ = ("rule", "crawler", "context", "memory", "vs", "fixes", "active", "t")
+
+    def __init__(self, rule: BaseRule, context: RuleContext) -> None:
+        self.rule = rule
+        self.crawler = cast(SegmentSeekerCrawler, rule.crawl_behaviour)
+        self.context = context
+        self.memory: Any = context.memory
+        self.vs: list[SQLLintError] = []
+        self.fixes: list[LintFix] = []
+        # Set to False if the rule throws an exception, at which point
+        # it should not be evaluated any more.
+        self.active = True
+        # Cumulative evaluation time for the rule.
+        self.t = 0.0
+
+
+class MultiRuleDispatcher:
+    """Runs a set of rules over a tree in a single walk.
+
+    The results are identical to calling `crawl()` on each rule in turn,
+    and are returned separately for each rule in the order given. Rules
+    using a `SegmentSeekerCrawler` (or `ParentOfSegmentCrawler`) or a
+    `RootOnlyCrawler` are evaluated during the shared walk, with an index
+    from segment type to the rules which are looking for that type. Any
+    other crawlers (e.g. from plugins), and any rules which override
+    `BaseRule.crawl()`, are crawled separately as normal.
+
+    This is only suitable for linting, because when fixing, the fixes from
+    each rule are applied to the tree before the next rule is run.
+    """
+
+    def __init__(self, rules: list[BaseRule]) -> None:
+        self.rules = rules
+
+    @staticmethod
+    def is_dispatchable(rule: BaseRule) -> bool:
+        """Can this rule be evaluated during the shared walk?
+
+        The shared walk replaces `BaseRule.crawl()`, so a rule which
+        overrides it must still be crawled on its own.
+        """
+        if type(rule).crawl is not BaseRule.crawl:
+            return False
+        return type(rule.crawl_behaviour) in (
+            SegmentSeekerCrawler,
+            ParentOfSegmentCrawler,
+            RootOnlyCrawler,
+        )
+
+    def crawl(
+        self,
+        tree: BaseSegment,
+        dialect: "Dialect",
+        templated_file: Optional["TemplatedFile"],
+        ignore_mask: Optional["IgnoreMask"],
+        fname: Optional[str],
+        config: "FluffConfig",
+    ) -> list[tuple[BaseRule, list[SQLLintError], float]]:
+        """Run the rules on a given tree.
+
+        Returns:
+            A list of tuples of (rule, violations, time taken), in the same
+            order as the rules were given.
+        """
+        results: dict[int, tuple[BaseRule, list[SQLLintError], float]] = {}
+        root_states: list[tuple[int, _RuleCrawlState]] = []
+        seeker_states: list[tuple[int, _RuleCrawlState]] = []
+        for idx, rule in enumerate(self.rules):
+            if not self.is_dispatchable(rule):
+                t0 = time.monotonic()
+                vs, _, _, _ = rule.crawl(
+                    tree,
+                    dialect=dialect,
+                    fix=False,
+                    templated_file=templated_file,
+                    ignore_mask=ignore_mask,
+                    fname=fname,
+                    config=config,
+                )
+                results[idx] = (rule, vs, time.monotonic() - t0)
+                continue
+            state = _RuleCrawlState(
+                rule,
+                RuleContext(
+                    dialect=dialect,
+                    fix=False,
+                    templated_file=templated_file,
+                    path=pathlib.Path(fname) if fname else None,
+                    segment=tree,
+                    config=config,
+                ),
+            )
+            if isinstance(rule.crawl_behaviour, RootOnlyCrawler):
+                root_states.append((idx, state))
+            else:
+                seeker_states.append((idx, state))
+
+        eval_args = (templated_file, ignore_mask, fname, tree)
+
+        # Root only rules just get evaluated once.
+        for _, state in root_states:
+            if state.crawler.passes_filter(tree):
+                self._eval(state, tree, (), 0, *eval_args)
+
+        # Build an index of the rules which might match each segment type.
+        # For `ParentOfSegmentCrawler`, the match is on the types of the
+        # direct children, so those are indexed separately.
+        seeker_index: dict[str, list[int]] = defaultdict(list)
+        parent_index: dict[str, list[int]] = defaultdict(list)
+        for idx, state in seeker_states:
+            index = (
+                parent_index
+                if isinstance(state.crawler, ParentOfSegmentCrawler)
+                else seeker_index
+            )
+            for seg_type in state.crawler.types:
+                index[seg_type].append(idx)
+
+        if seeker_states:
+            self._walk(
+                tree,
+                (),
+                0,
+                seeker_states,
+                seeker_index,
+                parent_index,
+                eval_args,
+            )
+
+        for idx, state in root_states + seeker_states:
+            results[idx] = (state.rule, state.vs, state.t)
+        return [results[idx] for idx in range(len(self.rules))]
+
+    @staticmethod
+    def _eval(
+        state: _RuleCrawlState,
+        segment: BaseSegment,
+        parent_stack: tuple[BaseSegment, ...],
+        segment_idx: int,
+        templated_file: Optional["TemplatedFile"],
+        ignore_mask: Optional["IgnoreMask"],
+        fname: Optional[str],
+        tree: BaseSegment,
+    ) -> None:
+        """Evaluate a rule on a segment, updating its state."""
+        t0 = time.monotonic()
+        context = state.context
+        context.segment = segment
+        context.parent_stack = parent_stack
+        context.segment_idx = segment_idx
+        state.memory, state.active = state.rule.eval_in_context(
+            context,
+            state.memory,
+            templated_file,
+            ignore_mask,
+            fname,
+            tree,
+            state.vs,
+            state.fixes,
+        )
+        state.t += time.monotonic() - t0
+
+    def _walk(
+        self,
+        segment: BaseSegment,
+        parent_stack: tuple[BaseSegment, ...],
+        segment_idx: int,
+        states: list[tuple[int, _RuleCrawlState]],
+        seeker_index: dict[str, list[int]],
+        parent_index: dict[str, list[int]],
+        eval_args: tuple[Any, ...],
+    ) -> None:
+        """Visit a segment for all the rules which are still crawling.
+
+        For each rule, this mirrors `SegmentSeekerCrawler.crawl()`.
+        """
+        # Which rules match this segment?
+        matches: set[int] = set()
+        for seg_type in segment.class_types:
+            matches.update(seeker_index.get(seg_type, ()))
+        if parent_index:
+            for seg_type in segment.direct_descendant_type_set:
+                matches.update(parent_index.get(seg_type, ()))
+
+        # Which rules should crawl the children of this segment?
+        recurse: list[tuple[int, _RuleCrawlState]] = []
+        for idx, state in states:
+            if not state.active:
+                continue
+            crawler = state.crawler
+            context = state.context
+            if not crawler.passes_filter(segment):
+                if crawler.provide_raw_stack:  # pragma: no cover
+                    context.raw_stack += tuple(segment.raw_segments)
+                continue
+
+            self_match = idx in matches
+            if self_match:
+                self._eval(state, segment, parent_stack, segment_idx, *eval_args)
+                if not state.active:
+                    continue
+
+            if not segment.segments or (self_match and not crawler.allow_recurse):
+                if crawler.provide_raw_stack:
+                    context.raw_stack += (cast(RawSegment, segment),)
+                continue
+
+            if not crawler.types_mask & segment.descendant_type_mask:
+                if crawler.provide_raw_stack:
+                    context.raw_stack += tuple(segment.raw_segments)
+                continue
+
+            recurse.append((idx, state))
+
+        if not recurse:
+            return
+
+        new_parent_stack = parent_stack + (segment,)
+        for child_idx, child in enumerate(segment.segments):
+            self._walk(
+                child,
+                new_parent_stack,
+                child_idx,
+                recurse,
+                seeker_index,
+                parent_index,
+                eval_args,
+            )
@@ -3,6 +3,7 @@
 import logging
 from bisect import bisect_left
 from collections.abc import Iterable, Iterator
+from functools import cached_property
 from typing import (
     Any,
     Callable,
@@ -475,6 +476,15 @@ class TemplatedFile:
                     is_literal = False
         return is_literal
 
+    @cached_property
+    def is_fully_literal(self) -> bool:
+        """Is the whole of the source file literal (i.e. not templated)?
+
+        No fixes can touch templated code (or span several template blocks)
+        in a file like this, so they don't need checking individually.
+        """
+        return all(raw_slice.slice_type == "literal" for raw_slice in self.raw_sliced)
+
     def source_only_slices(self) -> list[RawFileSlice]:
         """Return a list a slices which reference the parts only in the source.
 
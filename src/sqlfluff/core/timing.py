@@ -1,41 +1,74 @@
 """Timing summary class."""
 
-from collections import defaultdict
 from typing import Optional, Union
 
 
+class _TimingTotals:
+    """Running totals of a set of timings.
+
+    We aggregate as we go rather than keeping every timing, so that the
+    memory used doesn't grow with the number of files.
+    """
+
+    __slots__ = ("cnt", "sum", "min", "max")
+
+    def __init__(self) -> None:
+        self.cnt = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, time: float) -> None:
+        """Add a single timing to the totals."""
+        self.cnt += 1
+        self.sum += time
+        self.min = min(self.min, time)
+        self.max = max(self.max, time)
+
+    def merge(self, other: "_TimingTotals") -> None:
+        """Add the timings from another set of totals."""
+        self.cnt += other.cnt
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
 class TimingSummary:
     """An object for tracking the timing of similar steps across many files."""
 
     def __init__(self, steps: Optional[list[str]] = None):
         self.steps = steps
-        self._timings: list[dict[str, float]] = []
+        self._totals: dict[str, _TimingTotals] = {}
 
     def add(self, timing_dict: dict[str, float]) -> None:
         """Add a timing dictionary to the summary."""
-        self._timings.append(timing_dict)
+        for step, time in timing_dict.items():
+            self._totals.setdefault(step, _TimingTotals()).add(time)
         if not self.steps:
             self.steps = list(timing_dict.keys())
 
+    def merge(self, other: "TimingSummary") -> None:
+        """Add the timings from another summary to this one."""
+        for step, totals in other._totals.items():
+            self._totals.setdefault(step, _TimingTotals()).merge(totals)
+        if not self.steps:
+            self.steps = other.steps
+
     def summary(self) -> dict[str, dict[str, float]]:
         """Generate a summary for display."""
-        vals: dict[str, list[float]] = defaultdict(list)
         if not self.steps:  # pragma: no cover
             return {}
 
-        for timing_dict in self._timings:
-            for step in self.steps:
-                if step in timing_dict:
-                    vals[step].append(timing_dict[step])
         summary = {}
         for step in self.steps:
-            if vals[step]:
+            totals = self._totals.get(step)
+            if totals:
                 summary[step] = {
-                    "cnt": len(vals[step]),
-                    "sum": sum(vals[step]),
-                    "min": min(vals[step]),
-                    "max": max(vals[step]),
-                    "avg": sum(vals[step]) / len(vals[step]),
+                    "cnt": totals.cnt,
+                    "sum": totals.sum,
+                    "min": totals.min,
+                    "max": totals.max,
+                    "avg": totals.sum / totals.cnt,
                 }
         return summary
 
@@ -44,37 +77,35 @@ class RuleTimingSummary:
     """An object for tracking the timing of rules across many files."""
 
     def __init__(self) -> None:
-        self._timings: list[tuple[str, str, float]] = []
+        self._totals: dict[tuple[str, str], _TimingTotals] = {}
 
     def add(self, rule_timings: list[tuple[str, str, float]]) -> None:
         """Add a set of rule timings."""
-        # Add records to the main list.
-        self._timings.extend(rule_timings)
+        for code, name, time in rule_timings:
+            self._totals.setdefault((code, name), _TimingTotals()).add(time)
+
+    def merge(self, other: "RuleTimingSummary") -> None:
+        """Add the timings from another summary to this one."""
+        for key, totals in other._totals.items():
+            self._totals.setdefault(key, _TimingTotals()).merge(totals)
 
     def summary(
         self, threshold: float = 0.5
     ) -> dict[str, dict[str, Union[float, str]]]:
         """Generate a summary for display."""
-        keys: set[tuple[str, str]] = set()
-        vals: dict[tuple[str, str], list[float]] = defaultdict(list)
-
-        for code, name, time in self._timings:
-            vals[(code, name)].append(time)
-            keys.add((code, name))
-
         summary: dict[str, dict[str, Union[float, str]]] = {}
-        for code, name in sorted(keys):
-            timings = vals[(code, name)]
+        for code, name in sorted(self._totals):
+            totals = self._totals[(code, name)]
             # For brevity, if the total time taken is less than
             # `threshold`, then don't display.
-            if sum(timings) < threshold:
+            if totals.sum < threshold:
                 continue
             # NOTE: This summary isn't covered in tests, it's tricky
             # to force it to exist in a test environment without
             # making things complicated.
             summary[f"{code}: {name}"] = {  # pragma: no cover
-                "sum (n)": f"{sum(timings):.2f} ({len(timings)})",
-                "min": min(timings),
-                "max": max(timings),
+                "sum (n)": f"{totals.sum:.2f} ({totals.cnt})",
+                "min": totals.min,
+                "max": totals.max,
             }
         return summary
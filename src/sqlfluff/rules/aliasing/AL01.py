@@ -71,18 +71,25 @@ class Rule_AL01(BaseRule):
             else:
                 as_keyword = None
 
+            # The fixes are only generated if they're needed, because
+            # reflowing around the alias is relatively expensive. NOTE: The
+            # context may have moved on by then.
+            root = context.parent_stack[0]
+            config = context.config
+
             if as_keyword:
                 if self.aliasing == "implicit":
                     self.logger.debug("Removing AS keyword and respacing.")
+                    target = cast(RawSegment, as_keyword)
                     return LintResult(
                         anchor=as_keyword,
                         # Generate the fixes to remove and respace accordingly.
-                        fixes=ReflowSequence.from_around_target(
-                            as_keyword,
-                            context.parent_stack[0],
-                            config=context.config,
+                        fix_factory=lambda: ReflowSequence.from_around_target(
+                            target,
+                            root,
+                            config=config,
                         )
-                        .without(cast(RawSegment, as_keyword))
+                        .without(target)
                         .respace()
                         .get_fixes(),
                     )
@@ -99,10 +106,10 @@ class Rule_AL01(BaseRule):
                 return LintResult(
                     anchor=context.segment,
                     # Work out the insertion and reflow fixes.
-                    fixes=ReflowSequence.from_around_target(
+                    fix_factory=lambda: ReflowSequence.from_around_target(
                         identifier,
-                        context.parent_stack[0],
-                        config=context.config,
+                        root,
+                        config=config,
                         # Only reflow before, otherwise we catch too much.
                         sides="before",
                     )
@@ -85,7 +85,10 @@ class Rule_AL04(BaseRule):
                 parent_select, rule_context.dialect
             )
             if parent_select_info:
-                # If we are looking at a subquery, include any table references
+                # If we are looking at a subquery, include any table references.
+                # NOTE: The select info is shared with other rules, so we make
+                # a copy of the list rather than adding to it.
+                table_aliases = list(table_aliases)
                 for table_alias in parent_select_info.table_aliases:
                     if table_alias.from_expression_element.path_to(
                         rule_context.segment
@@ -261,7 +261,8 @@ class Rule_CP01(BaseRule):
             )
             return LintResult(
                 anchor=segment,
-                fixes=[self._get_fix(segment, fixed_raw)],
+                # The fix is only built if it's needed.
+                fix_factory=lambda: [self._get_fix(segment, fixed_raw)],
                 memory=memory,
                 description=f"{self._description_elem} must be {consistency}{policy}",
             )
@@ -141,26 +141,34 @@ class Rule_CV06(BaseRule):
         return False
 
     def _get_segment_move_context(
-        self, target_segment: RawSegment, parent_segment: BaseSegment
+        self,
+        target_segment: RawSegment,
+        parent_segment: BaseSegment,
+        raw_segments: Sequence[RawSegment],
+        target_idx: int,
     ) -> SegmentMoveContext:
         # Locate the segment to be moved (i.e. context.segment) and search back
         # over the raw stack to find the end of the preceding statement.
-        reversed_raw_stack = Segments(*parent_segment.raw_segments).reversed()
-        before_code = reversed_raw_stack.select(
-            loop_while=sp.not_(sp.is_code()), start_seg=target_segment
-        )
+        # NOTE: We search back from the index of the target segment, rather than
+        # searching for it in the raw stack, because this is done for every
+        # statement in the file.
+        first_code: Optional[RawSegment] = None
+        _before_code: list[RawSegment] = []
+        for idx in range(target_idx - 1, -1, -1):
+            if raw_segments[idx].is_code:
+                first_code = raw_segments[idx]
+                break
+            _before_code.append(raw_segments[idx])
+        before_code = Segments(*_before_code)
         before_segment = before_code.select(sp.not_(sp.is_meta()))
         # We're selecting from the raw stack, so we know that before_code is
         # made of RawSegment elements.
         anchor_segment = (
             cast(RawSegment, before_code[-1]) if before_code else target_segment
         )
-        first_code = reversed_raw_stack.select(
-            sp.is_code(), start_seg=target_segment
-        ).first()
         self.logger.debug("Semicolon: first_code: %s", first_code)
         is_one_line = (
-            self._is_one_line_statement(parent_segment, first_code[0])
+            self._is_one_line_statement(parent_segment, first_code)
             if first_code
             else False
         )
@@ -174,9 +182,15 @@ class Rule_CV06(BaseRule):
         )
 
     def _handle_semicolon(
-        self, target_segment: RawSegment, parent_segment: BaseSegment
+        self,
+        target_segment: RawSegment,
+        parent_segment: BaseSegment,
+        raw_segments: Sequence[RawSegment],
+        target_idx: int,
     ) -> Optional[LintResult]:
-        info = self._get_segment_move_context(target_segment, parent_segment)
+        info = self._get_segment_move_context(
+            target_segment, parent_segment, raw_segments, target_idx
+        )
         semicolon_newline = self.multiline_newline if not info.is_one_line else False
         self.logger.debug("Semicolon Newline: %s", semicolon_newline)
 
@@ -224,7 +238,7 @@ class Rule_CV06(BaseRule):
         # Adjust before_segment and anchor_segment for preceding inline
         # comments. Inline comments can contain noqa logic so we need to add the
         # newline after the inline comment.
-        (before_segment, anchor_segment) = self._handle_preceding_inline_comments(
+        before_segment, anchor_segment = self._handle_preceding_inline_comments(
             info.before_segment, info.anchor_segment
         )
 
@@ -388,6 +402,14 @@ class Rule_CV06(BaseRule):
         # We should only be dealing with a root segment
         assert context.segment.is_type("file")
         results = []
+        raw_segments = context.segment.raw_segments
+        # The position of each terminator in the raw segments is looked up here
+        # (by identity), so we don't have to search for each of them in turn.
+        raw_indices = {
+            id(seg): idx
+            for idx, seg in enumerate(raw_segments)
+            if seg.is_type("statement_terminator")
+        }
         for idx, seg in enumerate(context.segment.segments):
             res = None
             # First we can simply handle the case of existing semi-colon alignment.
@@ -395,7 +417,9 @@ class Rule_CV06(BaseRule):
                 # If it's a terminator then we know it's a raw.
                 seg = cast(RawSegment, seg)
                 self.logger.debug("Handling semi-colon: %s", seg)
-                res = self._handle_semicolon(seg, context.segment)
+                res = self._handle_semicolon(
+                    seg, context.segment, raw_segments, raw_indices[id(seg)]
+                )
             # Otherwise handle the end of the file separately.
             elif (
                 self.require_final_semicolon
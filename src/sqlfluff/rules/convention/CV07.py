@@ -46,7 +46,8 @@ class Rule_CV07(BaseRule):
     name = "convention.statement_brackets"
     aliases = ("L053",)
     groups = ("all", "convention")
-    crawl_behaviour = RootOnlyCrawler()
+    # Only bracketed statements are of interest.
+    crawl_behaviour = RootOnlyCrawler(required_types={"bracketed"})
     is_fix_compatible = True
 
     @staticmethod
@@ -44,7 +44,8 @@ class Rule_LT14(BaseRule):
 
     name = "layout.keyword_newline"
     groups = ("all", "layout")
-    crawl_behaviour = RootOnlyCrawler()
+    # Only the positions of keywords are of interest.
+    crawl_behaviour = RootOnlyCrawler(required_types={"keyword"})
     is_fix_compatible = True
 
     def _eval(self, context: RuleContext) -> Optional[list[LintResult]]:
@@ -62,7 +62,10 @@ class Rule_RF02(Rule_AL04):
                 parent_select, rule_context.dialect
             )
             if parent_select_info:
-                # If we are looking at a subquery, include any table references
+                # If we are looking at a subquery, include any table references.
+                # NOTE: The select info is shared with other rules, so we make
+                # a copy of the list rather than adding to it.
+                table_aliases = list(table_aliases)
                 for table_alias in parent_select_info.table_aliases:
                     is_from = self._is_root_from_clause(rule_context)
                     if (
@@ -5,7 +5,7 @@ from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import cached_property
-from typing import Generic, NamedTuple, Optional, TypeVar, Union, cast
+from typing import Any, Generic, NamedTuple, Optional, TypeVar, Union, cast
 
 from sqlfluff.core.dialects.base import Dialect
 from sqlfluff.core.dialects.common import AliasInfo
@@ -40,6 +40,24 @@ SUBSELECT_TYPES = (
 )
 
 
+def _recursive_crawl(
+    segment: BaseSegment, *seg_type: str, **kwargs: Any
+) -> tuple[BaseSegment, ...]:
+    """Recursively crawl for segments of the given types, caching the result.
+
+    The results are cached on the segment (see `BaseSegment.analysis_cache`),
+    so that the structure of a query is only found once, even if several
+    rules analyse it.
+    """
+    cache_key = ("recursive_crawl", seg_type, tuple(sorted(kwargs.items())))
+    try:
+        return cast(tuple[BaseSegment, ...], segment.analysis_cache[cache_key])
+    except KeyError:
+        result = tuple(segment.recursive_crawl(*seg_type, **kwargs))
+        segment.analysis_cache[cache_key] = result
+        return result
+
+
 class QueryType(Enum):
     """Query type: Simple is just a query; WithCompound has CTE(s)."""
 
@@ -232,7 +250,8 @@ class Query(Generic[T]):
         references or function call strings, yield those.
         """
         found_nested_select = False
-        for seg in segment.recursive_crawl(
+        for seg in _recursive_crawl(
+            segment,
             "table_reference",
             "set_expression",
             "select_statement",
@@ -282,7 +301,8 @@ class Query(Generic[T]):
         ), f"Found unexpected {selectable.selectable}"
 
         # For MERGE, UPDATE & DELETE, we should expect to find a sub select.
-        for subselect in selectable.selectable.recursive_crawl(
+        for subselect in _recursive_crawl(
+            selectable.selectable,
             *SELECTABLE_TYPES,
             recurse_into=False,
             allow_self=False,
@@ -324,13 +344,16 @@ class Query(Generic[T]):
             selectables = [Selectable(segment, dialect=dialect)]
         elif segment.is_type("set_expression"):
             # It's a set expression. There may be multiple selectables.
-            for _seg in segment.recursive_crawl("select_statement", recurse_into=False):
+            for _seg in _recursive_crawl(
+                segment, "select_statement", recurse_into=False
+            ):
                 selectables.append(Selectable(_seg, dialect=dialect))
         else:
             # Otherwise it's a WITH statement.
             assert segment.is_type("with_compound_statement")
             query_type = QueryType.WithCompound
-            for _seg in segment.recursive_crawl(
+            for _seg in _recursive_crawl(
+                segment,
                 # NOTE: We don't _specify_ set expressions here, because
                 # all set expressions are made of selects, and we
                 # want to look straight through to those child
@@ -342,7 +365,8 @@ class Query(Generic[T]):
                 selectables.append(Selectable(_seg, dialect=dialect))
 
             # We also need to handle CTEs
-            for _seg in segment.recursive_crawl(
+            for _seg in _recursive_crawl(
+                segment,
                 "common_table_expression",
                 recurse_into=False,
                 # Don't recurse into any other WITH statements.
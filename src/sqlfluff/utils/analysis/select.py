@@ -39,11 +39,35 @@ def _get_object_references(segment: BaseSegment) -> list[ObjectReferenceSegment]
 def get_select_statement_info(
     segment: BaseSegment, dialect: Optional[Dialect], early_exit: bool = True
 ) -> Optional[SelectStatementColumnsAndTables]:
-    """Analyze a select statement: targets, aliases, etc. Return info."""
+    """Analyze a select statement: targets, aliases, etc. Return info.
+
+    The result is cached on the segment (see `BaseSegment.analysis_cache`),
+    so that it's shared by all the rules which analyse the same statement.
+    If `early_exit` is True, then None is returned if the statement has no
+    aliases.
+    """
     assert segment.is_type("select_statement")
-    table_aliases, standalone_aliases = get_aliases_from_select(segment, dialect)
-    if early_exit and not table_aliases and not standalone_aliases:
+    cache_key = ("select_statement_info", dialect)
+    try:
+        select_info = segment.analysis_cache[cache_key]
+    except KeyError:
+        select_info = _get_select_statement_info(segment, dialect)
+        segment.analysis_cache[cache_key] = select_info
+    if (
+        early_exit
+        and select_info
+        and not select_info.table_aliases
+        and not select_info.standalone_aliases
+    ):
         return None
+    return select_info
+
+
+def _get_select_statement_info(
+    segment: BaseSegment, dialect: Optional[Dialect]
+) -> Optional[SelectStatementColumnsAndTables]:
+    """Analyze a select statement (see `get_select_statement_info`)."""
+    table_aliases, standalone_aliases = get_aliases_from_select(segment, dialect)
 
     # Iterate through all the references, both in the select clause, but also
     # potential others.
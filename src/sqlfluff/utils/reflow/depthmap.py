@@ -3,6 +3,7 @@
 import logging
 from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Optional
 
 from sqlfluff.core.parser import BaseSegment
 from sqlfluff.core.parser.segments.base import PathStep
@@ -154,6 +155,24 @@ class DepthMap:
             buff.append((raw, stack))
         return cls(raws_with_stack=buff)
 
+    def copy(self, raw_segments: Optional[Sequence[RawSegment]] = None) -> "DepthMap":
+        """Make a copy of this DepthMap, optionally for only some segments.
+
+        This is much cheaper than generating a new DepthMap, because the
+        DepthInfo objects themselves are immutable and so can be shared. It
+        allows a DepthMap for a whole root segment to be generated once and
+        then reused, without any edits to one copy (see `copy_depth_info()`)
+        affecting any others.
+        """
+        new_map = self.__class__(raws_with_stack=())
+        if raw_segments is None:
+            new_map.depth_info = self.depth_info.copy()
+        else:
+            new_map.depth_info = {
+                raw.uuid: self.get_depth_info(raw) for raw in raw_segments
+            }
+        return new_map
+
     def get_depth_info(self, raw: RawSegment) -> DepthInfo:
         """Get the depth info for a given segment."""
         try:
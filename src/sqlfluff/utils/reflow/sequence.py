@@ -30,6 +30,21 @@ from sqlfluff.utils.reflow.reindent import (
 reflow_logger = logging.getLogger("sqlfluff.rules.reflow")
 
 
+def _get_root_depth_map(root_segment: BaseSegment) -> DepthMap:
+    """Get the DepthMap for all the raw segments of a root segment.
+
+    This is cached on the root segment (see `BaseSegment.analysis_cache`),
+    so it's only generated once for each version of the tree, however many
+    rules use it. It's shared, so it should be copied before being edited.
+    """
+    try:
+        return cast(DepthMap, root_segment.analysis_cache["reflow_depth_map"])
+    except KeyError:
+        depth_map = DepthMap.from_parent(root_segment)
+        root_segment.analysis_cache["reflow_depth_map"] = depth_map
+        return depth_map
+
+
 class ReflowSequence:
     """Class for keeping track of elements in a reflow operation.
 
@@ -217,12 +232,27 @@ class ReflowSequence:
             config (:obj:`FluffConfig`): A config object from which
                 to load the spacing behaviours of different segments.
         """
-        return cls.from_raw_segments(
-            root_segment.raw_segments,
-            root_segment,
-            config=config,
-            # This is the efficient route. We use it here because we can.
-            depth_map=DepthMap.from_parent(root_segment),
+        # The elements are shared between all the sequences generated from
+        # the same root and config (see `BaseSegment.analysis_cache`). That's
+        # safe because the elements are immutable, and any edits make a new
+        # list. Each sequence gets its own copy of the depth map though,
+        # because edits add to that.
+        cache_key = ("reflow_sequence", config)
+        try:
+            elements, reflow_config = root_segment.analysis_cache[cache_key]
+        except KeyError:
+            reflow_config = ReflowConfig.from_fluff_config(config)
+            elements = cls._elements_from_raw_segments(
+                root_segment.raw_segments,
+                reflow_config=reflow_config,
+                depth_map=_get_root_depth_map(root_segment),
+            )
+            root_segment.analysis_cache[cache_key] = (elements, reflow_config)
+        return cls(
+            elements=list(elements),
+            root_segment=root_segment,
+            reflow_config=reflow_config,
+            depth_map=_get_root_depth_map(root_segment).copy(),
         )
 
     @classmethod
@@ -288,7 +318,14 @@ class ReflowSequence:
             post_idx,
             "".join(seg.raw for seg in segments),
         )
-        return cls.from_raw_segments(segments, root_segment, config=config)
+        return cls.from_raw_segments(
+            segments,
+            root_segment,
+            config=config,
+            # Take the depth info from the depth map for the whole root, which
+            # is shared by all the sequences from the same root.
+            depth_map=_get_root_depth_map(root_segment).copy(segments),
+        )
 
     def _find_element_idx_with(self, target: RawSegment) -> int:
         for idx, elem in enumerate(self.elements):
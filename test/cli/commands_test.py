@@ -23,6 +23,8 @@ from click.testing import CliRunner
 # We import the library directly here to get the version
 import sqlfluff
 from sqlfluff.cli.commands import (
+    cache_clear,
+    cache_stats,
     cli_format,
     dialects,
     fix,
@@ -1408,6 +1410,7 @@ def test__cli__command_parse_serialize_from_stdin(serialize, write_file, tmp_pat
                     "filepath": "stdin",
                     "statistics": {
                         "raw_segments": 12,
+                        "rules_skipped": 0,
                         "segments": 24,
                         "source_chars": 17,
                         "templated_chars": 17,
@@ -1476,6 +1479,7 @@ def test__cli__command_parse_serialize_from_stdin(serialize, write_file, tmp_pat
                     ],
                     "statistics": {
                         "raw_segments": 12,
+                        "rules_skipped": 0,
                         "segments": 24,
                         "source_chars": 17,
                         "templated_chars": 17,
@@ -1524,6 +1528,7 @@ def test__cli__command_parse_serialize_from_stdin(serialize, write_file, tmp_pat
                     ],
                     "statistics": {
                         "raw_segments": 6,
+                        "rules_skipped": 0,
                         "segments": 11,
                         "source_chars": 12,
                         "templated_chars": 8,
@@ -1699,6 +1704,60 @@ def test__cli__command_lint_serialize_multiple_files(serialize, write_file, tmp_
         raise Exception
 
 
+def test__cli__command_lint_serialize_multiple_files_order():
+    """Test the records are in order of path, however the files are linted."""
+    fpaths = [
+        "test/fixtures/linter/whitespace_errors.sql",
+        "test/fixtures/linter/operator_errors.sql",
+        "test/fixtures/linter/multiple_sql_errors.sql",
+        "test/fixtures/linter/indentation_errors.sql",
+        "test/fixtures/linter/comma_errors.sql",
+    ]
+    result = invoke_assert_code(
+        args=[
+            lint,
+            (*fpaths, "-p", "2", "--format", "json", "--disable-progress-bar"),
+        ],
+        ret_code=1,
+    )
+    records = json.loads(result.stdout)
+    assert [record["filepath"] for record in records] == sorted(fpaths)
+
+
+def test__cli__command_lint_serialize_user_error(tmp_path):
+    """Test the output file is complete if linting fails part way."""
+    for subdir in ("a", "b"):
+        (tmp_path / subdir).mkdir()
+        (tmp_path / subdir / "test.sql").write_text("select a from b\n")
+    # The config for the second directory can't be loaded.
+    (tmp_path / "b" / ".sqlfluff").write_text(
+        "[sqlfluff]\ntemplater = not_a_templater\n"
+    )
+    target_file = tmp_path / "out.json"
+    invoke_assert_code(
+        args=[
+            lint,
+            (
+                str(tmp_path / "a"),
+                str(tmp_path / "b"),
+                "--dialect",
+                "ansi",
+                "--format",
+                "json",
+                "--write-output",
+                str(target_file),
+                "--disable-progress-bar",
+            ),
+        ],
+        ret_code=2,
+        assert_stderr_contains="User Error: Requested templater 'not_a_templater'",
+    )
+    records = json.loads(target_file.read_text())
+    assert [record["filepath"] for record in records] == [
+        str(tmp_path / "a" / "test.sql")
+    ]
+
+
 def test__cli__command_lint_serialize_github_annotation():
     """Test format of github-annotation output."""
     fpath = "test/fixtures/linter/identifier_capitalisation.sql"
@@ -2138,7 +2197,7 @@ class TestProgressBars:
 
         assert r"\rlint by rules:" in raw_stderr
         assert r"\rrule LT01:" in raw_stderr
-        assert r"\rrule CV05:" in raw_stderr
+        assert r"\rrule AL03:" in raw_stderr
 
     def test_cli_lint_enabled_progress_bar_multiple_paths(
         self, mock_disable_progress_bar: MagicMock
@@ -2162,7 +2221,7 @@ class TestProgressBars:
         )
         assert r"\rlint by rules:" in normalised_stderr
         assert r"\rrule LT01:" in normalised_stderr
-        assert r"\rrule CV05:" in normalised_stderr
+        assert r"\rrule AL03:" in normalised_stderr
 
     def test_cli_lint_enabled_progress_bar_multiple_files(
         self, mock_disable_progress_bar: MagicMock
@@ -2201,7 +2260,7 @@ class TestProgressBars:
         )
         assert r"\rlint by rules:" in raw_stderr
         assert r"\rrule LT01:" in raw_stderr
-        assert r"\rrule CV05:" in raw_stderr
+        assert r"\rrule AL03:" in raw_stderr
 
 
 multiple_expected_output = """==== finding fixable violations ====
@@ -2417,3 +2476,43 @@ def test__cli__render_pass():
         ],
         assert_stdout_contains="SELECT 56 FROM sch1.tbl2",
     )
+
+
+def test__cli__cache_commands(tmp_path):
+    """Test linting with a cache, and the cache management commands."""
+    cache_dir = str(tmp_path / "cache")
+    lint_args = [
+        "--dialect",
+        "ansi",
+        "--cache-dir",
+        cache_dir,
+        "-f",
+        "json",
+        "test/fixtures/linter/indentation_error_simple.sql",
+    ]
+    first = invoke_assert_code(ret_code=1, args=[lint, lint_args])
+    second = invoke_assert_code(ret_code=1, args=[lint, lint_args])
+    first_records = json.loads(first.stdout)
+    second_records = json.loads(second.stdout)
+    assert second_records[0]["timings"].keys() == {"cache"}
+    for record in first_records + second_records:
+        record.pop("timings")
+    assert first_records == second_records
+
+    invoke_assert_code(
+        args=[cache_stats, ["--cache-dir", cache_dir]],
+        assert_stdout_contains="entries:",
+    )
+    invoke_assert_code(
+        args=[cache_clear, ["--cache-dir", cache_dir]],
+        assert_stdout_contains=f"Removed 1 entries from {cache_dir}",
+    )
+
+
+def test__cli__cache_commands_no_cache_dir():
+    """Test the cache management commands fail without a cache directory."""
+    invoke_assert_code(
+        ret_code=2,
+        args=[cache_stats, []],
+        assert_stderr_contains="No cache directory configured",
+    )
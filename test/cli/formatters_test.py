@@ -1,5 +1,6 @@
 """The Test file for CLI Formatters."""
 
+import json
 import pathlib
 import re
 import textwrap
@@ -8,7 +9,7 @@ import pytest
 
 from sqlfluff.cli.commands import fix
 from sqlfluff.cli.formatters import OutputStreamFormatter
-from sqlfluff.cli.outputstream import FileOutput
+from sqlfluff.cli.outputstream import FileOutput, RecordWriter
 from sqlfluff.core import FluffConfig
 from sqlfluff.core.errors import SQLLintError
 from sqlfluff.core.parser import RawSegment
@@ -60,6 +61,57 @@ def test__cli__formatters__violation(tmpdir):
     assert escape_ansi(f) == "L:   3 | P:   3 |    A | DESC [some-name]"
 
 
+def test__cli__formatters__record_writer_json(tmpdir):
+    """Test that records are written as they arrive, as a JSON array."""
+    output_path = str(tmpdir / "out.json")
+    records = [
+        {"filepath": "a.sql", "violations": [], "statistics": {}, "timings": {}},
+        {"filepath": "b.sql", "violations": [], "statistics": {}, "timings": {}},
+    ]
+    writer = RecordWriter("json", output_path)
+    writer.write_record(records[0])
+    # The first record is available before the second arrives.
+    with open(output_path) as f:
+        assert f.read() == "[" + json.dumps(records[0])
+    writer.write_record(records[1])
+    writer.close()
+    with open(output_path) as f:
+        assert json.load(f) == records
+
+
+def test__cli__formatters__record_writer_order(tmpdir):
+    """Test that records are written in order of their paths."""
+    output_path = str(tmpdir / "out.json")
+    records = [
+        {"filepath": fname, "violations": [], "statistics": {}, "timings": {}}
+        for fname in ("a.sql", "b.sql", "c.sql", "d.sql")
+    ]
+    writer = RecordWriter("json", output_path)
+    writer.expect_files(["d.sql", "c.sql", "b.sql", "a.sql"])
+    # Records which arrive early are held until the ones before them.
+    writer.write_record(records[1])
+    assert not (tmpdir / "out.json").exists()
+    writer.write_record(records[0])
+    with open(output_path) as f:
+        assert f.read() == "[" + json.dumps(records[0]) + ", " + json.dumps(records[1])
+    # If a record never arrives, the rest are written on closing.
+    writer.write_record(records[3])
+    writer.close()
+    with open(output_path) as f:
+        assert json.load(f) == [records[0], records[1], records[3]]
+
+
+def test__cli__formatters__record_writer_no_output(tmpdir):
+    """Test that no file is created if there's nothing to write."""
+    output_path = tmpdir / "out.txt"
+    writer = RecordWriter("github-annotation-native", str(output_path))
+    writer.write_record(
+        {"filepath": "a.sql", "violations": [], "statistics": {}, "timings": {}}
+    )
+    writer.close()
+    assert not output_path.exists()
+
+
 def test__cli__helpers__colorize(tmpdir):
     """Test ANSI colouring."""
     formatter = OutputStreamFormatter(
@@ -394,3 +394,14 @@ def test__api__immutable_config():
         "-- sqlfluff:dialect: postgres\nSELECT * FROM table1\n", config=config
     )
     assert config.get("dialect") == "ansi"
+
+
+def test__config__shared_dialect():
+    """Test that expanded dialects are shared between configs and copies."""
+    cfg_a = FluffConfig(overrides={"dialect": "ansi"})
+    cfg_b = FluffConfig(overrides={"dialect": "ansi", "max_line_length": 10})
+    dialect = cfg_a.get("dialect_obj")
+    assert dialect.expanded
+    assert cfg_b.get("dialect_obj") is dialect
+    assert cfg_a.copy().get("dialect_obj") is dialect
+    assert FluffConfig(overrides={"dialect": "tsql"}).get("dialect_obj") is not dialect
@@ -7,7 +7,7 @@ import pytest
 
 from sqlfluff.core.errors import SQLBaseError, SQLLexError, SQLLintError, SQLParseError
 from sqlfluff.core.parser import PositionMarker, RawSegment
-from sqlfluff.core.rules import BaseRule
+from sqlfluff.core.rules import BaseRule, LintFix
 from sqlfluff.core.templaters import TemplatedFile
 
 
@@ -73,3 +73,18 @@ def test__lint_error_pickle(ignore):
     # NOTE: This not copying was one of the reasons for this test.
     err.ignore = ignore
     assert_pickle_robust(err)
+
+
+def test__lint_error_pickle_deferred_fixes():
+    """Test lint error pickling builds any deferred fixes."""
+    template = TemplatedFile.from_string("foobar")
+    segment = RawSegment("foobar", PositionMarker(slice(0, 6), slice(0, 6), template))
+    fixes = [LintFix.delete(segment)]
+    err = SQLLintError(
+        "Foo", segment=segment, rule=Rule_T078, fix_factory=lambda: fixes
+    )
+    assert err.fixable
+    assert err.fixes_deferred
+    pickle_copy = pickle.loads(pickle.dumps(err))
+    assert not pickle_copy.fixes_deferred
+    assert pickle_copy.fixes == fixes
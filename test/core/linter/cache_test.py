@@ -0,0 +1,106 @@
+"""Tests for the persistent lint cache."""
+
+import os
+
+from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.linter.cache import LintCache
+
+LINT_PATHS = (
+    "test/fixtures/linter/comma_errors.sql",
+    "test/fixtures/linter/parse_error.sql",
+    "test/fixtures/linter/operator_errors_ignore.sql",
+)
+
+
+def _strip_timings(records):
+    return [{k: v for k, v in record.items() if k != "timings"} for record in records]
+
+
+def test__lint_cache__round_trip(tmp_path):
+    """Check that cached results are identical to uncached results."""
+    cache_dir = str(tmp_path / "cache")
+    expected = Linter(dialect="ansi").lint_paths(LINT_PATHS)
+    lntr = Linter(
+        config=FluffConfig(overrides={"dialect": "ansi", "cache_dir": cache_dir})
+    )
+    first = lntr.lint_paths(LINT_PATHS)
+    cache = LintCache.from_config(lntr.config)
+    assert cache
+    assert cache.stats()["entries"] == len(LINT_PATHS)
+    assert os.path.exists(os.path.join(cache_dir, ".gitignore"))
+    second = lntr.lint_paths(LINT_PATHS)
+    # The second run should have been served from the cache.
+    assert all(
+        list(record["timings"].keys()) == ["cache"] for record in second.as_records()
+    )
+    for result in (first, second):
+        assert _strip_timings(result.as_records()) == _strip_timings(
+            expected.as_records()
+        )
+        assert result.stats(1, 0) == expected.stats(1, 0)
+        assert [
+            (v.rule_code(), v.line_no, v.line_pos, v.fixable)
+            for v in result.get_violations()
+        ] == [
+            (v.rule_code(), v.line_no, v.line_pos, v.fixable)
+            for v in expected.get_violations()
+        ]
+
+
+def test__lint_cache__key(tmp_path):
+    """Check the cache key changes when the inputs do."""
+    cache = LintCache(str(tmp_path))
+    cfg = FluffConfig(overrides={"dialect": "ansi"})
+    rule_pack = Linter(config=cfg).get_rulepack()
+    key = cache.make_key("a.sql", "select 1\n", cfg, rule_pack)
+    assert key == cache.make_key("a.sql", "select 1\n", cfg, rule_pack)
+    assert key != cache.make_key("b.sql", "select 1\n", cfg, rule_pack)
+    assert key != cache.make_key("a.sql", "select 2\n", cfg, rule_pack)
+    other_cfg = FluffConfig(overrides={"dialect": "ansi", "max_line_length": 10})
+    assert key != cache.make_key("a.sql", "select 1\n", other_cfg, rule_pack)
+    other_rule_pack = Linter(
+        config=FluffConfig(overrides={"dialect": "ansi", "rules": "LT01"})
+    ).get_rulepack()
+    assert key != cache.make_key("a.sql", "select 1\n", cfg, other_rule_pack)
+
+
+def test__lint_cache__corrupt_entry(tmp_path):
+    """Check that corrupt entries are treated as a miss."""
+    cache = LintCache(str(tmp_path))
+    key = "ab" + "0" * 62
+    os.makedirs(tmp_path / "ab")
+    (tmp_path / "ab" / f"{key}.json").write_text("not json")
+    assert cache.get(key, "a.sql", "utf-8") is None
+    assert cache.get("cd" + "0" * 62, "a.sql", "utf-8") is None
+
+
+def test__lint_cache__evict_and_clear(tmp_path):
+    """Check eviction of old entries and clearing of the cache."""
+    cache_dir = str(tmp_path / "cache")
+    lntr = Linter(
+        config=FluffConfig(
+            overrides={
+                "dialect": "ansi",
+                "cache_dir": cache_dir,
+                "cache_max_entries": 1,
+            }
+        )
+    )
+    lntr.lint_paths(LINT_PATHS[:2])
+    cache = LintCache.from_config(lntr.config)
+    assert cache
+    # Eviction happens at the end of the run.
+    assert cache.stats()["entries"] == 1
+    assert cache.clear() == 1
+    assert cache.stats() == {"entries": 0, "bytes": 0}
+
+
+def test__lint_cache__not_used_when_fixing(tmp_path):
+    """The cache doesn't store the parse tree, so isn't used when fixing."""
+    cache_dir = str(tmp_path / "cache")
+    lntr = Linter(
+        config=FluffConfig(overrides={"dialect": "ansi", "cache_dir": cache_dir})
+    )
+    result = lntr.lint_paths(LINT_PATHS[:1], fix=True, apply_fixes=False)
+    assert result.paths[0].files[0].tree is not None
+    assert not os.path.exists(cache_dir)
@@ -4,14 +4,23 @@ import logging
 
 import pytest
 
-from sqlfluff.core.linter.fix import compute_anchor_edit_info
+from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.linter.fix import (
+    DirtyTypes,
+    FixBatch,
+    ReparseValidator,
+    apply_fixes,
+    compute_anchor_edit_info,
+)
 from sqlfluff.core.linter.patch import FixPatch, generate_source_patches
 from sqlfluff.core.parser.markers import PositionMarker
 from sqlfluff.core.parser.segments import (
     BaseSegment,
     RawSegment,
     TemplateSegment,
+    WhitespaceSegment,
 )
+from sqlfluff.core.parser.segments.base import type_mask
 from sqlfluff.core.parser.segments.raw import SourceFix
 from sqlfluff.core.rules.fix import LintFix
 from sqlfluff.core.templaters import RawFileSlice, TemplatedFile
@@ -200,3 +209,124 @@ def test__fix__generate_source_patches(tree, templated_file, expected_result, ca
     with caplog.at_level(logging.DEBUG, logger="sqlfluff.linter"):
         result = generate_source_patches(tree, templated_file)
     assert result == expected_result
+
+
+def test__fix__apply_fixes_shares_unchanged_segments():
+    """Test that apply_fixes only rebuilds segments containing the fixes."""
+    config = FluffConfig(overrides={"dialect": "ansi"})
+    tree = Linter(config=config).parse_string("select a;\nselect   b;\n").tree
+    assert tree
+    first_statement, second_statement = tree.recursive_crawl("statement")
+    whitespace = next(second_statement.recursive_crawl("whitespace"))
+    assert whitespace.raw == "   "
+    anchor_info = compute_anchor_edit_info(
+        [LintFix.replace(whitespace, [WhitespaceSegment()])]
+    )
+
+    fixed_tree, _, _, valid = apply_fixes(
+        tree, config.get("dialect_obj"), "TEST", anchor_info
+    )
+
+    assert valid
+    assert fixed_tree.raw == "select a;\nselect b;\n"
+    # The original tree is unchanged.
+    assert tree.raw == "select a;\nselect   b;\n"
+    # The statement before the fix is shared with the new tree (and now
+    # points to its new parent), but the one containing it is rebuilt.
+    fixed_first, fixed_second = fixed_tree.recursive_crawl("statement")
+    assert fixed_first is first_statement
+    assert fixed_second is not second_statement
+    assert fixed_first.get_parent()[0] is fixed_tree
+
+
+def test__fix__apply_fixes_dirty_types():
+    """Test that apply_fixes records the types of the segments it changes."""
+    config = FluffConfig(overrides={"dialect": "ansi"})
+    tree = Linter(config=config).parse_string("select a;\nselect   b + 1;\n").tree
+    assert tree
+    whitespace = next(tree.recursive_crawl("whitespace"))
+    anchor_info = compute_anchor_edit_info(
+        [LintFix.replace(whitespace, [WhitespaceSegment()])]
+    )
+    dirty_types = DirtyTypes()
+
+    apply_fixes(
+        tree, config.get("dialect_obj"), "TEST", anchor_info, dirty_types=dirty_types
+    )
+
+    # The replaced segment, the segments containing it, and their direct
+    # children are dirty.
+    for seg_type in ("whitespace", "select_clause", "keyword", "statement", "file"):
+        assert type_mask({seg_type}) & dirty_types.mask, seg_type
+    # Segments further inside the unchanged parts of the tree aren't.
+    for seg_type in ("binary_operator", "numeric_literal", "naked_identifier"):
+        assert not type_mask({seg_type}) & dirty_types.mask, seg_type
+
+
+def test__fix__fix_batch():
+    """Test that a FixBatch only accepts fixes which don't conflict."""
+    config = FluffConfig(overrides={"dialect": "ansi"})
+    tree = Linter(config=config).parse_string("select a  ,  b from c\n").tree
+    assert tree
+    select_clause = next(tree.recursive_crawl("select_clause"))
+    whitespace = list(tree.recursive_crawl("whitespace"))
+    comma = next(tree.recursive_crawl("comma"))
+    from_clause = next(tree.recursive_crawl("from_clause"))
+    batch = FixBatch()
+
+    assert batch.add("AA01", compute_anchor_edit_info([LintFix.delete(comma)]))
+    # The same anchor, or a segment containing it, conflicts.
+    assert not batch.add("AA02", compute_anchor_edit_info([LintFix.delete(comma)]))
+    assert not batch.add(
+        "AA03", compute_anchor_edit_info([LintFix.replace(select_clause, [comma])])
+    )
+    # Editing the adjacent whitespace doesn't, but inserting next to the
+    # edited segment does.
+    assert batch.add("AA04", compute_anchor_edit_info([LintFix.delete(whitespace[1])]))
+    assert not batch.add(
+        "AA05",
+        compute_anchor_edit_info(
+            [LintFix.create_before(whitespace[2], [WhitespaceSegment()])]
+        ),
+    )
+    # Fixes elsewhere in the file are fine.
+    assert batch.add(
+        "AA06",
+        compute_anchor_edit_info(
+            [LintFix.create_after(from_clause, [WhitespaceSegment()])]
+        ),
+    )
+
+    assert batch.rule_codes == ["AA01", "AA04", "AA06"]
+    assert len(batch.anchor_info) == 3
+    fixed_tree, _, _, valid = apply_fixes(
+        tree, config.get("dialect_obj"), "TEST", batch.anchor_info
+    )
+    assert valid
+    assert fixed_tree.raw == "select a  b from c \n"
+
+
+def test__fix__reparse_validator(monkeypatch):
+    """Test that the ReparseValidator caches results by content."""
+    config = FluffConfig(overrides={"dialect": "ansi"})
+    parsed = Linter(config=config).parse_string("select a;\nselect a;\nselect b c d;\n")
+    assert parsed.tree
+    statements = list(parsed.tree.recursive_crawl("select_statement"))
+    reparsed = []
+    validate_segment_with_reparse = BaseSegment.validate_segment_with_reparse
+
+    def _validate(self, dialect, parse_context=None):
+        reparsed.append(self.raw)
+        return validate_segment_with_reparse(self, dialect, parse_context)
+
+    monkeypatch.setattr(BaseSegment, "validate_segment_with_reparse", _validate)
+    validator = ReparseValidator(config.get("dialect_obj"))
+
+    assert validator.validate(statements[0])
+    # The second statement has the same content, so isn't reparsed.
+    assert validator.validate(statements[1])
+    # The last one already contains unparsable sections, so isn't cached.
+    validator.validate(statements[2])
+    validator.validate(statements[2])
+    assert reparsed == ["select a", "select b c d", "select b c d"]
+    assert validator.time > 0
@@ -17,9 +17,13 @@ from sqlfluff.core.errors import (
     SQLParseError,
     SQLTemplaterError,
 )
+from sqlfluff.core.formatter import FormatterInterface
 from sqlfluff.core.linter import runner
+from sqlfluff.core.linter.fix import apply_fixes
+from sqlfluff.core.linter.linter import _tree_version
 from sqlfluff.core.linter.linting_result import combine_dicts, sum_dicts
 from sqlfluff.core.linter.runner import get_runner
+from sqlfluff.core.parser.segments.base import SourceFix
 from sqlfluff.utils.testing.logging import fluff_log_catcher
 
 
@@ -235,6 +239,32 @@ def test__linter__linting_result_stats(path, stats):
     assert result.stats(111, 222) == stats
 
 
+def test__linter__linting_result_streaming():
+    """Test that results without files or records still have the summaries."""
+    paths = ("test/fixtures/linter/exit_codes/multifile_a",)
+    expected = Linter().lint_paths(paths)
+    result = Linter().lint_paths(paths, retain_files=False, retain_records=False)
+
+    linted_dir = result.paths[0]
+    assert not linted_dir.files
+    assert not linted_dir._records
+    assert result.stats(111, 222) == expected.stats(111, 222)
+    # The fixable count matches the serialised records.
+    assert linted_dir.num_fixable_lint_errors == sum(
+        bool(v.get("fixes", []))
+        for record in expected.as_records()
+        for v in record["violations"]
+    )
+    assert (
+        linted_dir.num_unfixable_lint_errors
+        == expected.paths[0].num_unfixable_lint_errors
+    )
+    # The timings are aggregated as we go.
+    timing_summary = result.timing_summary()
+    assert timing_summary["templating"]["cnt"] == 2
+    assert timing_summary["linting"]["cnt"] == 2
+
+
 @pytest.mark.parametrize("processes", [1, 2])
 def test__linter__linting_result_get_violations(processes):
     """Test that we can get violations from a LintingResult."""
@@ -250,6 +280,117 @@ def test__linter__linting_result_get_violations(processes):
     all([isinstance(v, SQLLintError) for v in result.get_violations()])
 
 
+def test__linter__render_in_workers(monkeypatch):
+    """Test that rendering in the workers gives the same results.
+
+    Test on MultiThread runner because otherwise we have pickling issues.
+    """
+    monkeypatch.setattr(Linter, "allow_process_parallelism", False)
+    paths = (
+        "test/fixtures/linter/comma_errors.sql",
+        "test/fixtures/linter/whitespace_errors.sql",
+        "test/fixtures/linter/indentation_errors.sql",
+    )
+    expected = Linter(dialect="ansi").lint_paths(paths, processes=1)
+    lntr = Linter(
+        config=FluffConfig(overrides={"dialect": "ansi", "render_in_workers": True})
+    )
+    runner_obj, _ = get_runner(
+        lntr, lntr.config, processes=2, allow_process_parallelism=False
+    )
+    assert runner_obj.render_in_workers
+    result = lntr.lint_paths(paths, processes=2)
+    assert result.check_tuples_by_path() == expected.check_tuples_by_path()
+
+
+def test__linter__render_in_workers_template_header(monkeypatch, capsys):
+    """Test that the template headers are still shown when rendering in workers."""
+    monkeypatch.setattr(Linter, "allow_process_parallelism", False)
+    config = FluffConfig(overrides={"dialect": "ansi", "render_in_workers": True})
+    output_stream = make_output_stream(config, None, None)
+    lntr = Linter(
+        config=config,
+        formatter=OutputStreamFormatter(output_stream, True, verbosity=2),
+    )
+    lntr.lint_paths(
+        (
+            "test/fixtures/linter/comma_errors.sql",
+            "test/fixtures/linter/whitespace_errors.sql",
+        ),
+        processes=2,
+    )
+    out = capsys.readouterr().out
+    assert "== [test/fixtures/linter/comma_errors.sql] TEMPLATING" in out
+    assert "== [test/fixtures/linter/whitespace_errors.sql] TEMPLATING" in out
+
+
+def test__linter__render_in_workers_skip_file(monkeypatch):
+    """Test that files skipped while rendering in a worker are logged."""
+    monkeypatch.setattr(Linter, "allow_process_parallelism", False)
+    lntr = Linter(
+        config=FluffConfig(
+            overrides={
+                "dialect": "ansi",
+                "render_in_workers": True,
+                "large_file_skip_byte_limit": 5,
+            }
+        )
+    )
+    with fluff_log_catcher(logging.WARNING, "sqlfluff.linter") as caplog:
+        result = lntr.lint_paths(
+            (
+                "test/fixtures/linter/comma_errors.sql",
+                "test/fixtures/linter/whitespace_errors.sql",
+            ),
+            processes=2,
+        )
+    assert "Skipping to avoid parser lock" in caplog.text
+    assert "internal error" not in caplog.text
+    assert result.stats(1, 0)["files"] == 0
+
+
+def test__linter__formatter_without_records():
+    """Test a formatter which doesn't handle serialised records still works.
+
+    Formatters from before `dispatch_file_record()` was added don't define it.
+    """
+
+    class _Formatter(FormatterInterface):
+        def dispatch_persist_filename(self, filename, result):
+            pass
+
+        def dispatch_lint_header(self, fname, rules):
+            pass
+
+        def dispatch_file_violations(
+            self, fname, linted_file, only_fixable, warn_unused_ignores
+        ):
+            self.violations = linted_file.violations
+
+        def dispatch_dialect_warning(self, dialect):
+            pass
+
+        def dispatch_template_header(self, fname, linter_config, file_config):
+            pass
+
+        def dispatch_parse_header(self, fname):
+            pass
+
+        def dispatch_processing_header(self, processes):
+            pass
+
+        def dispatch_path(self, path):
+            pass
+
+        def colorize(self, s, color=None):
+            return s
+
+    formatter = _Formatter()
+    lntr = Linter(formatter=formatter, dialect="ansi")
+    lntr.lint_paths(("test/fixtures/linter/comma_errors.sql",))
+    assert formatter.violations
+
+
 @pytest.mark.parametrize("force_error", [False, True])
 def test__linter__linting_parallel_thread(force_error, monkeypatch):
     """Run linter in parallel mode using threads.
@@ -385,6 +526,86 @@ def test__linter__empty_file():
     assert not parsed.violations
 
 
+@pytest.mark.parametrize("fix", [False, True])
+def test__linter__skip_rules_without_targets(fix):
+    """Test that rules with nothing to look at in a file are skipped."""
+    # AL01 looks for aliases and CV07 needs brackets, but LT12 looks
+    # at the whole file.
+    lntr = Linter(dialect="ansi", rules=["AL01", "CV07", "LT12"])
+
+    linted = lntr.lint_string("select 1", fix=fix)
+
+    assert linted.get_statistics()["rules_skipped"] == 2
+    # It's a statistic, not a timing.
+    assert "rules_skipped" not in linted.timings.step_timings
+    assert [code for code, _, _ in linted.timings.rule_timings] == ["LT12"]
+    assert [v.rule_code() for v in linted.violations] == ["LT12"]
+    # With an alias and some brackets, none are skipped.
+    linted = lntr.lint_string("(select 1 from t b)\n", fix=fix)
+    assert linted.get_statistics()["rules_skipped"] == 0
+    assert sorted(v.rule_code() for v in linted.violations) == ["AL01", "CV07"]
+
+
+@pytest.mark.parametrize("fix", [False, True])
+def test__linter__validation_timing(fix):
+    """Test that the time spent validating fixes is recorded."""
+    lntr = Linter(dialect="ansi", rules=["LT01"])
+
+    linted = lntr.lint_string("select a , b from c\n", fix=fix)
+
+    if fix:
+        assert linted.fix_string()[0] == "select a, b from c\n"
+        assert linted.timings.step_timings["validation"] > 0
+    else:
+        assert "validation" not in linted.timings.step_timings
+
+
+@pytest.mark.parametrize(
+    "batch_fixes,applied",
+    [
+        (False, ["AL01", "CP01", "LT01", "LT12"]),
+        # The fixes for LT01 touch the same whitespace as AL01, so they're
+        # deferred to the next loop (along with CP01 for the new keyword).
+        (True, ["AL01,LT12", "CP01,LT01"]),
+    ],
+)
+def test__linter__batch_fixes(batch_fixes, applied, monkeypatch):
+    """Test that fixes from several rules can be applied together."""
+    applied_codes = []
+
+    def _apply_fixes(segment, dialect, rule_code, *args, **kwargs):
+        applied_codes.append(rule_code)
+        return apply_fixes(segment, dialect, rule_code, *args, **kwargs)
+
+    monkeypatch.setattr("sqlfluff.core.linter.linter.apply_fixes", _apply_fixes)
+    lntr = Linter(
+        config=FluffConfig(
+            overrides={
+                "dialect": "ansi",
+                "rules": "AL01,CP01,LT01,LT12",
+                "batch_fixes": batch_fixes,
+            }
+        )
+    )
+
+    linted = lntr.lint_string("select a  from t  b", fix=True)
+
+    assert linted.fix_string()[0] == "select a from t as b\n"
+    assert applied_codes == applied
+
+
+def test__linter__tree_version():
+    """Test the digests of file versions used to catch fix loops."""
+    fix = SourceFix("b", slice(0, 1), slice(0, 1))
+    version = _tree_version("a", [fix])
+    assert version == _tree_version("a", [SourceFix("b", slice(0, 1), slice(0, 1))])
+    assert version != _tree_version("a", [])
+    assert version != _tree_version("a", [SourceFix("b", slice(0, 2), slice(0, 2))])
+    assert version != _tree_version("ab", [])
+    # The raw file and the source fixes can't run together.
+    assert _tree_version("a", [fix]) != _tree_version("a" + repr(fix), [])
+
+
 def test__linter__parse_fail():
     """Test linter behaves as expected with an unparsable string.
 
@@ -7,7 +7,12 @@ import pytest
 
 from sqlfluff.core import FluffConfig, SQLLexError
 from sqlfluff.core.parser import CodeSegment, Lexer, NewlineSegment
-from sqlfluff.core.parser.lexer import LexMatch, RegexLexer, StringLexer
+from sqlfluff.core.parser.lexer import (
+    LexMatch,
+    RegexLexer,
+    StringLexer,
+    get_compiled_lexer,
+)
 from sqlfluff.core.parser.segments.meta import TemplateSegment
 from sqlfluff.core.templaters import JinjaTemplater, RawFileSlice, TemplatedFile
 from sqlfluff.core.templaters.base import TemplatedFileSlice
@@ -123,6 +128,103 @@ def test__parser__lexer_lex_match(caplog):
         assert res.elements[2].raw == "#..#"
 
 
+@pytest.mark.parametrize(
+    "reg,raw,pos,res",
+    [
+        # Anchors match at the position, as they would on the remaining string.
+        (r"(^--|#)[^\n]*", "a --b\n", 2, "--b"),
+        (r"\A\w+", "a bc", 2, "bc"),
+        # Lookbehinds at the start would see the preceding content, so those
+        # are matched on the remaining string instead.
+        (r"(?<!a)b", "ab", 1, "b"),
+        (r"\bb", "ab", 1, "b"),
+        # Lookbehinds after content is consumed are fine.
+        (r"\d+((?<=\.)|(?=\b))", "x12 ", 1, "12"),
+        (r"\d+((?<=\.)|(?=\b))", "x12a", 1, None),
+    ],
+)
+def test__parser__lexer_regex_match_at(reg, raw, pos, res):
+    """Test matching at a position is the same as matching the remaining string."""
+    matcher = RegexLexer("test", reg, CodeSegment)
+    new_pos, elements = matcher.match_at(raw, pos)
+    assert [e.raw for e in elements] == ([res] if res else [])
+    assert new_pos == pos + len(res or "")
+    assert_matches(raw[pos:], matcher, res)
+
+
+def test__parser__lexer_lex_match_at():
+    """Test lexing from a position within a string."""
+    matchers = [
+        StringLexer("dot", ".", CodeSegment),
+        RegexLexer("test", r"#[^#]*#", CodeSegment),
+    ]
+    pos, elements = Lexer.lex_match_at("xx..#..#..#", 2, matchers)
+    assert pos == 10
+    assert [e.raw for e in elements] == [".", ".", "#..#", ".", "."]
+
+
+@pytest.mark.parametrize(
+    "dialect,fname",
+    [
+        ("ansi", "test/fixtures/lexer/basic.sql"),
+        ("ansi", "test/fixtures/lexer/block_comment.sql"),
+        ("ansi", "test/fixtures/lexer/inline_comment.sql"),
+        ("bigquery", "test/fixtures/dialects/bigquery/string_literals.sql"),
+        ("mysql", "test/fixtures/dialects/mysql/quoted_literal.sql"),
+        ("tsql", "test/fixtures/dialects/tsql/create_procedure.sql"),
+        (
+            "postgres",
+            "test/fixtures/dialects/postgres/create_dollar_quoted_function.sql",
+        ),
+    ],
+)
+def test__parser__lexer_compiled(dialect, fname):
+    """Test the compiled lexer gives the same result as the standard one."""
+    with open(fname) as f:
+        raw = f.read()
+    # Add some unlexable content to check the fallback behaviour.
+    raw += "\nΔ Δ\n"
+    results = []
+    for compiled in (False, True):
+        config = FluffConfig(overrides={"dialect": dialect, "compiled_lexer": compiled})
+        lexer = Lexer(config=config)
+        assert bool(lexer.compiled_lexer) == compiled
+        segments, vs = lexer.lex(raw)
+        results.append(
+            (
+                [(s.raw, s.get_type(), s.pos_marker.source_slice) for s in segments],
+                [(v.line_no, v.line_pos) for v in vs],
+            )
+        )
+    assert results[0] == results[1]
+
+
+def test__parser__lexer_compiled_cached():
+    """Test the compiled lexer is shared between lexers for the same dialect."""
+    config = FluffConfig(overrides={"dialect": "ansi", "compiled_lexer": True})
+    assert Lexer(config=config).compiled_lexer is Lexer(config=config).compiled_lexer
+    assert get_compiled_lexer(config.get("dialect_obj")) is not get_compiled_lexer(
+        FluffConfig(overrides={"dialect": "tsql"}).get("dialect_obj")
+    )
+
+
+def test__parser__lexer_shared_tokens():
+    """Test that repeated tokens share their content but not their position."""
+    lexer = Lexer(config=FluffConfig(overrides={"dialect": "ansi"}))
+    segments, _ = lexer.lex("select a, select b")
+    first, second = (s for s in segments if s.raw == "select")
+    assert first.raw is second.raw
+    assert first.raw_upper is second.raw_upper
+    assert first.instance_types is second.instance_types
+    assert first.uuid != second.uuid
+    assert first.pos_marker.source_slice == slice(0, 6)
+    assert second.pos_marker.source_slice == slice(10, 16)
+    assert repr(second) == "<WordSegment: ([L:  1, P: 11]) 'select'>"
+    # Segments of different types aren't shared, even with the same raw.
+    segments, _ = lexer.lex("1 '1'")
+    assert segments[0].get_type() != segments[2].get_type()
+
+
 def test__parser__lexer_fail():
     """Test the how the lexer fails and reports errors."""
     lex = Lexer(config=FluffConfig(overrides={"dialect": "ansi"}))
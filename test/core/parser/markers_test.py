@@ -1,5 +1,9 @@
 """Tests for PositionMarker."""
 
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from sqlfluff.core.parser.markers import PositionMarker
@@ -70,3 +74,24 @@ def test_markers__comparison():
     assert all(a_pos <= p for p in all_pos)
     # Check greater than or equal
     assert all(c_pos >= p for p in all_pos)
+
+
+def test_markers__immutable_and_copyable():
+    """Test that markers are immutable, but can be copied and pickled."""
+    templ = TemplatedFile.from_string("abc\ndef")
+    pos = PositionMarker(slice(4, 7), slice(4, 7), templ)
+    assert pos.source_slice == slice(4, 7)
+    assert pos.templated_slice == slice(4, 7)
+    assert pos.working_loc == (2, 1)
+    with pytest.raises(FrozenInstanceError):
+        pos.working_line_no = 3
+    for other in (copy.copy(pos), copy.deepcopy(pos), pickle.loads(pickle.dumps(pos))):
+        assert other is not pos
+        assert other.source_slice == pos.source_slice
+        assert other.templated_slice == pos.templated_slice
+        assert other.working_loc == pos.working_loc
+        assert other.templated_file.templated_str == templ.templated_str
+    assert repr(pos).startswith(
+        "PositionMarker(source_slice=slice(4, 7, None), "
+        "templated_slice=slice(4, 7, None), templated_file="
+    )
@@ -8,18 +8,22 @@ import pytest
 from sqlfluff.core.dialects.base import Dialect
 from sqlfluff.core.errors import SQLParseError
 from sqlfluff.core.parser import (
+    Anything,
     CodeSegment,
     KeywordSegment,
     StringParser,
     SymbolSegment,
+    TypedParser,
     WhitespaceSegment,
 )
 from sqlfluff.core.parser.context import ParseContext
 from sqlfluff.core.parser.lexer import RegexLexer
 from sqlfluff.core.parser.match_algorithms import (
+    get_prune_index,
     greedy_match,
     next_ex_bracket_match,
     next_match,
+    prune_options,
     resolve_bracket,
     trim_to_terminator,
 )
@@ -256,3 +260,38 @@ def test__parser__algorithms__trim_to_terminator(
         )
         == expected_result
     )
+
+
+@pytest.mark.parametrize(
+    "raw_segments,expected_options",
+    [
+        (["bar"], [0, 2, 4]),
+        (["foo", "bar"], [2, 3]),
+        ([" ", "(", "bar"], [1, 2]),
+        (["baz"], [2]),
+        ([" "], [0, 1, 2, 3, 4]),
+    ],
+)
+def test__parser__algorithms__prune_options(
+    raw_segments,
+    expected_options,
+    generate_test_segments,
+    test_dialect,
+):
+    """Test the `prune_options()` method, with and without an index."""
+    test_segments = generate_test_segments(raw_segments)
+    options = [
+        StringParser("bar", KeywordSegment),
+        TypedParser("start_bracket", SymbolSegment),
+        Anything(),
+        StringParser("foo", KeywordSegment),
+        StringParser("bar", KeywordSegment),
+    ]
+    ctx = ParseContext(dialect=test_dialect)
+
+    for use_index in (False, True):
+        pruned = prune_options(options, test_segments, ctx, use_index=use_index)
+        assert [options.index(opt) for opt in pruned] == expected_options
+    # Check the index is cached for the options.
+    assert get_prune_index(options, ctx) is get_prune_index(options, ctx)
+    assert get_prune_index(options[:], ctx) is not get_prune_index(options, ctx)
@@ -1,10 +1,21 @@
 """The Test file for The New Parser (Grammar Classes)."""
 
+import pytest
+
 from sqlfluff.core import FluffConfig
 from sqlfluff.core.errors import SQLParseError
 from sqlfluff.core.linter.linter import Linter
-from sqlfluff.core.parser import Anything, BaseSegment, KeywordSegment, StringParser
+from sqlfluff.core.parser import (
+    Anything,
+    BaseSegment,
+    KeywordSegment,
+    Lexer,
+    Parser,
+    StringParser,
+)
+from sqlfluff.core.parser import parser
 from sqlfluff.core.parser.context import ParseContext
+from sqlfluff.core.parser.segments.file import split_statements
 
 BarKeyword = StringParser("bar", KeywordSegment)
 
@@ -66,3 +77,91 @@ def test_parse_jinja_macro_exclude():
     parsed = linter.parse_path(sql_file_path)
     for parse in parsed:
         assert parse.violations == []
+
+
+def test__parser__parse_cache_bounded():
+    """Test that a bounded parse cache gives the same result as unbounded."""
+    in_str = "SELECT a + b AS c, (d * 2) AS e FROM tbl WHERE f = 1;\n" * 10
+    results = []
+    for max_entries in (0, 100):
+        config = FluffConfig(
+            overrides={"dialect": "ansi", "parse_cache_max_entries": max_entries}
+        )
+        segments, _ = Lexer(config=config).lex(in_str)
+        ctx = ParseContext.from_config(config)
+        root = (
+            config.get("dialect_obj")
+            .get_root_segment()
+            .root_parse(tuple(segments), parse_context=ctx)
+        )
+        results.append(root.stringify())
+        assert ctx.parse_stats["parse_cache_hits"] > 0
+        assert ctx.parse_stats["parse_cache_misses"] > 0
+        if max_entries:
+            assert len(ctx._parse_cache) <= max_entries
+            assert ctx.parse_stats["parse_cache_evictions"] > 0
+        else:
+            assert ctx.parse_stats["parse_cache_evictions"] == 0
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize(
+    "dialect,in_str,splits,by_statement",
+    [
+        ("ansi", "SELECT 1;\nSELECT (a;b) FROM tbl;;\n-- comment\nSELECT 2\n", 3, True),
+        ("ansi", "SELECT CASE WHEN a THEN b ELSE c END;\nSELECT 1;\n", 3, True),
+        # Procedural blocks aren't split.
+        ("ansi", "BEGIN;\nSELECT 1;\nEND;\n", None, False),
+        ("snowflake", "IF (a) THEN SELECT 1; ELSE SELECT 2; END IF;\n", None, False),
+        # Unparsable statements fall back to parsing the whole file.
+        ("ansi", "SELECT 1;\nFOO bar;\nSELECT 2;\n", 4, False),
+        # So do dialects which group statements at the top level.
+        ("tsql", "SELECT 1;\nSELECT 2;\nGO\nSELECT 3;\n", None, False),
+        ("tsql", "SELECT 1;\nSELECT 2;\n", 3, False),
+    ],
+)
+def test__parser__parse_by_statement(dialect, in_str, splits, by_statement):
+    """Test that parsing by statement gives the same result as the whole file."""
+    config = FluffConfig(overrides={"dialect": dialect})
+    segments, _ = Lexer(config=config).lex(in_str)
+    chunks = split_statements(segments)
+    assert (len(chunks) if chunks else None) == splits
+    root_segment = config.get("dialect_obj").get_root_segment()
+    parsed = root_segment.root_parse_statements(
+        segments, parse_context=ParseContext.from_config(config)
+    )
+    assert (parsed is not None) == by_statement
+
+    results = []
+    for parse_by_statement in (False, True):
+        config = FluffConfig(
+            overrides={"dialect": dialect, "parse_by_statement": parse_by_statement}
+        )
+        results.append(Parser(config=config).parse(segments).stringify())
+    assert results[0] == results[1]
+
+
+def test__parser__parse_by_statement_parallel(monkeypatch):
+    """Test parsing statements in parallel gives the same result."""
+    monkeypatch.setattr(parser, "MIN_STATEMENTS_PER_PROCESS", 2)
+    in_str = "SELECT a FROM b;\nINSERT INTO c VALUES (1, 2);\n" * 4
+    results = []
+    for parse_processes in (1, 2):
+        config = FluffConfig(
+            overrides={
+                "dialect": "ansi",
+                "parse_by_statement": True,
+                "parse_processes": parse_processes,
+            }
+        )
+        segments, _ = Lexer(config=config).lex(in_str)
+        assert Parser(config=config)._parse_processes(8) == parse_processes
+        tree = Parser(config=config).parse(segments)
+        # The tree should reference the original templated file.
+        templated_file = segments[0].pos_marker.templated_file
+        assert all(
+            seg.pos_marker.templated_file is templated_file
+            for seg in tree.recursive_crawl_all()
+        )
+        results.append(tree.stringify())
+    assert results[0] == results[1]
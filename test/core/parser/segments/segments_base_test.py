@@ -5,7 +5,7 @@ import pickle
 import pytest
 
 from sqlfluff.core.parser import BaseSegment, PositionMarker, RawSegment
-from sqlfluff.core.parser.segments.base import PathStep
+from sqlfluff.core.parser.segments.base import PathStep, type_mask, type_names
 from sqlfluff.core.rules.base import LintFix
 from sqlfluff.core.templaters import TemplatedFile
 
@@ -41,6 +41,21 @@ def test__parser__base_segments_direct_descendant_type_set(
     assert test_seg.direct_descendant_type_set == {"base", "dummy_aux"}
 
 
+def test__parser__base_segments_type_masks(raw_segments, DummySegment, DummyAuxSegment):
+    """Test the bitmask versions of the type sets."""
+    test_seg = DummySegment([DummyAuxSegment(raw_segments)])
+    assert test_seg.class_type_mask == type_mask({"dummy", "base"})
+    assert test_seg.descendant_type_mask == type_mask({"raw", "base", "dummy_aux"})
+    assert test_seg.direct_descendant_type_mask == type_mask({"base", "dummy_aux"})
+    assert raw_segments[0].descendant_type_mask == 0
+    # Masks convert back into sets of types.
+    assert type_names(test_seg.descendant_type_mask) == {"raw", "base", "dummy_aux"}
+    assert type_names(0) == frozenset()
+    # Each type has its own bit.
+    assert type_mask(["raw"]) & type_mask(["base"]) == 0
+    assert type_mask(["raw", "base"]) == type_mask(["raw"]) | type_mask(["base"])
+
+
 def test__parser__base_segments_to_tuple_a(raw_segments, DummySegment, DummyAuxSegment):
     """Test the .to_tuple() method."""
     test_seg = DummySegment([DummyAuxSegment(raw_segments)])
@@ -270,9 +285,17 @@ def test__parser__base_segments_pickle_safe(raw_segments):
     """Test pickling and unpickling of BaseSegment."""
     test_seg = BaseSegment([BaseSegment(raw_segments)])
     test_seg.set_as_parent()
+    # Type masks are specific to the process, so shouldn't be pickled.
+    assert test_seg.descendant_type_mask
     pickled = pickle.dumps(test_seg)
     result_seg = pickle.loads(pickled)
     assert test_seg == result_seg
+    assert "descendant_type_mask" not in result_seg.__dict__
+    assert result_seg.descendant_type_mask == test_seg.descendant_type_mask
+    raw_seg = test_seg.raw_segments[0]
+    assert "class_type_mask" in raw_seg.__dict__
+    assert "class_type_mask" not in raw_seg.__getstate__()
+    assert result_seg.raw_segments[0].class_type_mask == raw_seg.class_type_mask
     # Check specifically the treatment of the parent position.
     assert result_seg.segments[0].get_parent()[0] is result_seg
 
@@ -1,6 +1,11 @@
 """Test the BaseFileSegment class."""
 
-from sqlfluff.core.parser import BaseFileSegment
+import pickle
+
+import pytest
+
+from sqlfluff.core import Linter
+from sqlfluff.core.parser import BaseFileSegment, BaseSegment
 
 
 def test__parser__base_segments_file(raw_segments):
@@ -10,3 +15,80 @@ def test__parser__base_segments_file(raw_segments):
     assert base_seg.file_path == "/some/dir/file.sql"
     assert base_seg.can_start_end_non_code
     assert base_seg.allow_empty
+
+
+@pytest.mark.parametrize(
+    "seg_type,kwargs",
+    [
+        (("file",), {}),
+        (("select_statement",), {}),
+        (("select_statement",), {"recurse_into": False}),
+        (("keyword", "comma"), {}),
+        (("naked_identifier",), {"no_recursive_seg_type": "select_clause"}),
+        (("file", "keyword"), {"allow_self": False}),
+    ],
+)
+def test__parser__base_segments_file_recursive_crawl(seg_type, kwargs):
+    """Test crawling a file with the type index is the same as walking the tree."""
+    file_seg = (
+        Linter(dialect="ansi")
+        .parse_string("SELECT a, (SELECT b FROM c) AS d FROM e;\nSELECT f FROM g;\n")
+        .tree
+    )
+    expected = list(BaseSegment.recursive_crawl(file_seg, *seg_type, **kwargs))
+    assert expected
+    assert list(file_seg.recursive_crawl(*seg_type, **kwargs)) == expected
+
+
+def test__parser__base_segments_file_type_index_reset():
+    """Test the type index is rebuilt when the file changes."""
+    file_seg = Linter(dialect="ansi").parse_string("SELECT a;\nSELECT b;\n").tree
+    type_index = file_seg.type_index
+    assert file_seg.type_index is type_index
+    assert len(list(file_seg.recursive_crawl("select_statement"))) == 2
+    # Replace the segments with just the first statement.
+    file_seg.segments = file_seg.segments[:1]
+    assert file_seg.type_index is not type_index
+    assert len(list(file_seg.recursive_crawl("select_statement"))) == 1
+
+
+def test__parser__base_segments_file_path_to():
+    """Test finding paths with the type index is the same as searching."""
+    file_seg = (
+        Linter(dialect="ansi")
+        .parse_string("SELECT a, (SELECT b FROM c) AS d FROM e;\nSELECT f FROM g;\n")
+        .tree
+    )
+    for segment in file_seg.recursive_crawl_all():
+        expected = BaseSegment.path_to(file_seg, segment)
+        assert file_seg.path_to(segment) == expected
+        if segment is not file_seg:
+            assert expected[0].segment is file_seg
+    # Segments which aren't in the file have no path.
+    other_seg = Linter(dialect="ansi").parse_string("SELECT a;\n").tree
+    assert file_seg.path_to(other_seg.segments[0]) == []
+
+
+def test__parser__base_segments_file_type_index_pickle():
+    """Test the type index is rebuilt after unpickling a file."""
+    file_seg = (
+        Linter(dialect="ansi")
+        .parse_string("SELECT a, (SELECT b FROM c) AS d FROM e;\nSELECT f FROM g;\n")
+        .tree
+    )
+    # Make sure the index is built before pickling.
+    assert file_seg.type_index
+    result_seg = pickle.loads(pickle.dumps(file_seg))
+    del file_seg
+    assert "type_index" not in result_seg.__dict__
+
+    for segment in result_seg.recursive_crawl_all():
+        path = result_seg.path_to(segment)
+        expected = BaseSegment.path_to(result_seg, segment)
+        assert [(id(step.segment), step.idx) for step in path] == [
+            (id(step.segment), step.idx) for step in expected
+        ]
+    for seg_type in ("select_statement", "naked_identifier", "keyword"):
+        assert [id(seg) for seg in result_seg.recursive_crawl(seg_type)] == [
+            id(seg) for seg in BaseSegment.recursive_crawl(result_seg, seg_type)
+        ]
@@ -4,6 +4,7 @@ import pytest
 
 from sqlfluff.core.config import FluffConfig
 from sqlfluff.core.linter.linter import Linter
+from sqlfluff.core.parser.segments.base import type_mask
 from sqlfluff.core.rules.context import RuleContext
 from sqlfluff.core.rules.crawlers import (
     ParentOfSegmentCrawler,
@@ -51,3 +52,91 @@ def test_rules_crawlers(CrawlerType, crawler_kwargs, raw_sql_in, target_raws_out
     result_raws = [context.segment.raw for context in crawler.crawl(root_context)]
 
     assert result_raws == target_raws_out
+
+
+@pytest.mark.parametrize(
+    "crawler_kwargs",
+    [
+        {"types": {"select_statement"}},
+        {"types": {"select_statement"}, "allow_recurse": False},
+        {"types": {"keyword", "comma"}},
+        {"types": {"naked_identifier"}, "works_on_unparsable": True},
+    ],
+)
+def test_rules_crawlers_type_index(crawler_kwargs):
+    """Test crawling with the type index is the same as walking the tree."""
+    raw_sql_in = (
+        "SELECT a, (SELECT b FROM c) AS d FROM e;\n"
+        "SELECT f FROM g WHERE h = 1 SMELLS;\n"
+    )
+    cfg = FluffConfig(overrides={"dialect": "ansi"})
+    root = Linter(config=cfg).parse_string(raw_sql_in).tree
+    assert root.recursive_crawl("unparsable")
+
+    results = []
+    for use_type_index in (False, True):
+        root_context = RuleContext(
+            dialect=cfg.get("dialect_obj"),
+            fix=True,
+            templated_file=TemplatedFile(raw_sql_in, "<test-case>"),
+            path=None,
+            segment=root,
+            config=cfg,
+        )
+        crawler = SegmentSeekerCrawler(**crawler_kwargs)
+        crawler.use_type_index = use_type_index
+        results.append(
+            [
+                (context.segment, context.parent_stack, context.segment_idx)
+                for context in crawler.crawl(root_context)
+            ]
+        )
+
+    assert results[0]
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize(
+    "CrawlerType,crawler_kwargs,dirty_types,affected",
+    [
+        (RootOnlyCrawler, {}, set(), False),
+        (RootOnlyCrawler, {}, {"whitespace"}, True),
+        (SegmentSeekerCrawler, {"types": {"keyword"}}, {"whitespace"}, False),
+        (SegmentSeekerCrawler, {"types": {"keyword"}}, {"keyword", "comma"}, True),
+        (
+            SegmentSeekerCrawler,
+            {"types": {"keyword"}, "provide_raw_stack": True},
+            {"whitespace"},
+            True,
+        ),
+        (ParentOfSegmentCrawler, {"types": {"keyword"}}, {"whitespace"}, False),
+    ],
+)
+def test_rules_crawlers_is_affected_by(
+    CrawlerType, crawler_kwargs, dirty_types, affected
+):
+    """Test whether crawlers are affected by changes to segments of given types."""
+    crawler = CrawlerType(**crawler_kwargs)
+    assert crawler.is_affected_by(type_mask(dirty_types)) is affected
+
+
+@pytest.mark.parametrize(
+    "CrawlerType,crawler_kwargs,has_targets",
+    [
+        (RootOnlyCrawler, {}, True),
+        (RootOnlyCrawler, {"required_types": {"bracketed"}}, False),
+        (RootOnlyCrawler, {"required_types": {"bracketed", "keyword"}}, True),
+        (SegmentSeekerCrawler, {"types": {"numeric_literal"}}, True),
+        (SegmentSeekerCrawler, {"types": {"alias_expression"}}, False),
+        (ParentOfSegmentCrawler, {"types": {"numeric_literal"}}, True),
+        (ParentOfSegmentCrawler, {"types": {"alias_expression"}}, False),
+    ],
+)
+def test_rules_crawlers_has_targets_in(CrawlerType, crawler_kwargs, has_targets):
+    """Test whether crawlers could find anything to process in a tree."""
+    cfg = FluffConfig(overrides={"dialect": "ansi"})
+    root = Linter(config=cfg).parse_string("SELECT 1 + 2").tree
+
+    crawler = CrawlerType(**crawler_kwargs)
+
+    assert crawler.has_targets_in(root) is has_targets
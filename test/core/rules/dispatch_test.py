@@ -0,0 +1,133 @@
+"""Tests for the multi-rule dispatcher."""
+
+import pytest
+
+from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.rules import BaseRule, LintResult
+from sqlfluff.core.rules.crawlers import BaseCrawler, ParentOfSegmentCrawler
+from sqlfluff.core.rules.dispatch import MultiRuleDispatcher
+
+
+class Rule_T100(BaseRule):
+    """A rule which flags the parents of numeric literals."""
+
+    groups = ("all",)
+    crawl_behaviour = ParentOfSegmentCrawler({"numeric_literal"})
+
+    def _eval(self, context):
+        return LintResult(anchor=context.segment, description=context.segment.raw)
+
+
+class Rule_T101(BaseRule):
+    """A rule which breaks on the second numeric literal it finds."""
+
+    groups = ("all",)
+    crawl_behaviour = ParentOfSegmentCrawler({"numeric_literal"})
+
+    def _eval(self, context):
+        if context.memory.get("seen"):
+            raise ValueError("Something went wrong!")
+        return LintResult(anchor=context.segment, memory={"seen": True})
+
+
+class _CustomCrawler(BaseCrawler):
+    """A crawler which isn't known to the dispatcher."""
+
+    def crawl(self, context):
+        yield context
+
+
+class Rule_T102(BaseRule):
+    """A rule with a custom crawler."""
+
+    groups = ("all",)
+    crawl_behaviour = _CustomCrawler()
+
+    def _eval(self, context):
+        return LintResult(anchor=context.segment, description="custom")
+
+
+class Rule_T103(BaseRule):
+    """A rule with a standard crawler, which overrides `crawl()`."""
+
+    groups = ("all",)
+    crawl_behaviour = ParentOfSegmentCrawler({"numeric_literal"})
+
+    def _eval(self, context):
+        return LintResult(anchor=context.segment, description="eval")
+
+    def crawl(self, tree, *args, **kwargs):
+        vs, _, _, _ = super().crawl(tree, *args, **kwargs)
+        return vs[:1], None, [], None
+
+
+def _violation_tuples(violations):
+    return [
+        (v.rule_code(), v.line_no, v.line_pos, v.desc(), len(v.fixes))
+        for v in violations
+    ]
+
+
+@pytest.mark.parametrize(
+    "fname",
+    [
+        "test/fixtures/linter/comma_errors.sql",
+        "test/fixtures/linter/indentation_errors.sql",
+        "test/fixtures/linter/operator_errors_ignore.sql",
+        "test/fixtures/linter/parse_error.sql",
+        "test/fixtures/linter/heavy_templating.sql",
+    ],
+)
+def test__rules__dispatcher_matches_crawl(fname):
+    """Check the dispatcher gives the same results as crawling each rule."""
+    linter = Linter(
+        config=FluffConfig(overrides={"dialect": "ansi"}),
+        user_rules=[Rule_T100, Rule_T101, Rule_T102, Rule_T103],
+    )
+    with open(fname) as f:
+        parsed = linter.parse_string(f.read(), fname=fname)
+    rule_pack = linter.get_rulepack()
+    kwargs = dict(
+        dialect=parsed.config.get("dialect_obj"),
+        templated_file=parsed.parsed_variants[0].templated_file,
+        ignore_mask=None,
+        fname=fname,
+        config=parsed.config,
+    )
+    results = MultiRuleDispatcher(rule_pack.rules).crawl(parsed.tree, **kwargs)
+    assert [rule.code for rule, _, _ in results] == list(rule_pack.codes())
+    for rule, violations, _ in results:
+        expected, _, _, _ = rule.crawl(parsed.tree, fix=False, **kwargs)
+        assert _violation_tuples(violations) == _violation_tuples(expected)
+
+
+def test__rules__dispatcher_exception():
+    """Check a rule which throws an exception stops, but the others don't."""
+    linter = Linter(
+        config=FluffConfig(overrides={"dialect": "ansi", "rules": "T100,T101"}),
+        user_rules=[Rule_T100, Rule_T101],
+    )
+    result = linter.lint_string("SELECT 1 + 2, 3 + 4, 5 + 6\n")
+    violations = _violation_tuples(result.get_violations())
+    assert [v[0] for v in violations if v[0] == "T100"] == ["T100"] * 3
+    assert [v[0] for v in violations if v[0] == "T101"] == ["T101"] * 2
+    assert any(v[3].startswith("Unexpected exception") for v in violations)
+
+
+def test__rules__dispatcher_is_dispatchable():
+    """Check which crawlers can be evaluated in the shared walk."""
+    assert MultiRuleDispatcher.is_dispatchable(Rule_T100(code="T100", description=""))
+    assert not MultiRuleDispatcher.is_dispatchable(
+        Rule_T102(code="T102", description="")
+    )
+    # Rules which override crawl() are crawled separately, so the override
+    # is still used.
+    assert not MultiRuleDispatcher.is_dispatchable(
+        Rule_T103(code="T103", description="")
+    )
+    linter = Linter(
+        config=FluffConfig(overrides={"dialect": "ansi", "rules": "T103"}),
+        user_rules=[Rule_T103],
+    )
+    result = linter.lint_string("SELECT 1 + 2, 3 + 4\n")
+    assert len(result.get_violations()) == 1
@@ -109,6 +109,33 @@ class Rule_T003(BaseRule):
         )
 
 
+class Rule_T004(BaseRule):
+    """A rule which defers building its fixes.
+
+    **Anti-pattern**
+
+    Blah blah
+    """
+
+    groups = ("all",)
+    crawl_behaviour = SegmentSeekerCrawler({"whitespace"})
+    is_fix_compatible = True
+    # How many times fixes have been built.
+    built = 0
+
+    def _eval(self, context):
+        """Long whitespace becomes single spaces."""
+        segment = context.segment
+        if segment.raw == " ":
+            return None
+
+        def _build_fixes():
+            Rule_T004.built += 1
+            return [LintFix.replace(segment, [WhitespaceSegment(" ")])]
+
+        return LintResult(anchor=segment, fix_factory=_build_fixes)
+
+
 def test__rules__user_rules():
     """Test that can safely add user rules."""
     # Set up a linter with the user rule
@@ -229,6 +256,25 @@ def test__rules__result_unparsable():
     assert res.tree.raw == raw_sql
 
 
+def test__rules__deferred_fixes():
+    """Test that deferred fixes are only built when they're needed."""
+    linter = Linter(user_rules=[Rule_T004], dialect="ansi", rules=["T004"])
+    Rule_T004.built = 0
+    # Linting finds the issues, and knows they're fixable, without fixes.
+    res = linter.lint_string("SELECT  1,   2")
+    assert res.check_tuples() == [("T004", 1, 7), ("T004", 1, 11)]
+    assert all(v.fixable for v in res.violations)
+    assert res.num_violations(fixable=True) == 2
+    assert Rule_T004.built == 0
+    # Serialising them needs the fixes, so they're built then (once).
+    assert all(v.to_dict()["fixes"] for v in res.violations)
+    assert all(v.to_dict()["fixes"] for v in res.violations)
+    assert Rule_T004.built == 2
+    # In fix mode they're built straight away, and applied.
+    res = linter.lint_string("SELECT  1,   2", fix=True)
+    assert res.fix_string()[0] == "SELECT 1, 2"
+
+
 @pytest.mark.parametrize(
     "sql_query, check_tuples",
     [
@@ -84,3 +84,16 @@ def test__rules__std_AL04_complex():
     assert result_filter[0]["start_line_no"] == 6
     assert result_filter[1]["start_line_no"] == 8
     assert result_filter[2]["start_line_no"] == 9
+
+
+def test__rules__std_AL04_shared_select_info():
+    """Verify that AL04 doesn't change the select info shared with other rules."""
+    sql = """
+        SELECT a.pk
+        FROM table_1 AS a
+        WHERE a.pk IN (SELECT b.pk FROM table_2 AS b)
+    """
+    # AL04 includes the aliases of the outer query when checking the
+    # subquery, but AL05 shouldn't then think they're unused in it.
+    assert sqlfluff.lint(sql, rules=["AL05"]) == []
+    assert sqlfluff.lint(sql, rules=["AL04", "AL05"]) == []
@@ -309,3 +309,22 @@ join (
         "ctes": {"D": {"selectables": ["select x, z from b"]}},
         "query_type": "WithCompound",
     }
+
+
+def test_select_crawler_shares_analysis():
+    """Test that queries on the same segments share their analysis."""
+    sql = "with cte as (select a from b) select cte.a from cte join c using (a)"
+    linter = Linter(dialect="ansi")
+    tree = linter.parse_string(sql).tree
+    query = Query.from_root(tree, linter.dialect)
+    other_query = Query.from_root(tree, linter.dialect)
+
+    assert other_query is not query
+    select_info = query.selectables[0].select_info
+    assert select_info
+    assert other_query.selectables[0].select_info is select_info
+    # The queries themselves aren't shared, so popping CTEs from one
+    # doesn't affect the other.
+    assert query.lookup_cte("cte", pop=True)
+    assert not query.lookup_cte("cte", pop=False)
+    assert other_query.lookup_cte("cte", pop=False)
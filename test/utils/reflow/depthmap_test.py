@@ -105,3 +105,22 @@ def test_reflow_depthmap_order_by(default_config):
     # NOTE: Even though idx 7 is not the end, the _type_ of this location
     # is still an "end" because the following elements are non-code.
     assert desc_stack_pos == StackPosition(idx=7, len=9, type="end")
+
+
+def test_reflow_depthmap_copy(default_config):
+    """Test that copies of a depth map can be edited independently."""
+    sql = "SELECT 1"
+    root = parse_ansi_string(sql, default_config)
+    dm = DepthMap.from_parent(root)
+    select_keyword, *_, literal, _ = root.raw_segments
+
+    # A full copy.
+    dm_copy = dm.copy()
+    assert dm_copy.depth_info == dm.depth_info
+    dm_copy.copy_depth_info(literal, select_keyword)
+    assert dm_copy.depth_info != dm.depth_info
+    assert dm.get_depth_info(select_keyword).stack_depth == 4
+
+    # A partial copy.
+    dm_partial = dm.copy([literal])
+    assert dm_partial.depth_info == {literal.uuid: dm.get_depth_info(literal)}
@@ -218,6 +218,28 @@ def test_reflow_sequence_from_around_target_non_raw(default_config, caplog):
     )
 
 
+def test_reflow_sequence_from_root_shared(default_config):
+    """Test that sequences from the same root share their elements."""
+    sql = "SELECT 1"
+    root = parse_ansi_string(sql, default_config)
+    seq_a = ReflowSequence.from_root(root, config=default_config)
+    seq_b = ReflowSequence.from_root(root, config=default_config)
+
+    # The elements are the same, but in different lists.
+    assert seq_a.elements == seq_b.elements
+    assert seq_a.elements is not seq_b.elements
+    assert all(a is b for a, b in zip(seq_a.elements, seq_b.elements))
+    # Each has its own depth map, so that edits don't affect the other.
+    assert seq_a.depth_map is not seq_b.depth_map
+    assert seq_a.depth_map.depth_info == seq_b.depth_map.depth_info
+    # Sequences around targets take their depth info from the same place.
+    literal = next(root.recursive_crawl("numeric_literal"))
+    seq_c = ReflowSequence.from_around_target(literal, root, config=default_config)
+    assert seq_c.depth_map.get_depth_info(literal) is seq_a.depth_map.get_depth_info(
+        literal
+    )
+
+
 @pytest.mark.parametrize(
     "raw_sql,filter,delete_indices,edit_indices",
     [